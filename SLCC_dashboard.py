@@ -1,148 +1,303 @@
+import time
+
 import streamlit as st
 import pandas as pd
-import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+from slcc import charts, diagnostics, disclosure, model, quality_history, queries, sql, storage, topn, worker
+from slcc.anomalies import ANOMALY_FLAGS, ROBUST_Z_THRESHOLD
+from slcc.coretable import CoreTable
+from slcc.drilldown import APPLICATION_COLUMNS, RECORD_FLAGS, StudentIndex
+from slcc.equity import EQUITY_DIMENSIONS, rollup
+from slcc.flows import sankey_links
+from slcc.memo import SectionMemo
+from slcc.pipeline import build_aggregates, load_extracts, prepare, term_sort_key
+from slcc.schema import SchemaError
+from slcc.shared import enable_copy_on_write
+from slcc.watcher import SourceWatcher
+
+run_started = time.perf_counter()
 
 # Page config
 st.set_page_config(
-    page_title="SLCC 2021 Graduation Dashboard",
+    page_title="SLCC Graduation Dashboard",
     layout="wide"
 )
 
 # Load data
+# The full dataset comes from the worker's on-disk cache (artifacts/),
+# which the notebooks, API and reports share; it is built there first when
+# the current sources have no cached version. When the source can filter
+# by term (a term store or SQL database, see slcc.storage) and nothing is
+# published, a single selected term is prepared in-process instead. The
+# result is held once per server and shared read-only by every session
+# (pandas copy-on-write keeps any session-local modification from
+# reaching it).
+enable_copy_on_write()
+
+
+# Every cached loader takes the source version, so a new extract gets fresh
+# cache entries while sessions already running keep the previous ones.
+# Loaders for the full dataset (terms=None) read the published version
+# frame by frame; a term selection is prepared in-process by load_data.
+@st.cache_resource(max_entries=8)
+def load_data(terms, version=None):
+    return prepare(*load_extracts(terms))
+
+
+# The prepare frames shown as they are. dashboard_data is left out: it is
+# read as the core table, so the full dataset never decodes it to pandas
+TABLE_NAMES = [name for name in worker.PREPARED_NAMES if name != 'dashboard_data']
+
+
+@st.cache_resource(max_entries=8)
+def load_tables(terms=None, version=None):
+    if terms is None:
+        return worker.load_prepared(version, names=TABLE_NAMES)
+    prepared = dict(zip(worker.PREPARED_NAMES, load_data(terms, version)))
+    return tuple(prepared[name] for name in TABLE_NAMES)
+
+
+# dashboard_data as a compact core table (slcc.coretable): memory-mapped
+# from the published version, so server processes share one copy, and
+# decoded to pandas per section only for the columns that section uses
+@st.cache_resource(max_entries=8)
+def load_core_table(terms=None, version=None):
+    if terms is None:
+        version = worker.ensure_version(version)
+        core = worker.read_core(version)
+        if core is not None:
+            return core
+        return CoreTable.from_frame(worker.read_prepared(version, names=['dashboard_data'])[0])
+    return CoreTable.from_frame(load_data(terms, version)[2])
+
+
+# Precomputed aggregates, cached alongside the loaded data
+@st.cache_data(max_entries=8)
+def load_aggregates(terms=None, version=None):
+    if terms is None:
+        return worker.read_aggregates(worker.ensure_version(version))
+    return build_aggregates(load_data(terms, version))
+
+
+# One query engine per loaded term selection, shared by all sessions; the
+# published tables go from Parquet to DuckDB without a pandas copy
+@st.cache_resource(max_entries=8)
+def load_query_engine(terms=None, version=None):
+    if terms is None:
+        version = worker.ensure_version(version)
+        return sql.connect({name: worker.prepared_path(version, name) for name in sql.PREPARED_TABLES})
+    return sql.connect_prepared(load_data(terms, version))
+
+
+# Keyed student index, built once and shared by all sessions
+@st.cache_resource(max_entries=8)
+def load_student_index(terms=None, version=None):
+    core = load_core_table(terms, version)
+    columns = ['STUDENT_ID', *APPLICATION_COLUMNS, *RECORD_FLAGS]
+    return StudentIndex(core.view()[[column for column in columns if column in core.columns]], load_tables(terms, version)[0])
+
+
+# Graduation model scores for every application, one batch per source
+# version and saved model; None until a model has been trained
+@st.cache_resource(max_entries=4)
+def load_risk_scores(terms=None, version=None, model_stamp=None):
+    graduation_model = model.load()
+    if graduation_model is None:
+        return None
+    core = load_core_table(terms, version)
+    columns = model.NUMERIC_FEATURES + model.CATEGORICAL_FEATURES
+    return model.score(graduation_model, core.view()[[column for column in columns if column in core.columns]])
+
+
+# Per-term counts for year-over-year comparisons
+@st.cache_data(max_entries=2)
+def load_term_summary(version=None):
+    if storage.default_source().filters_terms:
+        return storage.default_source().term_summary()
+    return load_aggregates(None, version)['term_summary']
+
+
+@st.cache_data(max_entries=2)
+def available_terms(version=None):
+    if storage.default_source().filters_terms:
+        return storage.default_source().list_terms()
+    semesters = load_core_table(None, version).view().counts('SEMESTER')
+    return sorted(semesters.index[semesters > 0], key=term_sort_key)
+
+
+def warm_caches(version):
+    """Build a new source version's cache entries before it is published."""
+    load_tables(None, version)
+    load_core_table(None, version)
+    load_aggregates(None, version)
+    load_query_engine(None, version)
+    load_student_index(None, version)
+    load_term_summary(version)
+    available_terms(version)
+
+
+# Watches the extracts (or the term store) and rebuilds in the background
+@st.cache_resource
+def source_watcher():
+    return SourceWatcher(worker.source_paths(), rebuild=warm_caches).start()
+
+
+# Computed sections, shared by every session on the server (slcc.memo)
+@st.cache_resource
+def load_section_memo():
+    return SectionMemo()
+
+
+# Import time per package in a fresh interpreter, profiled once per server
 @st.cache_data
-def load_data():
-    students = pd.read_csv('Students.csv')
-    graduation = pd.read_csv('Graduations.csv')
-    
-    # Date conversions
-    graduation['GRADUATION_DATE'] = pd.to_datetime(graduation['GRADUATION_DATE'])
-    graduation['GRAD_APPL_DATE'] = pd.to_datetime(graduation['GRAD_APPL_DATE'])
-    
-    # Merge data
-    dashboard_data = graduation.merge(students, on="STUDENT_ID", how='left')
-    
-    # Create quality columns
-    dashboard_data['ILLOGICAL_DATES'] = dashboard_data['GRAD_APPL_DATE'] > dashboard_data['GRADUATION_DATE']
-    dashboard_data['BELOW_CREDITS'] = dashboard_data['TOTAL_CREDITS'] < dashboard_data['REQUIRED_HOURS']
-    dashboard_data['MISSING_STUDENT_INFO'] = dashboard_data['STUDENT_ID'].isnull()
-    dashboard_data['UNKNOWN_DEPARTMENT'] = dashboard_data['DEPARTMENT'] == 'Unknown'
-    dashboard_data['UNKNOWN_COLLEGE'] = dashboard_data['COLLEGE'] == 'Unknown'
-    dashboard_data['HAS_UNKNOWN_VALUES'] = dashboard_data['UNKNOWN_DEPARTMENT'] | dashboard_data['UNKNOWN_COLLEGE']
-    
-    # Check for duplicates and unmatched students
-    grad_duplicates = graduation[graduation.duplicated(keep=False)]
-    grad_duplicate_student_ids = graduation[graduation['STUDENT_ID'].duplicated(keep=False)]
-    student_duplicates = students[students.duplicated(keep=False)]
-    student_duplicate_ids = students[students['STUDENT_ID'].duplicated(keep=False)]
-    
-    # Find students in graduation table but not in students table
-    unmatched_students = graduation[~graduation['STUDENT_ID'].isin(students['STUDENT_ID'])]
-    
-    # Add semester
-    dashboard_data['SEMESTER'] = dashboard_data['GRADUATION_DATE'].dt.month.apply(
-        lambda x: 'Spring 2021' if x == 5 else 'Summer 2021' if x == 8 else 'Other'
-    )
-    
-    return students, graduation, dashboard_data, grad_duplicates, grad_duplicate_student_ids, student_duplicates, student_duplicate_ids, unmatched_students
+def startup_profile():
+    return diagnostics.package_totals(diagnostics.import_profile(diagnostics.entry_point_imports('dashboard')))
 
 
-students, graduation, dashboard_data, grad_duplicates, grad_duplicate_student_ids, student_duplicates, student_duplicate_ids, unmatched_students = load_data()
+def prior_year_term(term):
+    season, _, year = term.partition(' ')
+    return f"{season} {int(year) - 1}" if year.isdigit() else None
 
-# Title
-st.title("Spring/Summer 2021 Graduation Overview")
-st.markdown("---")
 
 # Sidebar filters
 st.sidebar.header("Filters")
 
 # Semester filter
-semesters = ['All'] + list(dashboard_data['SEMESTER'].dropna().unique())
+# A published worker version needs no watcher: CURRENT is re-read every run
+source_version = worker.current_version() or source_watcher().version
+
+try:
+    semesters = ['All'] + list(available_terms(source_version))
+except SchemaError as e:
+    st.error(f"The source extracts changed shape and were not loaded.\n\n{e}")
+    st.stop()
 selected_semester = st.sidebar.selectbox("Select Semester", semesters)
+top_count = st.sidebar.slider(
+    "Items in ranked charts", min_value=5, max_value=30, value=topn.DEFAULT_N,
+    help="Values past this are grouped as 'Other'"
+)
 
-# Filter data
-filtered_data = dashboard_data.copy()
+# A term store or SQL source reads just the selected term; 'All' (and the
+# CSV extracts, which cannot be filtered) use the published full version
+selected_terms = None
+if selected_semester != 'All' and storage.default_source().filters_terms:
+    selected_terms = (selected_semester,)
+
+students, graduation, grad_duplicates, grad_duplicate_student_ids, student_duplicates, student_duplicate_ids, unmatched_students, major_mapping = load_tables(selected_terms, source_version)
+aggregates = load_aggregates(selected_terms, source_version)
+term_summary = disclosure.protect_outcomes(load_term_summary(source_version), ['SEMESTER'])
+query_engine = load_query_engine(selected_terms, source_version)
+core_table = load_core_table(selected_terms, source_version)
+
+# Title
+years = sorted({term.split(' ')[-1] for term in semesters[1:] if term.split(' ')[-1].isdigit()})
+year_span = years[0] if len(years) == 1 else f"{years[0]}-{years[-1]}" if years else ""
+st.title(f"{year_span} Graduation Overview")
+st.markdown("---")
+
+# Filter data: a row selection on the core table; columns are decoded as used
+filtered_data = core_table.view()
 if selected_semester != 'All':
-    filtered_data = filtered_data[filtered_data['SEMESTER'] == selected_semester]
+    filtered_data = core_table.select('SEMESTER', selected_semester)
+
+# Section results are shared across sessions, keyed by the full filter state
+section_memo = load_section_memo()
+filter_state = (source_version, selected_semester, top_count, disclosure.min_cell_size(), disclosure.noise_scale())
+
+
+# Key metrics, protected like the reports and the API
+overview = section_memo.get('overview', filter_state, lambda: queries.overview(query_engine, selected_semester).iloc[0])
+total_apps = overview['applications']
+
+
+def outcome_share(count):
+    if pd.isna(count) or pd.isna(total_apps) or total_apps == 0:
+        return disclosure.WITHHELD, None
+    return f"{count / total_apps * 100:.2f}%", f"{count:,} students"
 
 
-# Key metrics
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    total_apps = len(filtered_data)
-    st.metric("Total Applications", f"{total_apps:,}")
+    st.metric("Total Applications", disclosure.format_count(total_apps))
 
 with col2:
-    graduated_count = filtered_data[filtered_data['GRADUATED_IND'] == 'Y'].shape[0]
-    graduated_pct = (graduated_count / total_apps * 100)
-    st.metric("Graduated", f"{graduated_pct:.2f}%", help=f"{graduated_count:,} students")
+    graduated_pct, graduated_help = outcome_share(overview['graduated'])
+    st.metric("Graduated", graduated_pct, help=graduated_help)
 
 with col3:
-    not_graduated_count = filtered_data[filtered_data['GRADUATED_IND'] == 'N'].shape[0]
-    not_graduated_pct = (not_graduated_count / total_apps * 100)
-    st.metric("Not Graduated", f"{not_graduated_pct:.2f}%", help=f"{not_graduated_count:,} students")
+    not_graduated_pct, not_graduated_help = outcome_share(overview['not_graduated'])
+    st.metric("Not Graduated", not_graduated_pct, help=not_graduated_help)
+
+st.markdown("---")
+
+# Year-over-year comparison
+st.subheader("Year-over-Year")
+
+if selected_semester == 'All':
+    fig = px.line(
+        term_summary,
+        x='SEMESTER',
+        y='GRAD_RATE',
+        markers=True,
+        hover_data=['APPLICATIONS', 'GRADUATED'],
+        title='Graduation Rate by Term',
+        labels={'GRAD_RATE': 'Graduation Rate', 'SEMESTER': 'Term'},
+        color_discrete_sequence=['#1f77b4']
+    )
+    fig.update_layout(yaxis_tickformat='.0%')
+    st.plotly_chart(fig, use_container_width=True)
+else:
+    prior_term = prior_year_term(selected_semester)
+    current = term_summary[term_summary['SEMESTER'] == selected_semester]
+    prior = term_summary[term_summary['SEMESTER'] == prior_term]
+    if prior_term is None or prior.empty or current.empty:
+        st.info(f"No prior-year term loaded to compare with {selected_semester}.")
+    elif current[['APPLICATIONS', 'GRAD_RATE']].isna().any(axis=None) or prior[['APPLICATIONS', 'GRAD_RATE']].isna().any(axis=None):
+        st.info(f"The {selected_semester} or {prior_term} totals are too small to show.")
+    else:
+        current, prior = current.iloc[0], prior.iloc[0]
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric(
+                f"Applications vs {prior_term}",
+                f"{current['APPLICATIONS']:,}",
+                delta=f"{current['APPLICATIONS'] - prior['APPLICATIONS']:+,}"
+            )
+        with col2:
+            st.metric(
+                f"Graduation Rate vs {prior_term}",
+                f"{current['GRAD_RATE'] * 100:.2f}%",
+                delta=f"{(current['GRAD_RATE'] - prior['GRAD_RATE']) * 100:+.2f} pts"
+            )
 
 st.markdown("---")
 
 
-# Main analytics 
+# Main analytics
 
 st.header("Graduation Analytics")
 
-# Degree Types and Top 10 Majors side by side
+# Degree Types and Top Majors side by side
 col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Degree Types")
     
-    # Prepare degree type data
-    degree_summary = filtered_data.groupby(['DEGREE_TYPE', 'GRADUATED_IND']).size().reset_index(name='count')
-    
-    # Create grouped bar chart showing degree types
-    fig = px.bar(
-        degree_summary,
-        x='DEGREE_TYPE',
-        y='count',
-        color='GRADUATED_IND',
-        barmode='group',
-        title='Applications by Degree Type and Graduation Status',
-        labels={'count': 'Number of Students', 'DEGREE_TYPE': 'Degree Type', 'GRADUATED_IND': 'Graduated'},
-        color_discrete_map={'Y': '#1f77b4', 'N': '#ff7f0e'},
-        height=400
-    )
-    fig.update_layout(
-        legend=dict(title="Graduated", orientation="h"),
-        xaxis={'categoryorder': 'total descending'}
-    )
+    # Grouped bar chart of degree types by graduation status
+    fig = section_memo.get('degrees', filter_state, lambda: charts.degree_chart(
+        queries.degree_summary(query_engine, selected_semester)
+    ))
     st.plotly_chart(fig, use_container_width=True)
 
 with col2:
-    st.subheader("Top 10 Majors")
+    st.subheader(f"Top {top_count} Majors")
     
-    # Get top 10 majors
-    top_majors = filtered_data['MAJOR'].value_counts().head(10)
-    
-    # Get graduation status breakdown for top majors
-    major_grad_data = filtered_data[filtered_data['MAJOR'].isin(top_majors.index)].groupby(['MAJOR', 'GRADUATED_IND']).size().reset_index(name='count')
-    
-    fig = px.bar(
-        major_grad_data,
-        x='count',
-        y='MAJOR',
-        color='GRADUATED_IND',
-        orientation='h',
-        title='Top 10 Majors by Graduation Status',
-        labels={'count': 'Number of Students', 'MAJOR': 'Major'},
-        color_discrete_map={'Y': '#1f77b4', 'N': '#ff7f0e'},
-        height=400
-    )
-    fig.update_layout(
-        yaxis={'categoryorder': 'total ascending'},
-        legend=dict(title="Graduated", orientation="h")
-    )
+    # Graduation status breakdown for the top majors
+    fig = section_memo.get('majors', filter_state, lambda: charts.major_chart(
+        queries.major_summary(query_engine, selected_semester, top=top_count), top=top_count
+    ))
     st.plotly_chart(fig, use_container_width=True)
 
 st.markdown("---")
@@ -152,107 +307,252 @@ st.subheader("Semester Distribution")
 
 col1, col2 = st.columns([2, 1])
 
+def semester_section():
+    semester_counts = disclosure.protect_counts(filtered_data.counts('SEMESTER')).sort_values(ascending=False)
+    table = pd.DataFrame({
+        'Semester': semester_counts.index,
+        'Total': semester_counts.values,
+        '% of Total': (semester_counts.values / semester_counts.sum() * 100).round(1)
+    })
+    return charts.semester_chart(queries.semester_summary(query_engine, selected_semester)), table
+
+
+semester_fig, semester_table = section_memo.get('semesters', filter_state, semester_section)
+
 with col1:
-    semester_grad = filtered_data.groupby(['SEMESTER', 'GRADUATED_IND']).size().reset_index(name='count')
-    
-    fig = px.bar(
-        semester_grad,
-        x='SEMESTER',
-        y='count',
-        color='GRADUATED_IND',
-        title='Applications by Semester and Graduation Status',
-        labels={'count': 'Number of Students', 'SEMESTER': 'Semester'},
-        color_discrete_map={'Y': '#1f77b4', 'N': '#ff7f0e'},
-        barmode='group'
-    )
-    fig.update_layout(legend=dict(title="Graduated"))
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(semester_fig, use_container_width=True)
 
 with col2:
-    semester_counts = filtered_data['SEMESTER'].value_counts()
-    st.dataframe(
-        pd.DataFrame({
-            'Semester': semester_counts.index,
-            'Total': semester_counts.values,
-            '% of Total': (semester_counts.values / semester_counts.sum() * 100).round(1)
-        }),
-        use_container_width=True,
-        height=250
-    )
+    st.dataframe(semester_table, use_container_width=True, height=250)
 
 st.markdown("---")
 
 # Department and College Overview
 st.subheader("Departments & Colleges")
 
+
+
+def ranked_section(column, label):
+    counts = topn.top_n(disclosure.protect_counts(filtered_data.counts(column)), top_count)
+    return charts.ranked_chart(counts, f'Top {top_count} {label}s', label)
+
+
+def show_chart(fig):
+    if fig is None:
+        st.info(disclosure.SUPPRESSED_NOTE)
+    else:
+        st.plotly_chart(fig, use_container_width=True)
+
+
 col1, col2 = st.columns(2)
 
 with col1:
     # Top departments
-    dept_counts = filtered_data['DEPARTMENT'].value_counts().head(10)
-    
-    fig = px.bar(
-        x=dept_counts.values,
-        y=dept_counts.index,
-        orientation='h',
-        title='Top 10 Departments',
-        labels={'x': 'Number of Students', 'y': 'Department'},
-        color_discrete_sequence=['#1f77b4']
-    )
-    fig.update_layout(showlegend=False, height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(section_memo.get('departments', filter_state, lambda: ranked_section('DEPARTMENT', 'Department')))
 
 with col2:
     # Top colleges
-    college_counts = filtered_data['COLLEGE'].value_counts().head(10)
-    
-    fig = px.bar(
-        x=college_counts.values,
-        y=college_counts.index,
-        orientation='h',
-        title='Top 10 Colleges',
-        labels={'x': 'Number of Students', 'y': 'College'},
-        color_discrete_sequence=['#1f77b4']
-    )
-    fig.update_layout(showlegend=False, height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(section_memo.get('colleges', filter_state, lambda: ranked_section('COLLEGE', 'College')))
+
+st.markdown("---")
+
+# Flow from college through department and degree type to outcome,
+# drawn from the precomputed transition counts
+st.subheader("Application Flow")
+
+flow_top = st.slider("Values shown per stage", min_value=3, max_value=25, value=8, help="The rest are grouped as 'Other'")
+
+
+def flow_section():
+    flow_nodes, flow_links = sankey_links(aggregates['transitions'], selected_semester, top=flow_top)
+    flow_links = disclosure.protect(flow_links, ['SOURCE', 'TARGET'], ['COUNT']).dropna(subset=['COUNT'])
+    return charts.sankey_chart(flow_nodes, flow_links, 'College → Department → Degree Type → Outcome')
+
+
+fig = section_memo.get('flow', (*filter_state, flow_top), flow_section)
+st.plotly_chart(fig, use_container_width=True)
 
 st.markdown("---")
 
-# GPA and Credits 
+# GPA and Credits
 st.subheader("Academic Performance")
 
+
+def distribution_section(column, title, label):
+    return charts.distribution_chart(queries.distribution(query_engine, column, selected_semester), title, label)
+
+
+def average(value, places):
+    return disclosure.WITHHELD if pd.isna(value) else f"{value:.{places}f}"
+
+
 col1, col2 = st.columns(2)
 
 with col1:
-    fig = px.histogram(
-        filtered_data,
-        x='OVERALL_GPA',
-        nbins=30,
-        title='GPA Distribution',
-        labels={'OVERALL_GPA': 'Overall GPA', 'count': 'Number of Students'},
+    show_chart(section_memo.get('gpa', filter_state, lambda: distribution_section(
+        'OVERALL_GPA', 'GPA Distribution', 'Overall GPA'
+    )))
+    st.metric("Average GPA", average(overview['avg_gpa'], 2))
+
+with col2:
+    show_chart(section_memo.get('credits', filter_state, lambda: distribution_section(
+        'TOTAL_CREDITS', 'Total Credits Distribution', 'Total Credits'
+    )))
+    st.metric("Average Credits", average(overview['avg_credits'], 1))
+
+st.markdown("---")
+
+# Equity breakdown
+st.header("Equity Analysis")
+
+equity_dimension = st.selectbox(
+    "Break down by",
+    list(EQUITY_DIMENSIONS),
+    format_func=EQUITY_DIMENSIONS.get
+)
+equity_label = EQUITY_DIMENSIONS[equity_dimension]
+
+
+def equity_section():
+    equity_sums_for_dim = aggregates['equity'][equity_dimension]
+    equity_table = disclosure.protect_outcomes(
+        rollup(equity_sums_for_dim['overall'], [equity_dimension], selected_semester), [equity_dimension]
+    )
+    rate_fig = px.bar(
+        equity_table,
+        x=equity_dimension,
+        y='GRAD_RATE',
+        error_y=equity_table['CI_HIGH'] - equity_table['GRAD_RATE'],
+        error_y_minus=equity_table['GRAD_RATE'] - equity_table['CI_LOW'],
+        title=f'Graduation Rate by {equity_label} (95% Wilson CI)',
+        labels={'GRAD_RATE': 'Graduation Rate', equity_dimension: equity_label},
         color_discrete_sequence=['#1f77b4']
     )
-    fig.update_layout(showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
-    
-    avg_gpa = filtered_data['OVERALL_GPA'].mean()
-    st.metric("Average GPA", f"{avg_gpa:.2f}")
+    rate_fig.update_layout(yaxis_tickformat='.0%', showlegend=False)
+    equity_display = pd.DataFrame({
+        equity_label: equity_table[equity_dimension],
+        'Applications': equity_table['APPLICATIONS'],
+        'Grad %': (equity_table['GRAD_RATE'] * 100).round(1),
+        '95% CI': [
+            f"{low:.1%} - {high:.1%}" if pd.notna(low) else disclosure.WITHHELD
+            for low, high in zip(equity_table['CI_LOW'], equity_table['CI_HIGH'])
+        ],
+        'Mean GPA': equity_table['MEAN_GPA'].round(2),
+        'Credit Excess': equity_table['MEAN_CREDIT_EXCESS'].round(1)
+    })
+
+    college_equity = disclosure.protect_outcomes(
+        rollup(equity_sums_for_dim['by_college'], [equity_dimension, 'COLLEGE'], selected_semester),
+        [equity_dimension, 'COLLEGE']
+    )
+    college_fig = px.density_heatmap(
+        college_equity,
+        x=equity_dimension,
+        y='COLLEGE',
+        z='GRAD_RATE',
+        histfunc='avg',
+        title=f'Graduation Rate by {equity_label} and College',
+        labels={'GRAD_RATE': 'Graduation Rate', equity_dimension: equity_label, 'COLLEGE': 'College'},
+        color_continuous_scale='Blues'
+    )
+    return rate_fig, equity_display, college_fig, college_equity.round(3)
+
+
+rate_fig, equity_display, college_fig, college_equity = section_memo.get(
+    'equity', (*filter_state, equity_dimension), equity_section
+)
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.plotly_chart(rate_fig, use_container_width=True)
 
 with col2:
-    fig = px.histogram(
-        filtered_data,
-        x='TOTAL_CREDITS',
-        nbins=30,
-        title='Total Credits Distribution',
-        labels={'TOTAL_CREDITS': 'Total Credits', 'count': 'Number of Students'},
-        color_discrete_sequence=['#1f77b4']
+    st.dataframe(equity_display, use_container_width=True, hide_index=True)
+    st.download_button(
+        label="Download Table",
+        data=equity_display.to_csv(index=False),
+        file_name=f"graduation_by_{equity_dimension.lower()}.csv",
+        mime="text/csv"
     )
-    fig.update_layout(showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
-    
-    avg_credits = filtered_data['TOTAL_CREDITS'].mean()
-    st.metric("Average Credits", f"{avg_credits:.1f}")
+
+with st.expander(f"{equity_label} by College"):
+    st.plotly_chart(college_fig, use_container_width=True)
+    st.dataframe(college_equity, use_container_width=True, hide_index=True)
+
+st.markdown("---")
+
+# Predicted graduation outcomes
+st.header("Graduation Risk")
+
+model_stamp = model.model_stamp()
+risk_scores = load_risk_scores(selected_terms, source_version, model_stamp)
+
+
+def risk_section():
+    scored = filtered_data[
+        ['STUDENT_ID', 'SEMESTER', 'MAJOR', 'DEPARTMENT', 'TOTAL_CREDITS', 'REQUIRED_HOURS', 'OVERALL_GPA', 'GRADUATED_IND']
+    ].join(risk_scores)
+    pending_mask = model.pending(scored)
+    if pending_mask.any():
+        scored = scored[pending_mask]
+
+    dept_risk = scored.groupby('DEPARTMENT').agg(
+        APPLICATIONS=('AT_RISK', 'size'),
+        AT_RISK=('AT_RISK', 'sum'),
+        MEAN_PROBABILITY=('GRAD_PROBABILITY', 'mean')
+    )
+    dept_risk['AT_RISK_RATE'] = dept_risk['AT_RISK'] / dept_risk['APPLICATIONS']
+    dept_risk = disclosure.protect(
+        dept_risk.reset_index(), ['DEPARTMENT'], ['APPLICATIONS', 'AT_RISK'],
+        {'AT_RISK_RATE': ['APPLICATIONS', 'AT_RISK'], 'MEAN_PROBABILITY': ['APPLICATIONS']}
+    ).set_index('DEPARTMENT')
+    dept_risk = dept_risk.loc[topn.top_labels(dept_risk['AT_RISK'], top_count)].reset_index()
+    fig = px.bar(
+        dept_risk,
+        x='AT_RISK',
+        y='DEPARTMENT',
+        orientation='h',
+        title=f'At-Risk Applications by Department (Top {top_count})',
+        labels={'AT_RISK': 'At-Risk Applications', 'DEPARTMENT': 'Department'},
+        hover_data={'APPLICATIONS': True, 'AT_RISK_RATE': ':.1%'},
+        color_discrete_sequence=['#ff7f0e']
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, height=500)
+    at_risk = scored[scored['AT_RISK']][
+        ['STUDENT_ID', 'SEMESTER', 'MAJOR', 'DEPARTMENT', 'TOTAL_CREDITS', 'REQUIRED_HOURS', 'OVERALL_GPA', 'GRAD_PROBABILITY']
+    ].sort_values('GRAD_PROBABILITY')
+    return bool(pending_mask.any()), len(scored), fig, at_risk, scored['GRAD_PROBABILITY'].mean()
+
+
+if risk_scores is None:
+    st.info("No graduation model has been trained yet. Train one with `python -m slcc.model train`.")
+else:
+    has_pending, scored_count, fig, at_risk, mean_probability = section_memo.get(
+        'risk', (*filter_state, model_stamp), risk_section
+    )
+    if has_pending:
+        st.caption(f"{scored_count:,} applications without a recorded outcome, scored by the saved model.")
+    else:
+        st.caption(
+            "This extract has no applications awaiting an outcome, so every application is shown with the "
+            "probability the saved model gives it."
+        )
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        st.metric(
+            "At-Risk Applications",
+            f"{len(at_risk):,}",
+            help=f"Predicted graduation probability below {model.RISK_THRESHOLD:.0%}"
+        )
+        st.metric("Mean Predicted Probability", f"{mean_probability:.1%}")
+        with st.expander("View At-Risk Applications"):
+            st.dataframe(at_risk, use_container_width=True)
 
 st.markdown("---")
 
@@ -261,11 +561,20 @@ st.markdown("---")
 
 st.header("Data Quality Issues")
 
-# Issues summary metrics 
+# Issues summary metrics
+
+
+def flagged_records(flag, columns):
+    records = filtered_data.where(flag)
+    return len(records), records[columns]
+
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    illogical_count = filtered_data['ILLOGICAL_DATES'].sum()
+    illogical_count, illogical_records = section_memo.get('illogical_dates', filter_state, lambda: flagged_records(
+        'ILLOGICAL_DATES', ['STUDENT_ID', 'GRAD_APPL_DATE', 'GRADUATION_DATE']
+    ))
     st.metric(
         "Illogical Dates",
         int(illogical_count),
@@ -273,15 +582,12 @@ with col1:
     )
     if illogical_count > 0:
         with st.expander("View Records"):
-            st.dataframe(
-                filtered_data[filtered_data['ILLOGICAL_DATES'] == True][
-                    ['STUDENT_ID', 'GRAD_APPL_DATE', 'GRADUATION_DATE']
-                ],
-                use_container_width=True
-            )
+            st.dataframe(illogical_records, use_container_width=True)
 
 with col2:
-    below_credits_count = filtered_data['BELOW_CREDITS'].sum()
+    below_credits_count, below_credits_records = section_memo.get('below_credits', filter_state, lambda: flagged_records(
+        'BELOW_CREDITS', ['STUDENT_ID', 'TOTAL_CREDITS', 'REQUIRED_HOURS', 'GRADUATED_IND']
+    ))
     st.metric(
         "Below Required Credits",
         int(below_credits_count),
@@ -289,15 +595,12 @@ with col2:
     )
     if below_credits_count > 0:
         with st.expander("View Records"):
-            st.dataframe(
-                filtered_data[filtered_data['BELOW_CREDITS'] == True][
-                    ['STUDENT_ID', 'TOTAL_CREDITS', 'REQUIRED_HOURS', 'GRADUATED_IND']
-                ],
-                use_container_width=True
-            )
+            st.dataframe(below_credits_records, use_container_width=True)
 
 with col3:
-    missing_count = filtered_data['MISSING_STUDENT_INFO'].sum()
+    missing_count, missing_records = section_memo.get('missing_student_info', filter_state, lambda: flagged_records(
+        'MISSING_STUDENT_INFO', ['STUDENT_ID', 'GRADUATION_DATE']
+    ))
     st.metric(
         "Missing Student Info",
         int(missing_count),
@@ -305,15 +608,12 @@ with col3:
     )
     if missing_count > 0:
         with st.expander("View Records"):
-            st.dataframe(
-                filtered_data[filtered_data['MISSING_STUDENT_INFO'] == True][
-                    ['STUDENT_ID', 'GRADUATION_DATE']
-                ],
-                use_container_width=True
-            )
+            st.dataframe(missing_records, use_container_width=True)
 
 with col4:
-    unknown_count = filtered_data['HAS_UNKNOWN_VALUES'].sum()
+    unknown_count, unknown_records = section_memo.get('unknown_values', filter_state, lambda: flagged_records(
+        'HAS_UNKNOWN_VALUES', ['STUDENT_ID', 'MAJOR', 'DEPARTMENT', 'COLLEGE', 'DEPARTMENT_IMPUTED', 'COLLEGE_IMPUTED']
+    ))
     st.metric(
         "Unknown Dept/College",
         int(unknown_count),
@@ -321,12 +621,7 @@ with col4:
     )
     if unknown_count > 0:
         with st.expander("View Records"):
-            st.dataframe(
-                filtered_data[filtered_data['HAS_UNKNOWN_VALUES'] == True][
-                    ['STUDENT_ID', 'MAJOR', 'DEPARTMENT', 'COLLEGE']
-                ],
-                use_container_width=True
-            )
+            st.dataframe(unknown_records, use_container_width=True)
 
 # Issue summary metrics 2
 st.markdown("###")
@@ -371,72 +666,176 @@ with col3:
             st.write(f"**Graduation Table:** {total_grad_dup_rows} duplicate rows")
             st.write(f"**Student Table:** {total_student_dup_rows} duplicate rows")
 
+# GPA, credit and required-hours anomalies (flagged in slcc.anomalies)
+st.subheader("Numeric Anomalies")
+st.caption(
+    "GPA and credits are compared with the median of the same major; records more than "
+    f"{ROBUST_Z_THRESHOLD} robust standard deviations away are flagged."
+)
+
+anomaly_counts = section_memo.get('anomaly_counts', filter_state, lambda: {
+    flag: filtered_data.count(flag) for flag in ANOMALY_FLAGS
+})
+anomaly_cols = st.columns(len(ANOMALY_FLAGS))
+for col, (flag, label) in zip(anomaly_cols, ANOMALY_FLAGS.items()):
+    with col:
+        st.metric(label, anomaly_counts[flag])
+
+anomaly_count, anomaly_records = section_memo.get('anomalies', filter_state, lambda: flagged_records(
+    'HAS_ANOMALY',
+    ['STUDENT_ID', 'MAJOR', 'OVERALL_GPA', 'GPA_ROBUST_Z', 'TOTAL_CREDITS', 'CREDITS_ROBUST_Z', 'REQUIRED_HOURS']
+    + list(ANOMALY_FLAGS)
+))
+if anomaly_count > 0:
+    with st.expander(f"View {anomaly_count} Records"):
+        st.dataframe(anomaly_records, use_container_width=True)
+    with st.expander("Major Norms"):
+        norms = aggregates['major_norms']
+        st.dataframe(
+            norms[norms['ANOMALIES'] > 0].sort_values('ANOMALIES', ascending=False),
+            use_container_width=True,
+            hide_index=True
+        )
+
+st.markdown("---")
+
+# Quality trend across recorded pipeline runs
+st.subheader("Quality Trend Across Runs")
+
+quality_runs = quality_history.load_history()
+if len(quality_runs) == 0:
+    st.info("No pipeline runs recorded yet. Record one with `python -m slcc.quality_history`.")
+else:
+    trend = quality_runs.melt(
+        id_vars=['RUN_AT'],
+        value_vars=[rule for rule in quality_history.QUALITY_RULES if rule in quality_runs],
+        var_name='Rule',
+        value_name='Records'
+    )
+    trend['Rule'] = trend['Rule'].map(quality_history.QUALITY_RULES)
+    fig = px.line(
+        trend,
+        x='RUN_AT',
+        y='Records',
+        color='Rule',
+        markers=True,
+        title='Flagged Records per Rule by Run',
+        labels={'RUN_AT': 'Run'}
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+    if len(quality_runs) > 1:
+        previous_run, latest_run = quality_runs['RUN_ID'].iloc[-2], quality_runs['RUN_ID'].iloc[-1]
+        run_diff = quality_history.diff_runs(previous_run, latest_run)
+        run_diff['RULE'] = run_diff['RULE'].map(quality_history.QUALITY_RULES)
+        st.write(f"**Changes since the previous run** ({quality_runs['RUN_AT'].iloc[-2]:%Y-%m-%d %H:%M}):")
+        st.dataframe(
+            run_diff.rename(columns={
+                'RULE': 'Rule',
+                'NEWLY_FLAGGED': 'Newly Flagged',
+                'RESOLVED': 'Resolved',
+                'STILL_FLAGGED': 'Still Flagged'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+
 st.markdown("---")
 
 # Breakdown of unknown values
 st.subheader("Unknown Values Breakdown")
 
+
+def unknown_majors(flag):
+    records = filtered_data.where(flag)
+    majors = topn.top_n(disclosure.protect_counts(records.counts('MAJOR')), top_count, other=None)
+    return len(records), pd.DataFrame({'Major': majors.index, 'Count': majors.values})
+
+
 col1, col2 = st.columns(2)
 
 with col1:
-    unknown_dept_count = filtered_data['UNKNOWN_DEPARTMENT'].sum()
+    unknown_dept_count, unknown_dept_majors = section_memo.get(
+        'unknown_departments', filter_state, lambda: unknown_majors('UNKNOWN_DEPARTMENT')
+    )
     unknown_dept_pct = (unknown_dept_count/len(filtered_data)*100)
     
     st.metric(
         "Unknown Department",
-        int(unknown_dept_count),
+        unknown_dept_count,
         help=f"{unknown_dept_pct:.1f}% of records"
     )
     
     # Show majors with unknown departments
     if unknown_dept_count > 0:
-        unknown_dept_majors = filtered_data[filtered_data['UNKNOWN_DEPARTMENT'] == True]['MAJOR'].value_counts()
         st.write("**Top Majors with Unknown Department:**")
-        st.dataframe(
-            pd.DataFrame({
-                'Major': unknown_dept_majors.head(10).index,
-                'Count': unknown_dept_majors.head(10).values
-            }),
-            use_container_width=True
-        )
+        st.dataframe(unknown_dept_majors, use_container_width=True)
 
 with col2:
-    unknown_college_count = filtered_data['UNKNOWN_COLLEGE'].sum()
+    unknown_college_count, unknown_college_majors = section_memo.get(
+        'unknown_colleges', filter_state, lambda: unknown_majors('UNKNOWN_COLLEGE')
+    )
     unknown_college_pct = (unknown_college_count/len(filtered_data)*100)
     
     st.metric(
         "Unknown College",
-        int(unknown_college_count),
+        unknown_college_count,
         help=f"{unknown_college_pct:.1f}% of records"
     )
     
     # Show majors with unknown colleges
     if unknown_college_count > 0:
-        unknown_college_majors = filtered_data[filtered_data['UNKNOWN_COLLEGE'] == True]['MAJOR'].value_counts()
         st.write("**Top Majors with Unknown College:**")
-        st.dataframe(
-            pd.DataFrame({
-                'Major': unknown_college_majors.head(10).index,
-                'Count': unknown_college_majors.head(10).values
-            }),
-            use_container_width=True
-        )
+        st.dataframe(unknown_college_majors, use_container_width=True)
 
-# Visualization of Unknown values by Major
-if unknown_count > 0:
-    unknown_data = filtered_data[filtered_data['HAS_UNKNOWN_VALUES'] == True]
-    major_unknown_counts = unknown_data.groupby('MAJOR').size().sort_values(ascending=False).head(15)
-    
+
+def unknown_majors_chart():
+    major_unknown_counts = topn.top_n(disclosure.protect_counts(filtered_data.where('HAS_UNKNOWN_VALUES').counts('MAJOR')), top_count)
+    if major_unknown_counts.empty:
+        return None
     fig = px.bar(
         x=major_unknown_counts.values,
         y=major_unknown_counts.index,
         orientation='h',
-        title='Top 15 Majors with Unknown Department/College',
+        title=f'Top {top_count} Majors with Unknown Department/College',
         labels={'x': 'Number of Records', 'y': 'Major'},
         color_discrete_sequence=['#ff7f0e']
     )
     fig.update_layout(height=500, showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+# Visualization of Unknown values by Major
+if unknown_count > 0:
+    show_chart(section_memo.get('unknown_majors', filter_state, unknown_majors_chart))
+
+# Values recovered from MAJOR
+st.subheader("Recovered from Major")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    recovered_dept_count = filtered_data['DEPARTMENT_IMPUTED'].sum()
+    st.metric(
+        "Department Recovered",
+        int(recovered_dept_count),
+        help="Unknown departments filled from the department most often recorded for the same major"
+    )
+
+with col2:
+    recovered_college_count = filtered_data['COLLEGE_IMPUTED'].sum()
+    st.metric(
+        "College Recovered",
+        int(recovered_college_count),
+        help="Unknown colleges filled from the college most often recorded for the same major"
+    )
+
+with st.expander("View Major Mapping"):
+    st.caption("Exact matches vote over records with a known value; fuzzy matches borrow the vote of the closest known major name. Values below 50% confidence are not applied.")
+    st.dataframe(
+        major_mapping[major_mapping['DEPARTMENT'].notna() | major_mapping['COLLEGE'].notna()],
+        use_container_width=True
+    )
 
 st.markdown("---")
 
@@ -447,13 +846,7 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Graduation Dataset")
-    grad_nulls = graduation.isnull().sum()
-    grad_nulls_df = pd.DataFrame({
-        'Column': grad_nulls.index,
-        'Missing Count': grad_nulls.values,
-        'Missing %': (grad_nulls.values / len(graduation) * 100).round(2)
-    })
-    grad_nulls_df = grad_nulls_df[grad_nulls_df['Missing Count'] > 0]
+    grad_nulls_df = aggregates['profiles']['graduation']
     
     if len(grad_nulls_df) > 0:
         st.dataframe(grad_nulls_df, use_container_width=True)
@@ -462,13 +855,7 @@ with col1:
 
 with col2:
     st.subheader("Student Dataset")
-    student_nulls = students.isnull().sum()
-    student_nulls_df = pd.DataFrame({
-        'Column': student_nulls.index,
-        'Missing Count': student_nulls.values,
-        'Missing %': (student_nulls.values / len(students) * 100).round(2)
-    })
-    student_nulls_df = student_nulls_df[student_nulls_df['Missing Count'] > 0]
+    student_nulls_df = aggregates['profiles']['students']
     
     if len(student_nulls_df) > 0:
         st.dataframe(student_nulls_df, use_container_width=True)
@@ -585,22 +972,88 @@ with col2:
         )
         st.plotly_chart(fig, use_container_width=True)
 
+    # Likely keying errors: IDs one typo away from a student record
+    id_candidates = aggregates['id_candidates']
+    st.write("**Likely Matches:**")
+    st.metric(
+        "Unmatched IDs with a Candidate",
+        id_candidates['STUDENT_ID'].nunique(),
+        help="Unmatched IDs one transposition, digit change or dropped digit away from a student record"
+    )
+    if len(id_candidates) > 0:
+        with st.expander("View Candidate Matches"):
+            st.dataframe(
+                id_candidates.sort_values(['SCORE', 'STUDENT_ID'], ascending=[False, True]),
+                use_container_width=True,
+                hide_index=True
+            )
+
+st.markdown("---")
+
+# Student drill-down
+st.header("Student Lookup")
+
+lookup_id = st.text_input("Student ID", placeholder="e.g. 6336689")
+if lookup_id.strip():
+    try:
+        student_id = int(lookup_id.strip())
+    except ValueError:
+        st.error("Student IDs are numeric.")
+    else:
+        student_index = load_student_index(selected_terms, source_version)
+        if student_id not in student_index:
+            st.warning(f"No graduation or student records for ID {student_id}.")
+        else:
+            record = student_index.lookup(student_id)
+            col1, col2 = st.columns([1, 2])
+
+            with col1:
+                st.subheader("Student")
+                if record['student'] is None:
+                    st.write("Not found in the student table.")
+                    candidates = aggregates['id_candidates']
+                    candidates = candidates[candidates['STUDENT_ID'] == student_id]
+                    if len(candidates) > 0:
+                        st.write("**Possible intended IDs:**")
+                        st.dataframe(
+                            candidates[['CANDIDATE_STUDENT_ID', 'MATCH_TYPE', 'SCORE']],
+                            use_container_width=True,
+                            hide_index=True
+                        )
+                else:
+                    st.dataframe(
+                        record['student'].drop('STUDENT_ID').rename('Value').to_frame(),
+                        use_container_width=True
+                    )
+
+            with col2:
+                st.subheader(f"Applications ({len(record['applications'])})")
+                st.dataframe(record['applications'], use_container_width=True, hide_index=True)
+                if record['flags']:
+                    st.write("**Flags Triggered:**")
+                    for flag, count in record['flags'].items():
+                        st.write(f"- {flag}" + (f" ({count})" if count > 1 else ""))
+                else:
+                    st.success("No data quality flags for this student.")
+
 st.markdown("---")
 
 # Data Explorer
 st.header("Data Explorer")
 
-tab1, tab2, tab3 = st.tabs(["Dashboard Data", "Graduation Data", "Student Data"])
+tab1, tab2, tab3, tab4 = st.tabs(["Dashboard Data", "Graduation Data", "Student Data", "SQL Query"])
 
 with tab1:
     st.subheader("Full Dashboard Data")
-    st.dataframe(filtered_data, use_container_width=True)
+    # Decoding every column of the core table is the slowest step on the
+    # page, so it only happens when the table is shown or downloaded
+    if st.toggle("Show all columns", help=f"{len(filtered_data):,} rows"):
+        st.dataframe(filtered_data.to_pandas(), use_container_width=True)
     
-    # Download button
-    csv = filtered_data.to_csv(index=False).encode('utf-8')
+    # Download button; the CSV is built when clicked
     st.download_button(
         label="Download Dashboard Data as CSV",
-        data=csv,
+        data=lambda: filtered_data.to_pandas().to_csv(index=False).encode('utf-8'),
         file_name='dashboard_data.csv',
         mime='text/csv',
     )
@@ -612,6 +1065,29 @@ with tab2:
 with tab3:
     st.subheader("Student Records")
     st.dataframe(students, use_container_width=True)
+
+with tab4:
+    st.subheader("Query the Data")
+    st.caption("Read-only SQL over the tables dashboard_data, graduation and students.")
+    user_sql = st.text_area(
+        "SQL",
+        value="SELECT COLLEGE, count(*) AS applications,\n       avg(OVERALL_GPA) AS avg_gpa\nFROM dashboard_data\nGROUP BY COLLEGE\nORDER BY applications DESC",
+        height=150
+    )
+    if st.button("Run Query"):
+        try:
+            result = sql.run_readonly(query_engine, user_sql)
+        except (sql.QueryError, sql.duckdb.Error) as e:
+            st.error(str(e))
+        else:
+            st.write(f"{len(result):,} rows")
+            st.dataframe(result, use_container_width=True)
+            st.download_button(
+                label="Download Results as CSV",
+                data=result.to_csv(index=False).encode('utf-8'),
+                file_name='query_results.csv',
+                mime='text/csv',
+            )
     
 # Recommendations
 
@@ -619,4 +1095,19 @@ st.header("Recommendations")
 
 st.write("- Implement validation rules to prevent future date errors and credit requirement issues")
 st.write("- Perform an audit of the graduation and student systems to determine why student IDs aren't matching")
-st.write("- Create an automated data pipeline that standardizes dates to proper datatype, removes duplicates, and resolves null values before entering the system")
\ No newline at end of file
+st.write("- Create an automated data pipeline that standardizes dates to proper datatype, removes duplicates, and resolves null values before entering the system")
+
+# Startup diagnostics
+with st.sidebar.expander("Startup Diagnostics"):
+    st.write(f"This run took {time.perf_counter() - run_started:.2f}s")
+    memo_stats = section_memo.stats()
+    memo_hits, memo_misses = int(memo_stats['HITS'].sum()), int(memo_stats['MISSES'].sum())
+    st.write(
+        f"Section memo: {memo_hits:,} hits, {memo_misses:,} misses "
+        f"({len(section_memo.entries)}/{section_memo.size} entries)"
+    )
+    st.dataframe(memo_stats, use_container_width=True, hide_index=True)
+    if st.button("Profile Imports"):
+        import_times = startup_profile()
+        st.write(f"Fresh-process imports: {import_times['SECONDS'].sum():.2f}s")
+        st.dataframe(import_times.head(10), use_container_width=True, hide_index=True)
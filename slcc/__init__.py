@@ -0,0 +1 @@
+"""Shared data and analytics helpers for the SLCC graduation dashboard."""
@@ -0,0 +1,74 @@
+"""Flag GPA, credit and required-hours values far outside their major's norms.
+
+Each record is scored against its major with the robust z-score
+0.6745 * (x - median) / MAD, computed with grouped transforms over the
+whole frame in one pass. Majors with fewer than MIN_MAJOR_RECORDS values,
+or whose values barely vary (MAD of zero), get no score rather than a
+noisy one. REQUIRED_HOURS is also checked for being missing or for
+differing from the value most often recorded for the same major.
+"""
+import numpy as np
+import pandas as pd
+
+# Column scored -> prefix of the columns added for it
+SCORED_COLUMNS = {'OVERALL_GPA': 'GPA', 'TOTAL_CREDITS': 'CREDITS'}
+
+# |robust z| above this is an outlier (Iglewicz and Hoaglin's cutoff)
+ROBUST_Z_THRESHOLD = 3.5
+MIN_MAJOR_RECORDS = 10
+
+GPA_RANGE = (0, 4)
+
+ANOMALY_FLAGS = {
+    'GPA_OUTLIER': 'GPA Outlier for Major',
+    'CREDITS_OUTLIER': 'Credits Outlier for Major',
+    'INVALID_GPA': 'GPA Out of Range',
+    'REQUIRED_HOURS_MISSING': 'Required Hours Missing',
+    'REQUIRED_HOURS_INCONSISTENT': 'Required Hours Inconsistent',
+}
+
+
+def robust_z(values, groups, min_count=MIN_MAJOR_RECORDS):
+    """Robust z-score of each value within its group; NaN where undefined."""
+    grouped = values.groupby(groups)
+    median = grouped.transform('median')
+    deviation = (values - median).abs()
+    mad = deviation.groupby(groups).transform('median')
+    count = grouped.transform('count')
+    z = 0.6745 * (values - median) / mad.where(mad > 0)
+    return z.where(count >= min_count)
+
+
+def usual_required_hours(data):
+    """Most often recorded REQUIRED_HOURS per major (ties go to the lower value)."""
+    counts = data.groupby(['MAJOR', 'REQUIRED_HOURS']).size().rename('RECORDS').reset_index()
+    counts = counts.sort_values(['MAJOR', 'RECORDS', 'REQUIRED_HOURS'], ascending=[True, False, True], kind='stable')
+    return counts.drop_duplicates('MAJOR').set_index('MAJOR')['REQUIRED_HOURS']
+
+
+def flag_anomalies(data):
+    """Add robust z-scores and the ANOMALY_FLAGS columns to `data` in place."""
+    for column, prefix in SCORED_COLUMNS.items():
+        z = robust_z(data[column], data['MAJOR'])
+        data[f'{prefix}_ROBUST_Z'] = z.round(2)
+        data[f'{prefix}_OUTLIER'] = z.abs().gt(ROBUST_Z_THRESHOLD)
+
+    data['INVALID_GPA'] = ~data['OVERALL_GPA'].between(*GPA_RANGE) & data['OVERALL_GPA'].notna()
+    data['REQUIRED_HOURS_MISSING'] = data['REQUIRED_HOURS'].isna()
+    usual = data['MAJOR'].map(usual_required_hours(data))
+    data['REQUIRED_HOURS_INCONSISTENT'] = data['REQUIRED_HOURS'].notna() & usual.notna() & data['REQUIRED_HOURS'].ne(usual)
+    data['HAS_ANOMALY'] = np.logical_or.reduce([data[flag].to_numpy(dtype=bool) for flag in ANOMALY_FLAGS])
+    return data
+
+
+def major_norms(data):
+    """Per-major medians, MADs and usual REQUIRED_HOURS behind the flags."""
+    grouped = data.groupby('MAJOR')
+    norms = {'RECORDS': grouped.size()}
+    for column, prefix in SCORED_COLUMNS.items():
+        median = grouped[column].median()
+        norms[f'{prefix}_MEDIAN'] = median
+        norms[f'{prefix}_MAD'] = (data[column] - data['MAJOR'].map(median)).abs().groupby(data['MAJOR']).median()
+    norms['USUAL_REQUIRED_HOURS'] = usual_required_hours(data)
+    norms['ANOMALIES'] = grouped['HAS_ANOMALY'].sum()
+    return pd.DataFrame(norms).rename_axis('MAJOR').reset_index()
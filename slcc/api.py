@@ -0,0 +1,220 @@
+"""Async JSON API serving the dashboard's aggregate numbers.
+
+Run with ``python -m slcc.api`` (or ``uvicorn slcc.api:app``). The
+prepared dataset is read from the worker's on-disk cache (built there first
+when the current sources are not cached) and queried with the same SQL as
+the dashboard. Each request checks the version the worker last published,
+and a new one is loaded in place of the old. Responses are cached by URL
+and carry an ETag, so pollers sending If-None-Match get an empty 304 when
+nothing changed.
+
+Endpoints (all accept ``?semester=``, default 'All'):
+
+    /terms                      semesters available
+    /overview                   applications, graduation counts, averages
+    /degrees                    applications by degree type and status
+    /majors?top=10              status breakdown for the top majors
+    /semesters                  applications by semester and status
+    /counts/{column}?top=10     top departments, colleges, majors or degree types
+    /quality                    record counts per data quality flag
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from slcc import queries, sql, worker
+from slcc.pipeline import term_sort_key
+
+# Distinct URLs kept in the response cache
+CACHE_SIZE = 512
+MAX_TOP = 100
+
+COUNT_COLUMNS = {
+    'departments': 'DEPARTMENT',
+    'colleges': 'COLLEGE',
+    'majors': 'MAJOR',
+    'degrees': 'DEGREE_TYPE',
+}
+
+
+class ApiError(Exception):
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ResponseCache:
+    """LRU of (version, URL) -> (etag, body); cleared when the version changes."""
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+class Engine:
+    """Prepared dataset for all requests, reloaded when the worker publishes a new version."""
+
+    def __init__(self):
+        self.con = None
+        self.terms = None
+        self.version = None
+        self._lock = asyncio.Lock()
+
+    def _load(self, version):
+        prepared = worker.load_prepared(version)
+        con = sql.connect_prepared(prepared)
+        terms = set(prepared[2]['SEMESTER'].dropna().unique())
+        return con, terms
+
+    def _stale(self, version):
+        return self.con is None or version != self.version
+
+    async def ready(self):
+        # CURRENT is a one-line file; with no worker running it stays None
+        # and the dataset is loaded once for the current sources
+        version = worker.current_version()
+        if self._stale(version):
+            async with self._lock:
+                if self._stale(version):
+                    self.con, self.terms = await run_in_threadpool(self._load, version)
+                    self.version = version
+                    cache.clear()
+        return self
+
+
+engine = Engine()
+cache = ResponseCache()
+
+
+def _semester(request):
+    semester = request.query_params.get('semester', 'All')
+    if semester != 'All' and semester not in engine.terms:
+        raise ApiError(404, f"Unknown semester: {semester}")
+    return semester
+
+
+def _top(request):
+    try:
+        top = int(request.query_params.get('top', 10))
+    except ValueError:
+        raise ApiError(400, "top must be an integer")
+    if not 1 <= top <= MAX_TOP:
+        raise ApiError(400, f"top must be between 1 and {MAX_TOP}")
+    return top
+
+
+def _body(semester, frame):
+    return f'{{"semester": {json.dumps(semester)}, "data": {frame.to_json(orient="records", date_format="iso")}}}'.encode()
+
+
+def endpoint(build):
+    """Wrap `build(request) -> bytes` with validation, caching and ETags."""
+    async def handler(request):
+        await engine.ready()
+        key = (engine.version, str(request.url.include_query_params()))
+        entry = cache.get(key)
+        if entry is None:
+            try:
+                body = await run_in_threadpool(build, request)
+            except ApiError as e:
+                return JSONResponse({'error': str(e)}, status_code=e.status_code)
+            entry = (f'"{hashlib.sha1(body).hexdigest()[:20]}"', body)
+            cache.put(key, entry)
+
+        etag, body = entry
+        headers = {'ETag': etag, 'Cache-Control': 'max-age=60'}
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type='application/json', headers=headers)
+    return handler
+
+
+@endpoint
+def terms(request):
+    return json.dumps({'terms': sorted(engine.terms, key=term_sort_key)}).encode()
+
+
+@endpoint
+def overview(request):
+    semester = _semester(request)
+    return _body(semester, queries.overview(engine.con, semester))
+
+
+@endpoint
+def degrees(request):
+    semester = _semester(request)
+    return _body(semester, queries.degree_summary(engine.con, semester))
+
+
+@endpoint
+def majors(request):
+    semester = _semester(request)
+    return _body(semester, queries.major_summary(engine.con, semester, _top(request)))
+
+
+@endpoint
+def semesters(request):
+    semester = _semester(request)
+    return _body(semester, queries.semester_summary(engine.con, semester))
+
+
+@endpoint
+def counts(request):
+    column = COUNT_COLUMNS.get(request.path_params['column'])
+    if column is None:
+        raise ApiError(404, f"Unknown breakdown: {request.path_params['column']}")
+    semester = _semester(request)
+    return _body(semester, queries.top_counts(engine.con, column, semester, _top(request)))
+
+
+@endpoint
+def quality(request):
+    semester = _semester(request)
+    return _body(semester, queries.quality_counts(engine.con, semester))
+
+
+app = Starlette(routes=[
+    Route('/terms', terms),
+    Route('/overview', overview),
+    Route('/degrees', degrees),
+    Route('/majors', majors),
+    Route('/semesters', semesters),
+    Route('/counts/{column}', counts),
+    Route('/quality', quality),
+])
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve dashboard aggregates as JSON.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args(argv)
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Plotly figures shared by the dashboard and the static reports."""
+import plotly.express as px
+
+GRADUATED_COLORS = {'Y': '#1f77b4', 'N': '#ff7f0e'}
+
+
+def degree_chart(degree_summary):
+    fig = px.bar(
+        degree_summary,
+        x='DEGREE_TYPE',
+        y='count',
+        color='GRADUATED_IND',
+        barmode='group',
+        title='Applications by Degree Type and Graduation Status',
+        labels={'count': 'Number of Students', 'DEGREE_TYPE': 'Degree Type', 'GRADUATED_IND': 'Graduated'},
+        color_discrete_map=GRADUATED_COLORS,
+        height=400
+    )
+    fig.update_layout(
+        legend=dict(title="Graduated", orientation="h"),
+        xaxis={'categoryorder': 'total descending'}
+    )
+    return fig
+
+
+def major_chart(major_grad_data, top=10):
+    fig = px.bar(
+        major_grad_data,
+        x='count',
+        y='MAJOR',
+        color='GRADUATED_IND',
+        orientation='h',
+        title=f'Top {top} Majors by Graduation Status',
+        labels={'count': 'Number of Students', 'MAJOR': 'Major'},
+        color_discrete_map=GRADUATED_COLORS,
+        height=400
+    )
+    fig.update_layout(
+        yaxis={'categoryorder': 'total ascending'},
+        legend=dict(title="Graduated", orientation="h")
+    )
+    return fig
+
+
+def semester_chart(semester_grad):
+    fig = px.bar(
+        semester_grad,
+        x='SEMESTER',
+        y='count',
+        color='GRADUATED_IND',
+        title='Applications by Semester and Graduation Status',
+        labels={'count': 'Number of Students', 'SEMESTER': 'Semester'},
+        color_discrete_map=GRADUATED_COLORS,
+        barmode='group'
+    )
+    fig.update_layout(legend=dict(title="Graduated"))
+    return fig
+
+
+def ranked_chart(counts, title, label):
+    """Horizontal bar chart of a value -> count Series, first entry on top.
+
+    None when `counts` is empty, e.g. when every value was withheld by
+    slcc.disclosure; callers show ``disclosure.SUPPRESSED_NOTE`` instead.
+    """
+    if counts.empty:
+        return None
+    fig = px.bar(
+        x=counts.values,
+        y=counts.index,
+        orientation='h',
+        title=title,
+        labels={'x': 'Number of Students', 'y': label},
+        color_discrete_sequence=['#1f77b4']
+    )
+    fig.update_layout(showlegend=False, height=400, yaxis={'autorange': 'reversed'})
+    return fig
+
+
+def distribution_chart(bins, title, label):
+    """Histogram drawn from `queries.distribution` bins; None when every bin is withheld."""
+    bins = bins.dropna(subset=['count'])
+    if bins.empty:
+        return None
+    fig = px.bar(
+        x=(bins['LOW'] + bins['HIGH']) / 2,
+        y=bins['count'].astype(int),
+        title=title,
+        labels={'x': label, 'y': 'Number of Students'},
+        color_discrete_sequence=['#1f77b4']
+    )
+    fig.update_traces(width=(bins['HIGH'] - bins['LOW']).clip(lower=1e-9))
+    fig.update_layout(showlegend=False, bargap=0)
+    return fig
+
+
+def sankey_chart(nodes, links, title):
+    """Sankey diagram from `flows.sankey_links` output."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Sankey(
+        node=dict(label=nodes['LABEL'].tolist(), pad=12, thickness=14),
+        link=dict(source=links['SOURCE'].tolist(), target=links['TARGET'].tolist(), value=links['COUNT'].tolist()),
+    ))
+    fig.update_layout(title=title, height=600)
+    return fig
@@ -0,0 +1,216 @@
+"""Compact, memory-mapped column store for the prepared dashboard data.
+
+Each column is kept in the smallest form that round-trips it exactly:
+
+    bits      boolean flags, and Y/N indicators with no gaps, packed 8 per byte
+    codes     other text columns, as int8/16/32 dictionary codes (-1 = missing)
+    values    numeric and datetime columns as fixed-width arrays
+    int       nullable integers as int64 values plus a packed validity mask
+
+The worker writes one ``.npy`` file per array next to a ``manifest.json``
+under its version directory. ``CoreTable.open`` maps those files
+read-only, so every server process shares the same pages through the OS
+cache instead of holding its own copy. Nothing becomes pandas until a
+section asks for it: ``view(rows)`` selects rows by position and decodes
+only the columns that are indexed, once per view.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = 'manifest.json'
+
+YES_NO = ('N', 'Y')
+
+
+def _code_dtype(size):
+    for dtype in (np.int8, np.int16, np.int32):
+        if size < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _encode_column(series):
+    """(spec, arrays) for one column; see the module docstring for the kinds."""
+    dtype = series.dtype
+    spec = {'dtype': str(dtype)}
+    if pd.api.types.is_bool_dtype(dtype) and not series.isna().any():
+        return {**spec, 'kind': 'bits'}, {'bits': np.packbits(series.to_numpy(dtype=bool))}
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        valid = series.notna().to_numpy()
+        values = series.to_numpy(dtype=np.int64, na_value=0)
+        return {**spec, 'kind': 'int'}, {'values': values, 'valid': np.packbits(valid)}
+    if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_dtype(dtype):
+        return {**spec, 'kind': 'values'}, {'values': series.to_numpy()}
+    if series.notna().all() and set(series.unique()) <= set(YES_NO):
+        return {**spec, 'kind': 'bits', 'labels': list(YES_NO)}, {'bits': np.packbits(series.eq('Y').to_numpy())}
+    codes, categories = pd.factorize(series, sort=True)
+    return {**spec, 'kind': 'codes', 'categories': [str(c) for c in categories]}, {'codes': codes.astype(_code_dtype(len(categories)))}
+
+
+def encode(frame):
+    """(manifest, arrays) for `frame`; arrays are keyed '<column>.<part>'."""
+    manifest = {'rows': len(frame), 'columns': {}}
+    arrays = {}
+    for column in frame.columns:
+        spec, parts = _encode_column(frame[column])
+        manifest['columns'][column] = spec
+        arrays.update({f'{column}.{part}': array for part, array in parts.items()})
+    return manifest, arrays
+
+
+def write(frame, directory):
+    """Write `frame` as a core table directory."""
+    manifest, arrays = encode(frame)
+    os.makedirs(directory, exist_ok=True)
+    for key, array in arrays.items():
+        np.save(os.path.join(directory, f'{key}.npy'), array, allow_pickle=False)
+    with open(os.path.join(directory, MANIFEST), 'w') as f:
+        json.dump(manifest, f)
+
+
+class CoreTable:
+    """Encoded columns plus the manifest to decode them."""
+
+    def __init__(self, manifest, arrays):
+        self.manifest = manifest
+        self._arrays = arrays
+        self.columns = list(manifest['columns'])
+        self.rows = manifest['rows']
+
+    @classmethod
+    def open(cls, directory):
+        """Memory-map a table written by `write`; arrays are loaded on first use."""
+        with open(os.path.join(directory, MANIFEST)) as f:
+            manifest = json.load(f)
+        return cls(manifest, _MappedArrays(directory))
+
+    @classmethod
+    def from_frame(cls, frame):
+        """An in-memory table, for data that was never written out."""
+        return cls(*encode(frame))
+
+    def __len__(self):
+        return self.rows
+
+    def _bits(self, key):
+        return np.unpackbits(self._arrays[key], count=self.rows).view(bool)
+
+    def mask(self, column):
+        """Boolean array of a bits column, without going through pandas."""
+        spec = self.manifest['columns'][column]
+        if spec['kind'] != 'bits':
+            raise TypeError(f"{column} is not a flag column")
+        return self._bits(f'{column}.bits')
+
+    def equals(self, column, value):
+        """Boolean array of rows where `column` == `value`, compared on codes."""
+        spec = self.manifest['columns'][column]
+        if spec['kind'] == 'codes':
+            categories = spec['categories']
+            if value not in categories:
+                return np.zeros(self.rows, dtype=bool)
+            return np.asarray(self._arrays[f'{column}.codes']) == categories.index(value)
+        if spec['kind'] == 'bits' and 'labels' in spec:
+            bits = self._bits(f'{column}.bits')
+            return bits if value == spec['labels'][1] else ~bits
+        return self.decode(column).eq(value).to_numpy()
+
+    def codes(self, column):
+        """Dictionary codes and categories of a text column."""
+        spec = self.manifest['columns'][column]
+        if spec['kind'] != 'codes':
+            raise TypeError(f"{column} is not dictionary-encoded")
+        return np.asarray(self._arrays[f'{column}.codes']), spec['categories']
+
+    def decode(self, column, rows=None):
+        """One column as a pandas Series, for all rows or the given positions."""
+        spec = self.manifest['columns'][column]
+        kind = spec['kind']
+        index = pd.RangeIndex(self.rows) if rows is None else pd.Index(rows)
+        take = slice(None) if rows is None else rows
+        if kind == 'bits':
+            bits = self._bits(f'{column}.bits')[take]
+            if 'labels' in spec:
+                return pd.Series(np.where(bits, spec['labels'][1], spec['labels'][0]), index=index, name=column, dtype=spec['dtype'])
+            return pd.Series(bits, index=index, name=column).astype(spec['dtype'])
+        if kind == 'codes':
+            codes = np.asarray(self._arrays[f'{column}.codes'][take])
+            categories = np.array(spec['categories'] + [None], dtype=object)
+            return pd.Series(categories[codes], index=index, name=column).astype(spec['dtype'])
+        if kind == 'int':
+            values = np.asarray(self._arrays[f'{column}.values'][take])
+            valid = self._bits(f'{column}.valid')[take]
+            return pd.Series(pd.array(values, dtype=spec['dtype']), index=index, name=column).where(valid)
+        return pd.Series(np.asarray(self._arrays[f'{column}.values'][take]), index=index, name=column)
+
+    def view(self, rows=None):
+        return CoreView(self, rows)
+
+    def select(self, column, value):
+        """View of the rows where `column` == `value`."""
+        return CoreView(self, np.flatnonzero(self.equals(column, value)))
+
+
+class _MappedArrays:
+    """Lazily memory-maps '<key>.npy' files from a table directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._maps = {}
+
+    def __getitem__(self, key):
+        if key not in self._maps:
+            self._maps[key] = np.load(os.path.join(self.directory, f'{key}.npy'), mmap_mode='r')
+        return self._maps[key]
+
+
+class CoreView:
+    """Selected rows of a CoreTable, decoding columns on first access.
+
+    Indexing with a column name returns a Series, with a list of names a
+    DataFrame; the index is the row's position in the full table, so it
+    lines up with other frames built from the same prepared data.
+    """
+
+    def __init__(self, table, rows=None):
+        self.table = table
+        self.rows = rows
+        self.columns = table.columns
+        self._decoded = {}
+
+    def __len__(self):
+        return self.table.rows if self.rows is None else len(self.rows)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._decoded:
+                self._decoded[key] = self.table.decode(key, self.rows)
+            return self._decoded[key]
+        return pd.DataFrame({column: self[column] for column in key})
+
+    def where(self, column):
+        """The rows of this view where the flag `column` is set."""
+        mask = self.table.mask(column)
+        rows = np.flatnonzero(mask) if self.rows is None else self.rows[mask[self.rows]]
+        return CoreView(self.table, rows)
+
+    def counts(self, column):
+        """Rows per value of `column` (unsorted); a bincount for encoded text."""
+        if self.table.manifest['columns'][column]['kind'] != 'codes':
+            return self[column].value_counts(sort=False).rename('count')
+        codes, categories = self.table.codes(column)
+        if self.rows is not None:
+            codes = codes[self.rows]
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        return pd.Series(counts, index=pd.Index(categories, name=column), name='count')
+
+    def count(self, column):
+        """Rows in this view with the flag `column` set."""
+        mask = self.table.mask(column)
+        return int(mask.sum() if self.rows is None else mask[self.rows].sum())
+
+    def to_pandas(self):
+        return self[self.columns]
@@ -0,0 +1,116 @@
+"""Startup diagnostics: where each entry point spends its import time.
+
+Every fresh process (a Streamlit server, the worker, each report worker)
+pays its imports once; reruns of the dashboard script reuse them. The
+profile comes from ``python -X importtime`` run in a clean interpreter, so
+nothing already imported by the caller hides a cost.
+
+    python -m slcc.diagnostics              # all entry points
+    python -m slcc.diagnostics dashboard    # one, with its slowest packages
+"""
+import argparse
+import ast
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+DASHBOARD_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SLCC_dashboard.py')
+
+# Script or module run by each entry point
+ENTRY_POINTS = {
+    'dashboard': DASHBOARD_SCRIPT,
+    'worker': 'slcc.worker',
+    'api': 'slcc.api',
+    'report': 'slcc.report',
+    'export': 'slcc.export',
+    'sql': 'slcc.sql',
+}
+
+
+def script_imports(path):
+    """Modules a script imports at its top level, read from its source.
+
+    ``from package import name`` counts as ``package.name`` when that is a
+    submodule, otherwise as ``package``.
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            spec = importlib.util.find_spec(node.module)
+            package = spec is not None and spec.submodule_search_locations is not None
+            for alias in node.names:
+                submodule = f'{node.module}.{alias.name}'
+                modules.append(submodule if package and importlib.util.find_spec(submodule) else node.module)
+    return list(dict.fromkeys(modules))
+
+
+def entry_point_imports(name):
+    """Modules the entry point `name` imports at startup."""
+    target = ENTRY_POINTS[name]
+    return script_imports(target) if target.endswith('.py') else [target]
+
+
+def import_profile(modules):
+    """Self and cumulative import time (seconds) of every module loaded by `modules`."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', '; '.join(f'import {module}' for module in modules)],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append({
+            'MODULE': name.strip(),
+            'DEPTH': (len(name) - len(name.lstrip())) // 2,
+            'SELF': int(self_us) / 1e6,
+            'CUMULATIVE': int(cumulative_us) / 1e6,
+        })
+    profile = pd.DataFrame(rows, columns=['MODULE', 'DEPTH', 'SELF', 'CUMULATIVE'])
+    profile['PACKAGE'] = profile['MODULE'].str.split('.').str[0]
+    return profile
+
+
+def package_totals(profile):
+    """Import time per top-level package, slowest first."""
+    totals = profile.groupby('PACKAGE')['SELF'].sum().sort_values(ascending=False)
+    return totals.rename('SECONDS').reset_index()
+
+
+def startup_report(entry_points=None):
+    """Total import time per entry point."""
+    rows = []
+    for name in entry_points or ENTRY_POINTS:
+        profile = import_profile(entry_point_imports(name))
+        rows.append({'ENTRY_POINT': name, 'SECONDS': profile['SELF'].sum(), 'MODULES': len(profile)})
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report import time per entry point.")
+    parser.add_argument('entry_points', nargs='*', help=f"any of {', '.join(ENTRY_POINTS)} (default: all)")
+    parser.add_argument('--top', type=int, default=10, help="slowest packages to list per entry point")
+    args = parser.parse_args(argv)
+    unknown = set(args.entry_points) - set(ENTRY_POINTS)
+    if unknown:
+        parser.error(f"unknown entry points: {', '.join(sorted(unknown))}")
+
+    entry_points = args.entry_points or list(ENTRY_POINTS)
+    print(startup_report(entry_points).to_string(index=False, float_format='{:.3f}'.format))
+    if args.entry_points:
+        for name in entry_points:
+            print(f"\n{name}:")
+            totals = package_totals(import_profile(entry_point_imports(name))).head(args.top)
+            print(totals.to_string(index=False, float_format='{:.3f}'.format))
+
+
+if __name__ == '__main__':
+    main()
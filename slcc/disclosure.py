@@ -0,0 +1,152 @@
+"""Small-cell suppression, and optional noise, for published aggregates.
+
+Every count the dashboard, the reports and the API show passes through
+``protect`` after it is aggregated. Counts from 1 to ``min_cell - 1`` are
+withheld (shown as missing). Wherever that leaves exactly one withheld
+cell in a margin, the next smallest cell of that margin is withheld with
+it, so the small one cannot be recovered by subtracting from a total.
+A margin is every total across one key, e.g. the graduated count over
+all degree types as well as each degree type's applications. Rates and means
+computed from a withheld count are withheld too.
+
+With a noise scale set, the counts that are shown get rounded Laplace
+noise. The noise is drawn from a hash of the cell (its labels, column and
+true count) keyed by a secret, so a cell shows the same value on every
+rerun and in every view, and reloading it cannot average the noise away.
+
+Settings come from the environment, like the extract source:
+
+    SLCC_MIN_CELL       smallest count shown (default 10; 0 turns suppression off)
+    SLCC_NOISE_SCALE    Laplace scale of the noise (default 0, no noise)
+    SLCC_NOISE_KEY      secret the noise is keyed by; set it whenever noise is on
+
+Everything works on the small aggregate frames, never the row-level data.
+"""
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+MIN_CELL_ENV = 'SLCC_MIN_CELL'
+NOISE_SCALE_ENV = 'SLCC_NOISE_SCALE'
+NOISE_KEY_ENV = 'SLCC_NOISE_KEY'
+
+DEFAULT_MIN_CELL = 10
+
+# Shown in place of a withheld count, and of a chart with nothing left to show
+WITHHELD = 'suppressed'
+SUPPRESSED_NOTE = "Every value here is below the minimum cell size and is suppressed."
+
+# Counts and derived columns of the outcome tables (equity rollups, term summary)
+OUTCOME_COUNTS = ['APPLICATIONS', 'GRADUATED', 'NOT_GRADUATED']
+OUTCOME_DERIVED = {
+    'GRADUATED': ['APPLICATIONS', 'NOT_GRADUATED'],
+    'GRAD_RATE': OUTCOME_COUNTS,
+    'CI_LOW': OUTCOME_COUNTS,
+    'CI_HIGH': OUTCOME_COUNTS,
+    'MEAN_GPA': ['APPLICATIONS'],
+    'MEAN_CREDIT_EXCESS': ['APPLICATIONS'],
+}
+
+
+def min_cell_size():
+    return int(os.environ.get(MIN_CELL_ENV, DEFAULT_MIN_CELL))
+
+
+def noise_scale():
+    return float(os.environ.get(NOISE_SCALE_ENV, 0))
+
+
+def _margins(frame, keys):
+    """Group ids of each margin: the cells summed for one total across each key."""
+    margins = []
+    for key in keys or [None]:
+        groups = [other for other in keys if other != key]
+        margins.append(frame.groupby(groups, sort=False, dropna=False).ngroup() if groups else pd.Series(0, index=frame.index))
+    return margins
+
+
+def _small_cells(frame, keys, column, min_cell):
+    """Primary and complementary suppression of one count column."""
+    values = frame[column]
+    small = (values.gt(0) & values.lt(min_cell)).to_numpy()
+    if not small.any():
+        return small
+    margins = _margins(frame, keys)
+    withheld = pd.Series(small, index=frame.index)
+    # Withholding a complement in one margin can leave a lone cell in another
+    while True:
+        before = withheld.sum()
+        for group in margins:
+            lone = withheld.groupby(group).transform('sum').eq(1)
+            candidates = values.where(lone & ~withheld & values.gt(0))
+            withheld |= candidates.eq(candidates.groupby(group).transform('min'))
+        if withheld.sum() == before:
+            return withheld.to_numpy()
+
+
+def _noise(frame, keys, column, scale):
+    """Rounded Laplace noise for each cell of `column`, fixed per cell."""
+    cells = frame[keys].astype(str) if keys else pd.DataFrame(index=frame.index)
+    cells = cells.assign(_column=column, _count=frame[column].astype(str))
+    secret = hashlib.sha256(os.environ.get(NOISE_KEY_ENV, '').encode()).hexdigest()[:16]
+    hashes = pd.util.hash_pandas_object(cells, index=False, hash_key=secret).to_numpy()
+    u = ((hashes >> np.uint64(11)) + 0.5) * 2.0 ** -53 - 0.5
+    return np.round(-scale * np.sign(u) * np.log1p(-2 * np.abs(u)))
+
+
+def protect(frame, keys, counts=('count',), derived=None, min_cell=None, scale=None):
+    """Copy of an aggregate `frame` that is safe to publish.
+
+    `keys` are the label columns, whose margins complementary suppression
+    covers; `counts` the count columns, returned as nullable integers;
+    `derived` maps other columns to the counts they were computed from (a
+    count listed there is also withheld with its sources).
+    """
+    min_cell = min_cell_size() if min_cell is None else min_cell
+    scale = noise_scale() if scale is None else scale
+    keys, counts = list(keys), list(counts)
+    withheld = {column: _small_cells(frame, keys, column, min_cell) if min_cell > 0 else np.zeros(len(frame), dtype=bool)
+                for column in counts}
+    for column, sources in (derived or {}).items():
+        if column in frame:
+            mask = np.logical_or.reduce([withheld[source] for source in sources])
+            withheld[column] = withheld.get(column, np.zeros(len(frame), dtype=bool)) | mask
+
+    protected = frame.copy()
+    for column in counts:
+        values = frame[column].to_numpy(dtype=float)
+        if scale > 0:
+            values = np.clip(values + _noise(frame, keys, column, scale), 0, None)
+        protected[column] = pd.array(values, dtype='Float64').round().astype('Int64')
+    for column, mask in withheld.items():
+        protected[column] = protected[column].mask(mask)
+    return protected
+
+
+def protect_counts(counts, **kwargs):
+    """`protect` for a value -> count Series; withheld values are dropped."""
+    label = counts.index.name or 'VALUE'
+    frame = counts.rename('count').rename_axis(label).reset_index()
+    protected = protect(frame, [label], **kwargs).set_index(label)['count'].dropna()
+    return protected.rename(counts.name).rename_axis(counts.index.name)
+
+
+def protect_outcomes(table, keys, **kwargs):
+    """`protect` for APPLICATIONS/GRADUATED tables, with rates recomputed from the shown counts."""
+    from slcc.equity import wilson_interval
+
+    table = table.assign(NOT_GRADUATED=table['APPLICATIONS'] - table['GRADUATED'])
+    counts = [column for column in OUTCOME_COUNTS if column in table]
+    protected = protect(table, keys, counts, OUTCOME_DERIVED, **kwargs)
+    applications = protected['APPLICATIONS'].astype(float)
+    graduated = protected['GRADUATED'].astype(float).clip(upper=applications)
+    protected['GRAD_RATE'] = graduated / applications
+    if 'CI_LOW' in protected:
+        protected['CI_LOW'], protected['CI_HIGH'] = wilson_interval(graduated, applications)
+    return protected.drop(columns='NOT_GRADUATED')
+
+
+def format_count(value):
+    return WITHHELD if pd.isna(value) else f"{int(value):,}"
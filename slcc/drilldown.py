@@ -0,0 +1,75 @@
+"""Per-student drill-down backed by a STUDENT_ID index.
+
+Rows are sorted by STUDENT_ID once, and a dict maps each ID to the slice
+of rows it occupies, so a lookup is a hash probe plus a contiguous slice
+instead of a scan of the whole table.
+"""
+import numpy as np
+
+from slcc.anomalies import ANOMALY_FLAGS
+from slcc.queries import QUALITY_FLAGS
+
+# Flags beyond the quality checks that are worth surfacing per application
+RECORD_FLAGS = {
+    **QUALITY_FLAGS,
+    'DEPARTMENT_IMPUTED': 'Department Recovered from Major',
+    'COLLEGE_IMPUTED': 'College Recovered from Major',
+    **ANOMALY_FLAGS,
+}
+
+APPLICATION_COLUMNS = [
+    'GRAD_APPL_DATE', 'GRADUATION_DATE', 'SEMESTER', 'GRADUATED_IND', 'DEGREE_TYPE', 'MAJOR',
+    'DEPARTMENT', 'COLLEGE', 'TOTAL_CREDITS', 'REQUIRED_HOURS', 'OVERALL_GPA',
+]
+
+
+def _slice_index(frame):
+    """Sort `frame` by STUDENT_ID and map each ID to its (start, stop) rows."""
+    frame = frame[frame['STUDENT_ID'].notna()].sort_values('STUDENT_ID', kind='stable')
+    ids = frame['STUDENT_ID'].to_numpy(dtype='int64')
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    stops = np.r_[starts[1:], len(ids)]
+    return frame.reset_index(drop=True), dict(zip(ids[starts].tolist(), zip(starts.tolist(), stops.tolist())))
+
+
+class StudentIndex:
+    """Constant-time lookup of a student's applications and attributes."""
+
+    def __init__(self, dashboard_data, students):
+        self._applications, self._application_slices = _slice_index(dashboard_data)
+        self._students, self._student_slices = _slice_index(students)
+
+    def __contains__(self, student_id):
+        student_id = int(student_id)
+        return student_id in self._application_slices or student_id in self._student_slices
+
+    def lookup(self, student_id):
+        """Return the student's record, applications and flags triggered.
+
+        `student` is None when the ID is missing from Students.csv;
+        `applications` is empty when it has no graduation records.
+        """
+        student_id = int(student_id)
+        start, stop = self._application_slices.get(student_id, (0, 0))
+        applications = self._applications.iloc[start:stop]
+        start, stop = self._student_slices.get(student_id, (0, 0))
+        student_rows = self._students.iloc[start:stop]
+
+        flags = {
+            label: int(applications[column].sum())
+            for column, label in RECORD_FLAGS.items()
+            if column in applications and applications[column].any()
+        }
+        if len(applications) > 0 and len(student_rows) == 0:
+            flags['Not in Student Table'] = len(applications)
+        if len(student_rows) > 1:
+            flags['Duplicate Student Record'] = len(student_rows)
+        if len(applications) > 1:
+            flags['Multiple Applications'] = len(applications)
+
+        return {
+            'student': student_rows.iloc[0] if len(student_rows) > 0 else None,
+            'student_rows': len(student_rows),
+            'applications': applications[[column for column in APPLICATION_COLUMNS if column in applications]],
+            'flags': flags,
+        }
@@ -0,0 +1,84 @@
+"""Equity breakdowns of graduation outcomes by demographic group.
+
+Outcomes are reduced once per (SEMESTER, group[, COLLEGE]) into additive
+sums, so the dashboard can apply the semester filter by re-summing the
+small aggregate table instead of regrouping the row-level data.
+"""
+import numpy as np
+import pandas as pd
+
+# Demographic columns from Students.csv and their display labels
+EQUITY_DIMENSIONS = {
+    'GENDER': 'Gender',
+    'RACE': 'Race',
+    'HISPANIC_IND': 'Hispanic',
+    'EVER_PELL_ELIGIBLE_IND': 'Pell Eligible',
+    'EVER_CONCURRENT_IND': 'Concurrent Enrollment',
+}
+
+# Label for graduation records with no matching student record
+NO_STUDENT_RECORD = 'No Student Record'
+
+_SUM_COLUMNS = ['APPLICATIONS', 'GRADUATED', 'GPA_SUM', 'GPA_COUNT',
+                'CREDIT_EXCESS_SUM', 'CREDIT_EXCESS_COUNT']
+
+
+def wilson_interval(successes, totals, z=1.96):
+    """Vectorized Wilson score interval for binomial proportions."""
+    successes = np.asarray(successes, dtype=float)
+    totals = np.asarray(totals, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = successes / totals
+        z2 = z * z
+        denom = 1 + z2 / totals
+        center = (p + z2 / (2 * totals)) / denom
+        half = z * np.sqrt(p * (1 - p) / totals + z2 / (4 * totals * totals)) / denom
+    return center - half, center + half
+
+
+def _outcome_sums(data, keys):
+    credit_excess = data['TOTAL_CREDITS'] - data['REQUIRED_HOURS']
+    frame = pd.DataFrame({
+        **{key: data[key].fillna(NO_STUDENT_RECORD) for key in keys},
+        'APPLICATIONS': 1,
+        'GRADUATED': data['GRADUATED_IND'].eq('Y').astype(int),
+        'GPA_SUM': data['OVERALL_GPA'].fillna(0),
+        'GPA_COUNT': data['OVERALL_GPA'].notna().astype(int),
+        'CREDIT_EXCESS_SUM': credit_excess.fillna(0),
+        'CREDIT_EXCESS_COUNT': credit_excess.notna().astype(int),
+    })
+    return frame.groupby(keys, sort=False)[_SUM_COLUMNS].sum().reset_index()
+
+
+def equity_sums(data, dimensions=EQUITY_DIMENSIONS):
+    """Precompute additive outcome sums for every demographic dimension.
+
+    Returns {dimension: {'overall': frame, 'by_college': frame}}, each frame
+    keyed by SEMESTER so it can be filtered and rolled up cheaply.
+    """
+    sums = {}
+    for column in dimensions:
+        sums[column] = {
+            'overall': _outcome_sums(data, ['SEMESTER', column]),
+            'by_college': _outcome_sums(data, ['SEMESTER', column, 'COLLEGE']),
+        }
+    return sums
+
+
+def rollup(sums, keys, semester='All'):
+    """Collapse precomputed sums to `keys` and derive rates and intervals."""
+    if semester != 'All':
+        sums = sums[sums['SEMESTER'] == semester]
+    table = sums.groupby(keys)[_SUM_COLUMNS].sum().reset_index()
+
+    low, high = wilson_interval(table['GRADUATED'], table['APPLICATIONS'])
+    total = table['APPLICATIONS']
+    table['GRAD_RATE'] = table['GRADUATED'] / total
+    table['CI_LOW'] = low
+    table['CI_HIGH'] = high
+    table['MEAN_GPA'] = table['GPA_SUM'] / table['GPA_COUNT'].replace(0, np.nan)
+    table['MEAN_CREDIT_EXCESS'] = (
+        table['CREDIT_EXCESS_SUM'] / table['CREDIT_EXCESS_COUNT'].replace(0, np.nan)
+    )
+    return table[keys + ['APPLICATIONS', 'GRADUATED', 'GRAD_RATE', 'CI_LOW', 'CI_HIGH',
+                         'MEAN_GPA', 'MEAN_CREDIT_EXCESS']]
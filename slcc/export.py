@@ -0,0 +1,120 @@
+"""Per-department or per-college slices of the prepared dashboard data.
+
+Run with ``python -m slcc.export --by DEPARTMENT --out exports``. Writes
+one file per department (or college) in the same layout as
+``dashboard_data.csv``, or as Parquet with ``--format parquet``, plus a
+``manifest.json`` listing each file with its group, row count and SHA-256.
+
+The data is partitioned in a single groupby: each group's row positions
+come from ``GroupBy.indices`` and are taken once, instead of filtering
+the whole table again for every group. The slices are then written by a
+process pool, like the static reports.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from slcc import worker
+
+EXPORT_DIR = 'exports'
+GROUP_COLUMNS = ('DEPARTMENT', 'COLLEGE')
+FORMATS = ('csv', 'parquet')
+MANIFEST = 'manifest.json'
+
+# Group name for rows with no department/college recorded
+UNASSIGNED = 'Unassigned'
+
+
+def partition(data, column):
+    """{group: rows of `data`} from one groupby; missing values go to UNASSIGNED.
+
+    Rows already labelled UNASSIGNED in the data share that group with the
+    missing ones, in their original order.
+    """
+    if column not in GROUP_COLUMNS:
+        raise ValueError(f"Unsupported export column: {column}")
+    indices = data.groupby(column, sort=True, dropna=False).indices
+    positions = {}
+    for group, rows in indices.items():
+        group = UNASSIGNED if pd.isna(group) else group
+        positions[group] = np.union1d(positions[group], rows) if group in positions else rows
+    return {group: data.take(rows) for group, rows in positions.items()}
+
+
+def export_filenames(groups, file_format):
+    """A distinct file name per group, e.g. 'Comp. Sciences' -> 'comp_sciences.csv'."""
+    names, used = {}, set()
+    for group in groups:
+        stem = re.sub(r'[^A-Za-z0-9]+', '_', str(group)).strip('_').lower() or 'group'
+        name, n = stem, 1
+        while name in used:
+            n += 1
+            name = f'{stem}_{n}'
+        used.add(name)
+        names[group] = f'{name}.{file_format}'
+    return names
+
+
+def _write(job):
+    path, frame, file_format = job
+    if file_format == 'csv':
+        frame.to_csv(path, index=False)
+    else:
+        frame.to_parquet(path, index=False)
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return path, len(frame), digest
+
+
+def export(out_dir=EXPORT_DIR, by='DEPARTMENT', file_format='csv', semester='All', workers=None, data=None):
+    """Write one file per group and the manifest; returns the manifest."""
+    if file_format not in FORMATS:
+        raise ValueError(f"Unsupported export format: {file_format}")
+    if data is None:
+        data = worker.load_prepared()[worker.PREPARED_NAMES.index('dashboard_data')]
+    if semester != 'All':
+        data = data[data['SEMESTER'] == semester]
+
+    groups = partition(data, by)
+    names = export_filenames(groups, file_format)
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(os.path.join(out_dir, names[group]), frame, file_format) for group, frame in groups.items()]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        written = list(pool.map(_write, jobs))
+
+    manifest = {
+        'generated_at': pd.Timestamp.now().isoformat(timespec='seconds'),
+        'by': by,
+        'semester': semester,
+        'format': file_format,
+        'rows': len(data),
+        'files': [
+            {'group': group, 'file': os.path.basename(path), 'rows': rows, 'sha256': digest}
+            for group, (path, rows, digest) in zip(groups, written)
+        ],
+    }
+    with open(os.path.join(out_dir, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', default=EXPORT_DIR)
+    parser.add_argument('--by', choices=GROUP_COLUMNS, default='DEPARTMENT')
+    parser.add_argument('--format', choices=FORMATS, default='csv', dest='file_format')
+    parser.add_argument('--semester', default='All')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+    manifest = export(args.out, args.by, args.file_format, args.semester, args.workers)
+    print(f"Wrote {len(manifest['files'])} files ({manifest['rows']:,} rows) to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
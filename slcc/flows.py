@@ -0,0 +1,106 @@
+"""Application flows COLLEGE -> DEPARTMENT -> DEGREE_TYPE -> GRADUATED_IND.
+
+Transition counts are built once per prepared dataset: every stage column
+is factorized to integer codes, and each pair of adjacent stages is tallied
+per semester into a sparse (semester x source*target) matrix in a single
+pass. The nonzero cells are kept as a long frame of (STEP, SEMESTER,
+SOURCE, TARGET, COUNT) triplets, which is what gets cached and published.
+Selecting a semester or pruning to the top values per stage only touches
+those triplets, never the application rows.
+"""
+import numpy as np
+import pandas as pd
+
+from slcc.topn import top_labels
+
+FLOW_STAGES = ['COLLEGE', 'DEPARTMENT', 'DEGREE_TYPE', 'GRADUATED_IND']
+
+STAGE_LABELS = {
+    'COLLEGE': 'College',
+    'DEPARTMENT': 'Department',
+    'DEGREE_TYPE': 'Degree Type',
+    'GRADUATED_IND': 'Outcome',
+}
+
+# Display names for values that are unclear on their own
+VALUE_LABELS = {'GRADUATED_IND': {'Y': 'Graduated', 'N': 'Not Graduated'}}
+
+MISSING = 'Missing'
+OTHER = 'Other'
+
+
+def transition_counts(data, stages=FLOW_STAGES):
+    """Nonzero transition counts between adjacent stages, per semester."""
+    # Only the process building aggregates needs scipy
+    from scipy import sparse
+
+    semester_codes, semesters = pd.factorize(data['SEMESTER'].fillna(OTHER))
+    codes = {stage: pd.factorize(data[stage].astype(object).fillna(MISSING)) for stage in stages}
+
+    frames = []
+    for step, (source, target) in enumerate(zip(stages, stages[1:])):
+        source_codes, source_values = codes[source]
+        target_codes, target_values = codes[target]
+        width = len(target_values)
+        matrix = sparse.coo_matrix(
+            (np.ones(len(data), dtype=np.int64), (semester_codes, source_codes * width + target_codes)),
+            shape=(len(semesters), len(source_values) * width),
+        ).tocsr()
+        # CSR conversion sums the duplicate (row, col) entries
+        cells = matrix.tocoo()
+        frames.append(pd.DataFrame({
+            'STEP': step,
+            'SEMESTER': np.asarray(semesters)[cells.row],
+            'SOURCE': np.asarray(source_values)[cells.col // width],
+            'TARGET': np.asarray(target_values)[cells.col % width],
+            'COUNT': cells.data,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _stage_totals(links, stages):
+    """Flow through each value of each stage."""
+    totals = {}
+    for index, stage in enumerate(stages):
+        if index < len(stages) - 1:
+            step = links[links['STEP'] == index]
+            totals[stage] = step.groupby('SOURCE')['COUNT'].sum()
+        else:
+            step = links[links['STEP'] == index - 1]
+            totals[stage] = step.groupby('TARGET')['COUNT'].sum()
+    return totals
+
+
+def sankey_links(transitions, semester='All', top=10, stages=FLOW_STAGES):
+    """Nodes and links for a Sankey of one semester ('All' for every one).
+
+    Each stage keeps its `top` values by flow; the rest merge into 'Other'.
+    Returns (nodes, links): nodes has STAGE, VALUE and LABEL, links has
+    SOURCE and TARGET node positions and COUNT.
+    """
+    selected = transitions if semester == 'All' else transitions[transitions['SEMESTER'] == semester]
+    links = selected.groupby(['STEP', 'SOURCE', 'TARGET'], as_index=False)['COUNT'].sum()
+
+    totals = _stage_totals(links, stages)
+    kept = {stage: set(top_labels(totals[stage], top)) for stage in stages}
+    for index, (source, target) in enumerate(zip(stages, stages[1:])):
+        step = links['STEP'] == index
+        links.loc[step & ~links['SOURCE'].isin(kept[source]), 'SOURCE'] = OTHER
+        links.loc[step & ~links['TARGET'].isin(kept[target]), 'TARGET'] = OTHER
+    links = links.groupby(['STEP', 'SOURCE', 'TARGET'], as_index=False)['COUNT'].sum()
+
+    # One node per (stage, value), ordered by flow within each stage, 'Other' last
+    node_rows = []
+    for index, stage in enumerate(stages):
+        column = 'SOURCE' if index < len(stages) - 1 else 'TARGET'
+        step = links[links['STEP'] == min(index, len(stages) - 2)]
+        flow = step.groupby(column)['COUNT'].sum().sort_values(ascending=False)
+        flow = pd.concat([flow.drop(OTHER, errors='ignore'), flow.reindex([OTHER]).dropna()])
+        for value in flow.index:
+            node_rows.append({'STAGE': stage, 'VALUE': value, 'LABEL': VALUE_LABELS.get(stage, {}).get(value, value)})
+    nodes = pd.DataFrame(node_rows, columns=['STAGE', 'VALUE', 'LABEL'])
+    position = {(row.STAGE, row.VALUE): i for i, row in enumerate(nodes.itertuples())}
+
+    links['SOURCE'] = [position[(stages[step], value)] for step, value in zip(links['STEP'], links['SOURCE'])]
+    links['TARGET'] = [position[(stages[step + 1], value)] for step, value in zip(links['STEP'], links['TARGET'])]
+    return nodes, links[['SOURCE', 'TARGET', 'COUNT']]
@@ -0,0 +1,105 @@
+"""Recover 'Unknown' DEPARTMENT and COLLEGE values from MAJOR.
+
+A MAJOR -> DEPARTMENT/COLLEGE table is built by majority vote over rows
+where the value is known. Majors that never appear with a known value are
+matched to the closest known major whose name contains theirs ('English'
+matches 'English Studies', 'Pharmacy Technician' matches 'Pharmacy Tech &
+Train'). The reverse direction is not used: a qualifier such as 'General
+Education' vs 'Education' usually changes the department. Lookups are applied as a
+categorical code take, and every filled cell is flagged.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+UNKNOWN = 'Unknown'
+IMPUTED_COLUMNS = ['DEPARTMENT', 'COLLEGE']
+
+_STOPWORDS = {'and', 'of', 'the', 'to'}
+
+
+def _tokens(name):
+    return [token for token in re.findall(r'[a-z0-9]+', name.lower()) if token not in _STOPWORDS]
+
+
+def _token_matches(token, other):
+    if token == other:
+        return True
+    # Abbreviations such as 'tech'/'technician' or 'lang'/'language'
+    return min(len(token), len(other)) >= 4 and (token.startswith(other) or other.startswith(token))
+
+
+def name_similarity(major, candidate):
+    """Share of `candidate`'s tokens matched, if every token of `major` appears in it."""
+    tokens, candidate_tokens = _tokens(major), _tokens(candidate)
+    if not tokens or len(tokens) > len(candidate_tokens):
+        return 0.0
+    if all(any(_token_matches(token, other) for other in candidate_tokens) for token in tokens):
+        return len(tokens) / len(candidate_tokens)
+    return 0.0
+
+
+def _majority(data, column):
+    known = data.loc[data[column] != UNKNOWN, ['MAJOR', column]].dropna()
+    counts = known.groupby(['MAJOR', column]).size().rename('VOTES').reset_index()
+    counts['SUPPORT'] = counts.groupby('MAJOR')['VOTES'].transform('sum')
+    top = counts.sort_values(['MAJOR', 'VOTES'], ascending=[True, False], kind='stable').drop_duplicates('MAJOR')
+    top['CONFIDENCE'] = top['VOTES'] / top['SUPPORT']
+    return top.set_index('MAJOR')[[column, 'CONFIDENCE', 'SUPPORT']]
+
+
+def _closest_major(major, votes):
+    best, best_score, best_support = None, 0.0, 0
+    for candidate, support in votes['SUPPORT'].items():
+        score = name_similarity(major, candidate)
+        if score > best_score or (score == best_score and score > 0 and support > best_support):
+            best, best_score, best_support = candidate, score, support
+    return best, best_score
+
+
+def build_major_mapping(data):
+    """Build the MAJOR -> DEPARTMENT/COLLEGE table with confidences.
+
+    Returns a frame indexed by every MAJOR in `data` with, per imputed
+    column, the voted value, its confidence (vote share times name
+    similarity for fuzzy matches), its support and how it was found.
+    """
+    majors = pd.Index(data['MAJOR'].dropna().unique(), name='MAJOR')
+    mapping = pd.DataFrame(index=majors)
+    for column in IMPUTED_COLUMNS:
+        votes = _majority(data, column)
+        exact = votes.reindex(majors)
+        method = pd.Series(np.where(exact[column].notna(), 'exact', None), index=majors, dtype=object)
+        source = pd.Series(np.where(exact[column].notna(), majors, None), index=majors, dtype=object)
+
+        # Fuzzy-match the (few) distinct majors with no known value
+        for major in majors[exact[column].isna()]:
+            candidate, score = _closest_major(major, votes)
+            if candidate is None:
+                continue
+            exact.loc[major] = votes.loc[candidate]
+            exact.loc[major, 'CONFIDENCE'] = votes.loc[candidate, 'CONFIDENCE'] * score
+            method[major] = 'fuzzy'
+            source[major] = candidate
+
+        mapping[column] = exact[column]
+        mapping[f'{column}_CONFIDENCE'] = exact['CONFIDENCE']
+        mapping[f'{column}_SUPPORT'] = exact['SUPPORT'].fillna(0).astype(int)
+        mapping[f'{column}_METHOD'] = method
+        mapping[f'{column}_SOURCE_MAJOR'] = source
+    return mapping
+
+
+def impute_unknowns(data, mapping, min_confidence=0.5):
+    """Fill 'Unknown' DEPARTMENT/COLLEGE in place and add *_IMPUTED flags."""
+    codes = pd.Categorical(data['MAJOR'], categories=mapping.index).codes
+    found = codes >= 0
+    for column in IMPUTED_COLUMNS:
+        values = mapping[column].to_numpy(dtype=object)
+        confidence = mapping[f'{column}_CONFIDENCE'].fillna(0).to_numpy()
+        usable = found & (confidence[codes] >= min_confidence) & pd.notna(values[codes])
+        imputed = usable & (data[column] == UNKNOWN).to_numpy()
+        data.loc[imputed, column] = values[codes[imputed]]
+        data[f'{column}_IMPUTED'] = imputed
+    return data
@@ -0,0 +1,110 @@
+"""Simulate concurrent dashboard sessions and report latency and memory.
+
+Each simulated session runs the dashboard script with Streamlit's AppTest
+harness, then clicks through random semester selections. All sessions
+share one process, so they share the cached dataset exactly as sessions
+on one server do. Every run is checked for an exception; failed runs are
+counted in the summary and left out of the latencies.
+
+    python -m slcc.loadtest --sessions 20 --clicks 10
+"""
+import argparse
+import os
+import random
+import resource
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'SLCC_dashboard.py')
+
+
+def _rss_mb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+
+def _peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_session(clicks, seed, timeout=120):
+    """One session: initial page load plus `clicks` filter changes.
+
+    Returns the first load's latency (None if it failed), the latencies of
+    the clicks that ran cleanly, in seconds, and a message per failed run.
+    A session whose first load fails makes no clicks.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    app = AppTest.from_file(SCRIPT, default_timeout=timeout)
+    clicked, failures = [], []
+
+    start = time.perf_counter()
+    app.run()
+    first_load = time.perf_counter() - start
+    if app.exception:
+        return None, clicked, [f"first load: {app.exception[0].value}"]
+
+    for _ in range(clicks):
+        semester_box = app.sidebar.selectbox[0]
+        semester = rng.choice(semester_box.options)
+        start = time.perf_counter()
+        semester_box.select(semester).run()
+        latency = time.perf_counter() - start
+        if app.exception:
+            failures.append(f"{semester}: {app.exception[0].value}")
+        else:
+            clicked.append(latency)
+    return first_load, clicked, failures
+
+
+def load_test(sessions, clicks, seed=0):
+    """Run `sessions` concurrent sessions; returns a latency and memory summary and the failures."""
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda i: run_session(clicks, seed + i), range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    first_loads = np.array([first_load for first_load, _, _ in results if first_load is not None])
+    interactions = np.array([latency for _, clicked, _ in results for latency in clicked])
+    failures = [failure for _, _, session_failures in results for failure in session_failures]
+    summary = {
+        'sessions': sessions,
+        'failed_sessions': sum(1 for _, _, session_failures in results if session_failures),
+        'failed_runs': len(failures),
+        'interactions': len(interactions),
+        'wall_seconds': elapsed,
+        'rss_before_mb': rss_before,
+        'rss_after_mb': _rss_mb(),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+    if len(first_loads):
+        summary['first_load_p50_ms'] = np.percentile(first_loads, 50) * 1000
+    if len(interactions):
+        for p in (50, 90, 99):
+            summary[f'click_p{p}_ms'] = np.percentile(interactions, p) * 1000
+    return summary, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the dashboard with simulated concurrent sessions.")
+    parser.add_argument('--sessions', type=int, default=10)
+    parser.add_argument('--clicks', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    summary, failures = load_test(args.sessions, args.clicks, args.seed)
+    for key, value in summary.items():
+        print(f"{key:>20}: {value:,.1f}" if isinstance(value, float) else f"{key:>20}: {value:,}")
+    for failure in sorted(set(failures))[:10]:
+        print(f"failed: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Bounded LRU of computed dashboard sections, shared across sessions.
+
+The dashboard keeps one ``SectionMemo`` per server process and asks it for
+each section's frames and figures by section name and filter state (data
+version, semester and the widget values the page reads). Users mostly
+move between a handful of filter combinations, so a repeat skips the
+section's groupbys and figure building and only renders. Results are shared
+between sessions and must not be modified by the caller.
+
+Hits and misses are counted per section for the sidebar diagnostics.
+"""
+import threading
+from collections import Counter, OrderedDict
+
+import pandas as pd
+
+# Section results kept, across all filter combinations
+MEMO_SIZE = 256
+
+
+class SectionMemo:
+    """LRU of (section, *filter state) -> result, with hit/miss counters."""
+
+    def __init__(self, size=MEMO_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = Counter()
+        self.misses = Counter()
+        self._lock = threading.Lock()
+
+    def get(self, section, state, compute):
+        """The memoized result of `compute()` for `section` under `state`."""
+        key = (section, *state)
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits[section] += 1
+                return self.entries[key]
+            self.misses[section] += 1
+        # Computed outside the lock; two sessions missing together both
+        # compute, and the later result replaces the earlier
+        result = compute()
+        with self._lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+    def stats(self):
+        """Hits, misses and hit rate per section, busiest first."""
+        with self._lock:
+            sections = sorted(set(self.hits) | set(self.misses))
+            frame = pd.DataFrame({
+                'SECTION': sections,
+                'HITS': [self.hits[section] for section in sections],
+                'MISSES': [self.misses[section] for section in sections],
+            })
+        frame['HIT_RATE'] = frame['HITS'] / (frame['HITS'] + frame['MISSES'])
+        return frame.sort_values(['HITS', 'MISSES'], ascending=False, ignore_index=True)
@@ -0,0 +1,172 @@
+"""Graduation outcome model trained offline and scored in batches.
+
+A scikit-learn pipeline (imputation, one-hot encoding and a classifier)
+is fit on applications with a known GRADUATED_IND and saved with joblib.
+Scoring runs ``predict_proba`` over a whole frame at once; the dashboard
+caches the result per source version and model file, so nothing is
+scored while a page renders.
+
+Gender, race and ethnicity are deliberately not features: the risk list
+is used to target outreach, and the Equity Analysis section already
+reports outcome gaps by those groups.
+
+    python -m slcc.model train                  # fit, evaluate and save
+    python -m slcc.model train --kind boosting
+    python -m slcc.model score --out scores.csv
+"""
+import argparse
+import os
+from datetime import datetime
+
+import pandas as pd
+
+MODEL_PATH = os.path.join('models', 'graduation_model.joblib')
+
+NUMERIC_FEATURES = ['TOTAL_CREDITS', 'REQUIRED_HOURS', 'CREDIT_RATIO', 'OVERALL_GPA', 'TRANSFER_CREDITS']
+CATEGORICAL_FEATURES = [
+    'DEGREE_TYPE', 'COLLEGE', 'FULLY_ONLINE_IND', 'AID_ELIGIBLE_IND', 'EVER_CONCURRENT_IND', 'EVER_PELL_ELIGIBLE_IND',
+]
+
+# Predicted graduation probability below which an application is at risk
+RISK_THRESHOLD = 0.5
+
+SCORE_COLUMNS = ['GRAD_PROBABILITY', 'AT_RISK']
+
+
+def features(data):
+    """Model input columns derived from the prepared dashboard data."""
+    frame = data[[column for column in NUMERIC_FEATURES + CATEGORICAL_FEATURES if column in data]].copy()
+    frame['CREDIT_RATIO'] = data['TOTAL_CREDITS'] / data['REQUIRED_HOURS'].where(data['REQUIRED_HOURS'] > 0)
+    frame[CATEGORICAL_FEATURES] = frame[CATEGORICAL_FEATURES].astype(object).where(frame[CATEGORICAL_FEATURES].notna(), 'Missing')
+    return frame[NUMERIC_FEATURES + CATEGORICAL_FEATURES]
+
+
+def build_pipeline(kind='logistic'):
+    # scikit-learn is only needed by processes that train or score
+    from sklearn.compose import ColumnTransformer
+    from sklearn.ensemble import HistGradientBoostingClassifier
+    from sklearn.impute import SimpleImputer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    if kind == 'logistic':
+        classifier = LogisticRegression(max_iter=1000)
+    elif kind == 'boosting':
+        classifier = HistGradientBoostingClassifier(max_iter=200, learning_rate=0.05)
+    else:
+        raise ValueError(f"Unknown model kind: {kind}")
+
+    preprocess = ColumnTransformer([
+        ('numeric', make_pipeline(SimpleImputer(strategy='median', add_indicator=True), StandardScaler()), NUMERIC_FEATURES),
+        ('categorical', OneHotEncoder(handle_unknown='infrequent_if_exist', min_frequency=10, sparse_output=False), CATEGORICAL_FEATURES),
+    ])
+    return make_pipeline(preprocess, classifier)
+
+
+def labeled(data):
+    """Applications with a known outcome, and their 0/1 labels."""
+    known = data[data['GRADUATED_IND'].isin(['Y', 'N'])]
+    return known, (known['GRADUATED_IND'] == 'Y').to_numpy(dtype=int)
+
+
+def train(data, kind='logistic', test_size=0.25, random_state=0):
+    """Fit on a stratified split, report holdout metrics, then refit on everything."""
+    from sklearn.metrics import accuracy_score, roc_auc_score
+    from sklearn.model_selection import train_test_split
+
+    known, y = labeled(data)
+    X = features(known)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, stratify=y, random_state=random_state)
+    holdout = build_pipeline(kind).fit(X_train, y_train)
+    probability = holdout.predict_proba(X_test)[:, 1]
+    metrics = {
+        'auc': float(roc_auc_score(y_test, probability)),
+        'accuracy': float(accuracy_score(y_test, probability >= RISK_THRESHOLD)),
+        'base_rate': float(y.mean()),
+        'train_records': len(X_train),
+        'test_records': len(X_test),
+    }
+    return {
+        'pipeline': build_pipeline(kind).fit(X, y),
+        'kind': kind,
+        'trained_at': datetime.now().isoformat(timespec='seconds'),
+        'metrics': metrics,
+    }
+
+
+def save(model, path=MODEL_PATH):
+    import joblib
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    joblib.dump(model, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load(path=MODEL_PATH):
+    """The saved model, or None if none has been trained."""
+    import joblib
+
+    if not os.path.exists(path):
+        return None
+    return joblib.load(path)
+
+
+def model_stamp(path=MODEL_PATH):
+    """Changes whenever the saved model is replaced; None if there is none."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def score(model, data):
+    """Graduation probability and risk flag for every row of `data`, in one batch."""
+    probability = model['pipeline'].predict_proba(features(data))[:, 1]
+    return pd.DataFrame({
+        'GRAD_PROBABILITY': probability,
+        'AT_RISK': probability < RISK_THRESHOLD,
+    }, index=data.index)
+
+
+def pending(data):
+    """Applications without a recorded outcome yet."""
+    return data['GRADUATED_IND'].isna() | ~data['GRADUATED_IND'].isin(['Y', 'N'])
+
+
+def main(argv=None):
+    from slcc import worker
+
+    parser = argparse.ArgumentParser(description="Train or batch-score the graduation outcome model.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    train_parser = commands.add_parser('train', help="fit on applications with known outcomes and save")
+    train_parser.add_argument('--kind', choices=['logistic', 'boosting'], default='logistic')
+    score_parser = commands.add_parser('score', help="score every application with the saved model")
+    score_parser.add_argument('--out', required=True, help="CSV or Parquet file to write")
+    for sub in (train_parser, score_parser):
+        sub.add_argument('--model', default=MODEL_PATH, help="model file (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    dashboard_data = worker.load_prepared()[2]
+    if args.command == 'train':
+        model = train(dashboard_data, args.kind)
+        save(model, args.model)
+        print(f"Saved {args.kind} model to {args.model}")
+        for name, value in model['metrics'].items():
+            print(f"  {name}: {value:.3f}" if isinstance(value, float) else f"  {name}: {value}")
+        return
+
+    model = load(args.model)
+    if model is None:
+        parser.error(f"No model at {args.model}; run `python -m slcc.model train` first")
+    scores = dashboard_data[['STUDENT_ID', 'SEMESTER', 'MAJOR', 'DEPARTMENT', 'COLLEGE', 'GRADUATED_IND']].join(score(model, dashboard_data))
+    if args.out.endswith('.parquet'):
+        scores.to_parquet(args.out, index=False)
+    else:
+        scores.to_csv(args.out, index=False)
+    print(f"Scored {len(scores):,} applications ({int(scores['AT_RISK'].sum()):,} at risk) -> {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""Term-partitioned Parquet store for multi-year extracts.
+
+Graduation records are written under one directory per term
+(``graduations/SEMESTER=Spring 2021/``) so a selection of terms only opens
+the matching files. Student extracts are stored one file per load and
+read back filtered to the students referenced by the selected terms; a
+student in several loads is taken from the latest one. Files are named by
+a hash of the extract pair, so ingesting the same pair again adds nothing.
+
+Ingest new extracts with:
+
+    python -m slcc.partitions Graduations.csv Students.csv --store term_store
+"""
+import argparse
+import hashlib
+import os
+from urllib.parse import unquote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from slcc.pipeline import semester_labels, term_counts, term_sort_key
+from slcc.schema import read_graduations, read_students
+
+STORE_DIR = 'term_store'
+
+# Load time stamped on each stored student row
+LOADED_AT = 'LOADED_AT'
+
+
+# pyarrow.dataset is imported on first use: most processes never open a
+# store, and has_store/list_terms only look at directory names
+def _partitioning():
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(pa.schema([('SEMESTER', pa.string())]), flavor='hive')
+
+
+def _graduations_path(store):
+    return os.path.join(store, 'graduations')
+
+
+def _students_path(store):
+    return os.path.join(store, 'students')
+
+
+def has_store(store=STORE_DIR):
+    return os.path.isdir(_graduations_path(store))
+
+
+def load_id(graduation, students):
+    """Content hash of an extract pair, naming the files it is stored in."""
+    digest = hashlib.sha256()
+    for frame in (graduation, students):
+        digest.update(','.join(frame.columns).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:32]
+
+
+def ingest(graduation, students, store=STORE_DIR):
+    """Add one pair of extracts to the store, partitioned by term.
+
+    A pair already in the store is skipped. Students are written last, so a
+    load interrupted part way is completed by ingesting the pair again.
+    """
+    load = load_id(graduation, students)
+    students_file = os.path.join(_students_path(store), f'students-{load}.parquet')
+    graduation = graduation.copy()
+    graduation['GRADUATION_DATE'] = pd.to_datetime(graduation['GRADUATION_DATE'])
+    graduation['GRAD_APPL_DATE'] = pd.to_datetime(graduation['GRAD_APPL_DATE'])
+    graduation['SEMESTER'] = semester_labels(graduation['GRADUATION_DATE'])
+
+    terms = sorted(graduation['SEMESTER'].unique(), key=term_sort_key)
+    if os.path.exists(students_file):
+        return terms
+
+    import pyarrow.dataset as ds
+
+    ds.write_dataset(
+        pa.Table.from_pandas(graduation, preserve_index=False),
+        _graduations_path(store),
+        format='parquet',
+        partitioning=_partitioning(),
+        basename_template=f'part-{load}-{{i}}.parquet',
+        existing_data_behavior='overwrite_or_ignore',
+    )
+
+    os.makedirs(_students_path(store), exist_ok=True)
+    students = students.assign(**{LOADED_AT: pd.Timestamp.now()})
+    pq.write_table(pa.Table.from_pandas(students, preserve_index=False), students_file)
+    return terms
+
+
+def list_terms(store=STORE_DIR):
+    """Terms present in the store, read from the directory names only."""
+    prefix = 'SEMESTER='
+    terms = [
+        unquote(name[len(prefix):]) for name in os.listdir(_graduations_path(store))
+        if name.startswith(prefix)
+    ]
+    return sorted(terms, key=term_sort_key)
+
+
+def _graduation_dataset(store):
+    import pyarrow.dataset as ds
+
+    return ds.dataset(_graduations_path(store), format='parquet', partitioning=_partitioning())
+
+
+def read_terms(terms=None, store=STORE_DIR):
+    """Read graduation and student records for the given terms (all if None).
+
+    The term filter is applied to the partition key, so files for other
+    terms are never opened; students are filtered by ID at scan time.
+    """
+    import pyarrow.dataset as ds
+
+    graduation_ds = _graduation_dataset(store)
+    row_filter = None if terms is None else pc.field('SEMESTER').isin(list(terms))
+    graduation_table = graduation_ds.to_table(filter=row_filter)
+    graduation = graduation_table.drop_columns(['SEMESTER']).to_pandas()
+
+    student_ds = ds.dataset(_students_path(store), format='parquet')
+    student_ids = pc.unique(graduation_table['STUDENT_ID'].drop_null())
+    students = student_ds.to_table(filter=pc.field('STUDENT_ID').isin(student_ids)).to_pandas()
+    # The same student appears in every yearly extract they were enrolled
+    # for, with their attributes as of that load; keep their latest load.
+    # Repeats within one load are left for the pipeline to flag
+    loaded = students.pop(LOADED_AT)
+    latest = loaded.groupby(students['STUDENT_ID']).transform('max')
+    students = students[loaded == latest].drop_duplicates(ignore_index=True)
+    return graduation, students
+
+
+def term_summary(store=STORE_DIR):
+    """Application and graduation counts per term, reading only two columns."""
+    table = _graduation_dataset(store).to_table(columns=['SEMESTER', 'GRADUATED_IND'])
+    return term_counts(table.to_pandas())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Add a Graduations/Students extract pair to the term store.")
+    parser.add_argument('graduations', help="Graduations CSV extract")
+    parser.add_argument('students', help="Students CSV extract")
+    parser.add_argument('--store', default=STORE_DIR, help="Store directory (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    terms = ingest(read_graduations(args.graduations), read_students(args.students), args.store)
+    print(f"Ingested terms: {', '.join(terms)}")
+
+
+if __name__ == '__main__':
+    main()
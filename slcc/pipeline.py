@@ -0,0 +1,134 @@
+"""Load-time preparation of the graduation and student extracts."""
+import numpy as np
+import pandas as pd
+
+from slcc.anomalies import flag_anomalies, major_norms
+from slcc.equity import equity_sums
+from slcc.flows import transition_counts
+from slcc.imputation import build_major_mapping, impute_unknowns
+from slcc.reconcile import reconcile_ids
+
+# Commencement months and the season each one closes
+TERM_MONTHS = {5: 'Spring', 8: 'Summer', 12: 'Fall'}
+SEASON_ORDER = ['Spring', 'Summer', 'Fall']
+
+
+def semester_labels(dates):
+    """Label graduation dates with their term, e.g. 'Spring 2021'."""
+    season = dates.dt.month.map(TERM_MONTHS)
+    year = dates.dt.year.astype('Int64').astype(str)
+    return (season + ' ' + year).where(season.notna(), 'Other')
+
+
+def term_sort_key(term):
+    """Chronological sort key for term labels; 'Other' sorts last."""
+    season, _, year = term.partition(' ')
+    if season not in SEASON_ORDER:
+        return (np.inf, len(SEASON_ORDER))
+    return (int(year), SEASON_ORDER.index(season))
+
+
+def term_counts(data):
+    """Applications and graduations per term, in chronological order."""
+    graduated = data['GRADUATED_IND'].eq('Y')
+    counts = graduated.groupby(data['SEMESTER']).agg(['size', 'sum'])
+    counts.columns = ['APPLICATIONS', 'GRADUATED']
+    counts['GRAD_RATE'] = counts['GRADUATED'] / counts['APPLICATIONS']
+    counts = counts.loc[sorted(counts.index, key=term_sort_key)]
+    return counts.rename_axis('SEMESTER').reset_index()
+
+
+def load_extracts(terms=None):
+    """Read the student and graduation extracts from the configured source.
+
+    Sources that can filter by term (a term store, a SQL database) read
+    only the given terms; the CSV pair is always read in full. See
+    ``slcc.storage``.
+    """
+    from slcc import storage
+
+    return storage.default_source().read(terms)
+
+
+def prepare(students, graduation):
+    """Merge the extracts and derive the semester and quality flag columns."""
+    # Date conversions
+    graduation['GRADUATION_DATE'] = pd.to_datetime(graduation['GRADUATION_DATE'])
+    graduation['GRAD_APPL_DATE'] = pd.to_datetime(graduation['GRAD_APPL_DATE'])
+
+    # Merge data
+    dashboard_data = graduation.merge(students, on="STUDENT_ID", how='left')
+
+    # Create quality columns
+    dashboard_data['ILLOGICAL_DATES'] = dashboard_data['GRAD_APPL_DATE'] > dashboard_data['GRADUATION_DATE']
+    dashboard_data['BELOW_CREDITS'] = (
+        (dashboard_data['TOTAL_CREDITS'] < dashboard_data['REQUIRED_HOURS']) & (dashboard_data['GRADUATED_IND'] == 'Y')
+    )
+    dashboard_data['MISSING_STUDENT_INFO'] = dashboard_data['STUDENT_ID'].isnull()
+    dashboard_data['UNKNOWN_DEPARTMENT'] = dashboard_data['DEPARTMENT'] == 'Unknown'
+    dashboard_data['UNKNOWN_COLLEGE'] = dashboard_data['COLLEGE'] == 'Unknown'
+    dashboard_data['HAS_UNKNOWN_VALUES'] = dashboard_data['UNKNOWN_DEPARTMENT'] | dashboard_data['UNKNOWN_COLLEGE']
+
+    # Recover unknown department/college from MAJOR; the UNKNOWN_* flags
+    # above keep describing the raw extract
+    major_mapping = build_major_mapping(dashboard_data)
+    impute_unknowns(dashboard_data, major_mapping)
+
+    # GPA/credit outliers against each major's median and MAD, and
+    # missing or inconsistent REQUIRED_HOURS
+    flag_anomalies(dashboard_data)
+
+    # Check for duplicates and unmatched students
+    grad_duplicates = graduation[graduation.duplicated(keep=False)]
+    grad_duplicate_student_ids = graduation[graduation['STUDENT_ID'].duplicated(keep=False)]
+    student_duplicates = students[students.duplicated(keep=False)]
+    student_duplicate_ids = students[students['STUDENT_ID'].duplicated(keep=False)]
+
+    # Find students in graduation table but not in students table
+    unmatched_students = graduation[~graduation['STUDENT_ID'].isin(students['STUDENT_ID'])]
+
+    # Add semester
+    dashboard_data['SEMESTER'] = semester_labels(dashboard_data['GRADUATION_DATE'])
+
+    return students, graduation, dashboard_data, grad_duplicates, grad_duplicate_student_ids, student_duplicates, student_duplicate_ids, unmatched_students, major_mapping
+
+
+def missing_profile(frame):
+    """Missing-value count and share for each column that has any."""
+    nulls = frame.isnull().sum()
+    profile = pd.DataFrame({
+        'Column': nulls.index,
+        'Missing Count': nulls.values,
+        'Missing %': (nulls.values / len(frame) * 100).round(2)
+    })
+    return profile[profile['Missing Count'] > 0].reset_index(drop=True)
+
+
+def quality_summary(prepared):
+    """Record count per data quality issue, as exported to quality_issues_summary.csv."""
+    dashboard_data, unmatched_students = prepared[2], prepared[7]
+    return pd.DataFrame({
+        'Issue Type': ['Illogical Dates', 'Unmatched Students', 'Below Required Credits', 'Missing Student IDs'],
+        'Record Count': [
+            int(dashboard_data['ILLOGICAL_DATES'].sum()),
+            len(unmatched_students),
+            int(dashboard_data['BELOW_CREDITS'].sum()),
+            int(dashboard_data['MISSING_STUDENT_INFO'].sum()),
+        ]
+    })
+
+
+def build_aggregates(prepared):
+    """Aggregates derived from a `prepare` result, shared by every consumer."""
+    students, graduation, dashboard_data, *_, unmatched_students, major_mapping = prepared
+    return {
+        'equity': equity_sums(dashboard_data),
+        'id_candidates': reconcile_ids(unmatched_students, students),
+        'term_summary': term_counts(dashboard_data),
+        'major_norms': major_norms(dashboard_data),
+        'transitions': transition_counts(dashboard_data),
+        'profiles': {
+            'graduation': missing_profile(graduation),
+            'students': missing_profile(students),
+        },
+    }
@@ -0,0 +1,148 @@
+"""Run-by-run history of data quality rule results.
+
+Each published version of the data is recorded once: its per-rule counts
+are appended to ``rule_counts.csv``, one row per (run, rule), so adding a
+rule never changes the file's columns. The keys of every flagged
+graduation record are saved too, per rule, as sorted uint64 arrays in a
+compressed ``.npz`` file. Diffs between runs are
+sorted-array set differences, so comparing runs never touches the source
+data.
+
+The background worker records every version it publishes; record the
+current sources' version from the shell with ``python -m slcc.quality_history``.
+"""
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+HISTORY_DIR = 'quality_history'
+
+# Rule columns on the prepared dashboard data and their display names
+QUALITY_RULES = {
+    'ILLOGICAL_DATES': 'Illogical Dates',
+    'BELOW_CREDITS': 'Below Required Credits',
+    'MISSING_STUDENT_INFO': 'Missing Student Info',
+    'UNKNOWN_DEPARTMENT': 'Unknown Department',
+    'UNKNOWN_COLLEGE': 'Unknown College',
+    'UNMATCHED_STUDENTS': 'Unmatched Students',
+    'HAS_ANOMALY': 'Numeric Anomalies',
+}
+
+RUN_COLUMNS = ['RUN_ID', 'RUN_AT', 'VERSION', 'RECORDS']
+COUNT_COLUMNS = [*RUN_COLUMNS, 'RULE', 'COUNT']
+
+# Columns identifying a graduation application across extracts
+KEY_COLUMNS = ['STUDENT_ID', 'GRAD_APPL_DATE', 'GRADUATION_DATE', 'DEGREE_TYPE', 'MAJOR']
+
+
+def record_keys(data):
+    """Stable 64-bit hash per application, independent of how columns were typed."""
+    keys = data[KEY_COLUMNS].astype({
+        'STUDENT_ID': 'Int64',
+        'GRAD_APPL_DATE': 'datetime64[s]',
+        'GRADUATION_DATE': 'datetime64[s]',
+    })
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+
+
+def rule_masks(dashboard_data, students):
+    masks = {rule: dashboard_data[rule].to_numpy(dtype=bool) for rule in QUALITY_RULES if rule in dashboard_data}
+    masks['UNMATCHED_STUDENTS'] = ~dashboard_data['STUDENT_ID'].isin(students['STUDENT_ID']).to_numpy()
+    return masks
+
+
+def _counts_path(history_dir):
+    return os.path.join(history_dir, 'rule_counts.csv')
+
+
+def _keys_path(history_dir, run_id):
+    return os.path.join(history_dir, f'run-{run_id}.npz')
+
+
+def recorded_run(version, history_dir=HISTORY_DIR):
+    """The run id `version` was recorded under, or None."""
+    if not os.path.exists(_counts_path(history_dir)):
+        return None
+    runs = pd.read_csv(_counts_path(history_dir), usecols=['RUN_ID', 'VERSION'], dtype=str)
+    matches = runs.loc[runs['VERSION'] == version, 'RUN_ID']
+    return matches.iloc[0] if len(matches) else None
+
+
+def record_run(dashboard_data, students, version, history_dir=HISTORY_DIR, run_at=None):
+    """Append one version's counts and flagged keys to the history; returns the run id.
+
+    A version already in the history is not recorded again; its existing
+    run id is returned.
+    """
+    existing = recorded_run(version, history_dir)
+    if existing is not None:
+        return existing
+    run_at = run_at or datetime.now()
+    run_id = run_at.strftime('%Y%m%dT%H%M%S%f')
+    keys = record_keys(dashboard_data)
+    masks = rule_masks(dashboard_data, students)
+    flagged = {rule: np.unique(keys[mask]) for rule, mask in masks.items()}
+
+    os.makedirs(history_dir, exist_ok=True)
+    np.savez_compressed(_keys_path(history_dir, run_id), **flagged)
+
+    counts = pd.DataFrame({
+        'RUN_ID': run_id,
+        'RUN_AT': run_at.isoformat(timespec='seconds'),
+        'VERSION': version,
+        'RECORDS': len(dashboard_data),
+        'RULE': list(masks),
+        'COUNT': [int(mask.sum()) for mask in masks.values()],
+    })
+    counts_path = _counts_path(history_dir)
+    counts.to_csv(counts_path, mode='a', header=not os.path.exists(counts_path), index=False)
+    return run_id
+
+
+def load_history(history_dir=HISTORY_DIR):
+    """All recorded runs with a count column per rule, oldest first; empty if none."""
+    if not os.path.exists(_counts_path(history_dir)):
+        return pd.DataFrame(columns=[*RUN_COLUMNS, *QUALITY_RULES])
+
+    counts = pd.read_csv(_counts_path(history_dir), dtype={'RUN_ID': str, 'VERSION': str})
+    history = counts.pivot(index=RUN_COLUMNS, columns='RULE', values='COUNT')
+    rules = [rule for rule in QUALITY_RULES if rule in history] + [rule for rule in history if rule not in QUALITY_RULES]
+    history = history[rules].astype('Int64').rename_axis(columns=None).reset_index()
+    history['RUN_AT'] = pd.to_datetime(history['RUN_AT'])
+    return history.sort_values('RUN_ID', ignore_index=True)
+
+
+def diff_runs(old_run_id, new_run_id, history_dir=HISTORY_DIR):
+    """Per rule, how many records were newly flagged, resolved or still flagged."""
+    with np.load(_keys_path(history_dir, old_run_id)) as old, np.load(_keys_path(history_dir, new_run_id)) as new:
+        rows = []
+        for rule in QUALITY_RULES:
+            before = old[rule] if rule in old else np.array([], dtype=np.uint64)
+            after = new[rule] if rule in new else np.array([], dtype=np.uint64)
+            rows.append({
+                'RULE': rule,
+                'NEWLY_FLAGGED': len(np.setdiff1d(after, before, assume_unique=True)),
+                'RESOLVED': len(np.setdiff1d(before, after, assume_unique=True)),
+                'STILL_FLAGGED': len(np.intersect1d(before, after, assume_unique=True)),
+            })
+    return pd.DataFrame(rows)
+
+
+def main():
+    from slcc import worker
+
+    version = worker.ensure_version()
+    run_id = worker.record_quality(version)
+    if run_id is None:
+        print(f"Version {version} is already recorded as run {recorded_run(version)}")
+        return
+    history = load_history()
+    print(f"Recorded quality run {run_id}")
+    if len(history) > 1:
+        print(diff_runs(history['RUN_ID'].iloc[-2], run_id).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
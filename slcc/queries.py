@@ -0,0 +1,133 @@
+"""Named aggregate queries shared by the dashboard and the JSON API.
+
+Each function takes a connection from ``slcc.sql.connect``, the selected
+semester ('All' for no filter) and optionally a college, and returns a
+DataFrame. Counts are passed through ``slcc.disclosure.protect``, so small
+cells are withheld before anything is rendered or served.
+"""
+from slcc.disclosure import protect, protect_counts
+from slcc.sql import query
+
+# Quality flag columns on dashboard_data and their display names
+QUALITY_FLAGS = {
+    'ILLOGICAL_DATES': 'Illogical Dates',
+    'BELOW_CREDITS': 'Below Required Credits',
+    'MISSING_STUDENT_INFO': 'Missing Student Info',
+    'HAS_UNKNOWN_VALUES': 'Unknown Dept/College',
+}
+
+
+def semester_filter(semester, college=None):
+    """SQL WHERE clause and parameters selecting one semester and/or college."""
+    conditions, params = [], {}
+    if semester != 'All':
+        conditions.append("SEMESTER = $semester")
+        params['semester'] = semester
+    if college is not None:
+        conditions.append("COLLEGE = $college")
+        params['college'] = college
+    return ("WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+
+def overview(con, semester='All', college=None):
+    where, params = semester_filter(semester, college)
+    counts = query(con, f"""
+        SELECT count(*) AS applications,
+               count(*) FILTER (WHERE GRADUATED_IND = 'Y') AS graduated,
+               count(*) FILTER (WHERE GRADUATED_IND = 'N') AS not_graduated,
+               avg(OVERALL_GPA) AS avg_gpa,
+               avg(TOTAL_CREDITS) AS avg_credits
+        FROM dashboard_data {where}
+    """, params)
+    # Graduated and not graduated add up to the applications shown with them
+    return protect(counts, [], ['applications', 'graduated', 'not_graduated'],
+                   {'graduated': ['not_graduated'], 'not_graduated': ['graduated'],
+                    'avg_gpa': ['applications'], 'avg_credits': ['applications']})
+
+
+def degree_summary(con, semester='All', college=None):
+    where, params = semester_filter(semester, college)
+    counts = query(con, f"""
+        SELECT DEGREE_TYPE, GRADUATED_IND, count(*) AS count
+        FROM dashboard_data {where}
+        GROUP BY DEGREE_TYPE, GRADUATED_IND
+    """, params)
+    return protect(counts, ['DEGREE_TYPE', 'GRADUATED_IND'])
+
+
+def major_summary(con, semester='All', top=10, college=None):
+    """Graduation status breakdown for the `top` majors by applications."""
+    where, params = semester_filter(semester, college)
+    counts = query(con, f"""
+        WITH filtered AS (SELECT MAJOR, GRADUATED_IND FROM dashboard_data {where}),
+        top_majors AS (
+            SELECT MAJOR FROM filtered GROUP BY MAJOR ORDER BY count(*) DESC LIMIT {int(top)}
+        )
+        SELECT MAJOR, GRADUATED_IND, count(*) AS count
+        FROM filtered SEMI JOIN top_majors USING (MAJOR)
+        GROUP BY MAJOR, GRADUATED_IND
+    """, params)
+    return protect(counts, ['MAJOR', 'GRADUATED_IND'])
+
+
+def semester_summary(con, semester='All', college=None):
+    where, params = semester_filter(semester, college)
+    counts = query(con, f"""
+        SELECT SEMESTER, GRADUATED_IND, count(*) AS count
+        FROM dashboard_data {where}
+        GROUP BY SEMESTER, GRADUATED_IND
+    """, params)
+    return protect(counts, ['SEMESTER', 'GRADUATED_IND'])
+
+
+def top_counts(con, column, semester='All', top=10, college=None):
+    """Applications per value of `column`, largest first."""
+    if column not in ('MAJOR', 'DEPARTMENT', 'COLLEGE', 'DEGREE_TYPE'):
+        raise ValueError(f"Unsupported breakdown column: {column}")
+    where, params = semester_filter(semester, college)
+    counts = query(con, f"""
+        SELECT {column}, count(*) AS count
+        FROM dashboard_data {where}
+        GROUP BY {column} ORDER BY count DESC LIMIT {int(top)}
+    """, params)
+    return protect(counts, [column])
+
+
+def group_counts(con, column, semester='All', college=None):
+    """Applications per value of `column`, unsorted, as a Series (for slcc.topn)."""
+    if column not in ('MAJOR', 'DEPARTMENT', 'COLLEGE', 'DEGREE_TYPE'):
+        raise ValueError(f"Unsupported breakdown column: {column}")
+    where, params = semester_filter(semester, college)
+    counts = query(con, f"SELECT {column}, count(*) AS count FROM dashboard_data {where} GROUP BY {column}", params)
+    return protect_counts(counts.set_index(column)['count'])
+
+
+def distribution(con, column, semester='All', college=None, bins=30):
+    """Applications in `bins` equal-width bins of a numeric `column`, from LOW to HIGH."""
+    if column not in ('OVERALL_GPA', 'TOTAL_CREDITS'):
+        raise ValueError(f"Unsupported distribution column: {column}")
+    where, params = semester_filter(semester, college)
+    counts = query(con, f"""
+        WITH filtered AS (SELECT {column} AS value FROM dashboard_data {where}),
+        bounds AS (SELECT min(value) AS low, max(value) AS high FROM filtered)
+        SELECT coalesce(least(floor((value - low) / nullif(high - low, 0) * {int(bins)}), {int(bins) - 1}), 0) AS bin,
+               any_value(low) AS low, any_value(high) AS high, count(*) AS count
+        FROM filtered, bounds
+        WHERE value IS NOT NULL
+        GROUP BY bin ORDER BY bin
+    """, params)
+    width = (counts['high'] - counts['low']) / int(bins)
+    counts['LOW'] = counts['low'] + counts['bin'] * width
+    counts['HIGH'] = counts['LOW'] + width
+    return protect(counts[['LOW', 'HIGH', 'count']], ['LOW'])
+
+
+def quality_counts(con, semester='All', college=None):
+    """Record counts per quality flag, plus unmatched graduation records."""
+    where, params = semester_filter(semester, college)
+    flag_sums = ",\n".join(f"count(*) FILTER (WHERE {flag}) AS {flag}" for flag in QUALITY_FLAGS)
+    counts = query(con, f"SELECT {flag_sums} FROM dashboard_data {where}", params)
+    counts['UNMATCHED_STUDENTS'] = query(con, f"""
+        SELECT count(*) AS unmatched FROM dashboard_data ANTI JOIN students USING (STUDENT_ID) {where}
+    """, params)['unmatched']
+    return counts
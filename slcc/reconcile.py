@@ -0,0 +1,107 @@
+"""Candidate matches for graduation STUDENT_IDs missing from Students.csv.
+
+IDs are normalized to zero-padded strings so float, int and text exports
+compare equal. Candidates come from a symmetric single-deletion index:
+every ID on both sides is expanded into the strings obtained by deleting
+one digit, and the two expansions are hash-joined. Any two IDs one
+substitution, adjacent transposition or dropped digit apart share a
+deletion variant, so the join finds them without comparing all pairs.
+"""
+import pandas as pd
+
+# Base score per kind of keying error, most to least likely
+MATCH_SCORES = {
+    'transposition': 0.9,
+    'adjacent digit': 0.85,
+    'substitution': 0.75,
+    'dropped digit': 0.7,
+}
+
+# Score multiplier when the student first enrolled after applying to graduate
+IMPLAUSIBLE_ENROLLMENT = 0.5
+
+CANDIDATE_COLUMNS = ['STUDENT_ID', 'CANDIDATE_STUDENT_ID', 'MATCH_TYPE', 'SCORE', 'CANDIDATES', 'RANK',
+                     'MAJOR', 'GRAD_APPL_DATE', 'FIRST_ENROLLED']
+
+
+def normalize_ids(values, width):
+    """Zero-padded string IDs; missing or non-numeric IDs become None."""
+    numeric = pd.to_numeric(values, errors='coerce')
+    normalized = pd.Series(None, index=values.index, dtype=object)
+    present = numeric.notna()
+    normalized[present] = numeric[present].astype('int64').astype(str).str.zfill(width)
+    return normalized
+
+
+def _deletion_variants(ids):
+    """One row per (ID, ID with one digit deleted)."""
+    ids = ids.dropna().drop_duplicates()
+    if ids.empty:
+        return pd.DataFrame({'ID': pd.Series(dtype=object), 'VARIANT': pd.Series(dtype=object)})
+    width = ids.str.len().max()
+    return pd.concat(
+        [pd.DataFrame({'ID': ids, 'VARIANT': ids.str[:i] + ids.str[i + 1:]}) for i in range(width)],
+        ignore_index=True,
+    ).drop_duplicates()
+
+
+def classify(a, b):
+    """Name the single keying error that turns ID `a` into `b`, if any."""
+    diffs = [i for i, (x, y) in enumerate(zip(a, b)) if x != y]
+    if len(diffs) == 1:
+        i = diffs[0]
+        return 'adjacent digit' if abs(int(a[i]) - int(b[i])) == 1 else 'substitution'
+    if len(diffs) == 2 and diffs[1] == diffs[0] + 1 and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]]:
+        return 'transposition'
+    # A digit dropped from one ID shifts the rest; padding restores the width
+    short, long = a.lstrip('0'), b.lstrip('0')
+    if len(short) > len(long):
+        short, long = long, short
+    if len(long) == len(short) + 1 and any(long[:i] + long[i + 1:] == short for i in range(len(long))):
+        return 'dropped digit'
+    return None
+
+
+def reconcile_ids(unmatched, students):
+    """Scored candidate student records for each unmatched graduation STUDENT_ID.
+
+    Returns one row per (unmatched ID, candidate) with the match type,
+    score, the number of candidates found for that ID and their rank.
+    Records with no STUDENT_ID at all cannot be reconciled and are skipped.
+    """
+    student_numeric = pd.to_numeric(students['STUDENT_ID'], errors='coerce')
+    unmatched = unmatched.dropna(subset=['STUDENT_ID']).drop_duplicates('STUDENT_ID')
+    if unmatched.empty or student_numeric.isna().all():
+        return pd.DataFrame(columns=CANDIDATE_COLUMNS)
+    width = len(str(int(student_numeric.max())))
+
+    grad_ids = normalize_ids(unmatched['STUDENT_ID'], width)
+    student_ids = normalize_ids(students['STUDENT_ID'], width)
+
+    pairs = _deletion_variants(grad_ids).merge(
+        _deletion_variants(student_ids), on='VARIANT', suffixes=('', '_CANDIDATE')
+    )[['ID', 'ID_CANDIDATE']].drop_duplicates()
+    pairs['MATCH_TYPE'] = [classify(a, b) for a, b in zip(pairs['ID'], pairs['ID_CANDIDATE'])]
+    pairs = pairs.dropna(subset=['MATCH_TYPE'])
+    pairs['SCORE'] = pairs['MATCH_TYPE'].map(MATCH_SCORES)
+
+    records = pd.DataFrame({
+        'STUDENT_ID': unmatched['STUDENT_ID'],
+        'ID': grad_ids,
+        'GRAD_APPL_DATE': pd.to_datetime(unmatched['GRAD_APPL_DATE']),
+        'MAJOR': unmatched['MAJOR'],
+    })
+    candidates = pd.DataFrame({
+        'ID_CANDIDATE': student_ids,
+        'CANDIDATE_STUDENT_ID': students['STUDENT_ID'],
+        'FIRST_ENROLLED': students['FIRST_ENROLLED'],
+    }).drop_duplicates('ID_CANDIDATE')
+
+    matches = records.merge(pairs, on='ID').merge(candidates, on='ID_CANDIDATE')
+    implausible = matches['FIRST_ENROLLED'] > matches['GRAD_APPL_DATE']
+    matches.loc[implausible, 'SCORE'] *= IMPLAUSIBLE_ENROLLMENT
+
+    matches = matches.sort_values(['STUDENT_ID', 'SCORE'], ascending=[True, False], kind='stable')
+    matches['CANDIDATES'] = matches.groupby('STUDENT_ID')['SCORE'].transform('size')
+    matches['RANK'] = matches.groupby('STUDENT_ID').cumcount() + 1
+    return matches[CANDIDATE_COLUMNS].reset_index(drop=True)
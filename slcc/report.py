@@ -0,0 +1,149 @@
+"""Static HTML snapshot of the dashboard's overview sections.
+
+Run with ``python -m slcc.report --out reports``. Writes ``overall.html``
+plus one report per college, each a single self-contained file (plotly.js
+is embedded) that can be emailed or printed to PDF from a browser. The
+numbers come from the same SQL aggregates as the dashboard; only those
+small frames are handed to the worker processes that render the pages.
+"""
+import argparse
+import html
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import pandas as pd
+
+from slcc import charts, queries, sql, worker
+from slcc.disclosure import SUPPRESSED_NOTE, WITHHELD, format_count
+from slcc.topn import top_n
+
+REPORT_DIR = 'reports'
+
+STYLE = """
+body { font-family: sans-serif; max-width: 1100px; margin: 2em auto; color: #222; }
+h1 { margin-bottom: 0; }
+.subtitle { color: #666; margin-top: 0.2em; }
+.metrics { display: flex; gap: 1em; margin: 1.5em 0; }
+.metric { flex: 1; border: 1px solid #ddd; border-radius: 6px; padding: 0.8em; }
+.metric .label { color: #666; font-size: 0.9em; }
+.metric .value { font-size: 1.6em; font-weight: bold; }
+table { border-collapse: collapse; }
+td, th { border-bottom: 1px solid #ddd; padding: 0.3em 1em; text-align: left; }
+td.count { text-align: right; }
+.note { color: #666; font-style: italic; }
+"""
+
+
+def colleges(con, semester='All'):
+    return queries.top_counts(con, 'COLLEGE', semester, top=1000)['COLLEGE'].dropna().tolist()
+
+
+def report_data(con, semester='All', college=None):
+    """Aggregates for one report; small enough to send to another process."""
+    return {
+        'semester': semester,
+        'college': college,
+        'overview': queries.overview(con, semester, college),
+        'degrees': queries.degree_summary(con, semester, college),
+        'majors': queries.major_summary(con, semester, top=10, college=college),
+        'semesters': queries.semester_summary(con, semester, college),
+        'departments': top_n(queries.group_counts(con, 'DEPARTMENT', semester, college), 10),
+        'colleges': None if college else top_n(queries.group_counts(con, 'COLLEGE', semester), 10),
+        'quality': queries.quality_counts(con, semester, college),
+    }
+
+
+def _metric(label, value):
+    return (f'<div class="metric"><div class="label">{html.escape(label)}</div>'
+            f'<div class="value">{html.escape(value)}</div></div>')
+
+
+def render(data):
+    """Full HTML page for the output of `report_data`."""
+    scope = data['college'] or 'All Colleges'
+    semester = 'All Semesters' if data['semester'] == 'All' else data['semester']
+    row = data['overview'].iloc[0]
+    shown = pd.notna(row['applications']) and pd.notna(row['graduated']) and row['applications'] > 0
+    metrics = [
+        _metric('Total Applications', format_count(row['applications'])),
+        _metric('Graduated', format_count(row['graduated'])),
+        _metric('Graduation Rate', f"{row['graduated'] / row['applications'] * 100:.1f}%" if shown else WITHHELD),
+        _metric('Average GPA', f"{row['avg_gpa']:.2f}" if pd.notna(row['avg_gpa']) else 'n/a'),
+    ]
+
+    figures = [
+        charts.degree_chart(data['degrees']),
+        charts.major_chart(data['majors'], top=10),
+        charts.semester_chart(data['semesters']),
+        charts.ranked_chart(data['departments'], 'Top 10 Departments', 'Department'),
+    ]
+    if data['colleges'] is not None:
+        figures.append(charts.ranked_chart(data['colleges'], 'Top 10 Colleges', 'College'))
+    # plotly.js is inlined once, in the first figure drawn
+    chart_html, include_plotlyjs = [], True
+    for fig in figures:
+        if fig is None:
+            chart_html.append(f'<p class="note">{html.escape(SUPPRESSED_NOTE)}</p>')
+        else:
+            chart_html.append(fig.to_html(full_html=False, include_plotlyjs=include_plotlyjs))
+            include_plotlyjs = False
+
+    quality = data['quality'].iloc[0]
+    names = dict(queries.QUALITY_FLAGS, UNMATCHED_STUDENTS='Unmatched Students')
+    quality_rows = "".join(
+        f'<tr><td>{html.escape(label)}</td><td class="count">{int(quality[flag]):,}</td></tr>'
+        for flag, label in names.items()
+    )
+
+    title = f"SLCC Graduation Report: {scope}, {semester}"
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title><style>{STYLE}</style></head>
+<body>
+<h1>SLCC Graduation Report</h1>
+<p class="subtitle">{html.escape(scope)} &middot; {html.escape(semester)} &middot; generated {date.today().isoformat()}</p>
+<div class="metrics">{''.join(metrics)}</div>
+<h2>Graduation Analytics</h2>
+{''.join(chart_html)}
+<h2>Data Quality</h2>
+<table><tr><th>Issue</th><th>Records</th></tr>{quality_rows}</table>
+</body></html>
+"""
+
+
+def report_filename(college=None):
+    if college is None:
+        return 'overall.html'
+    return re.sub(r'[^A-Za-z0-9]+', '_', college).strip('_').lower() + '.html'
+
+
+def _write(job):
+    path, data = job
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(render(data))
+    return path
+
+
+def generate(out_dir=REPORT_DIR, semester='All', workers=None, con=None):
+    """Write the overall report and one per college; returns the paths."""
+    con = con or sql.connect_prepared(worker.load_prepared())
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(os.path.join(out_dir, report_filename(college)), report_data(con, semester, college))
+            for college in [None] + colleges(con, semester)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_write, jobs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--out', default=REPORT_DIR)
+    parser.add_argument('--semester', default='All')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+    for path in generate(args.out, args.semester, args.workers):
+        print(path)
+
+
+if __name__ == '__main__':
+    main()
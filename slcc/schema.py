@@ -0,0 +1,191 @@
+"""Declared schemas and a typed reader for the raw CSV extracts.
+
+The extracts are parsed by the pyarrow CSV reader with every column's type
+given up front, so nothing is inferred. Blank cells ('') are read as
+missing; the literal 'Unknown' is kept as a value. Headers, types and
+indicator values are checked before anything downstream runs, and drift
+raises SchemaError listing every problem found.
+"""
+import csv
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+# Extract timestamp format, e.g. '06-MAY-21  12:00 AM'
+TIMESTAMP_FORMAT = '%d-%b-%y %I:%M %p'
+TIMESTAMP = pa.timestamp('s')
+
+# Two-digit years are read with a 1969 pivot ('68' -> 2068, '69' -> 1969).
+# Enrollment dates go back decades, so for these columns years from the
+# pivot year on are moved back a century; other dates keep the 1969 pivot
+CENTURY_PIVOTS = {'FIRST_ENROLLED': 2050}
+
+GRADUATIONS_SCHEMA = {
+    'STUDENT_ID': pa.int64(),
+    'GRAD_APPL_DATE': TIMESTAMP,
+    'GRADUATION_DATE': TIMESTAMP,
+    'GRADUATED_IND': pa.string(),
+    'TOTAL_CREDITS': pa.float64(),
+    'DEGREE_TYPE': pa.string(),
+    'MAJOR': pa.string(),
+    'DEPARTMENT': pa.string(),
+    'COLLEGE': pa.string(),
+    'REQUIRED_HOURS': pa.float64(),
+    'FULLY_ONLINE_IND': pa.string(),
+    'AID_ELIGIBLE_IND': pa.string(),
+    'HONORS': pa.string(),
+    'OVERALL_GPA': pa.float64(),
+}
+
+STUDENTS_SCHEMA = {
+    'STUDENT_ID': pa.int64(),
+    'GENDER': pa.string(),
+    'RACE': pa.string(),
+    'HISPANIC_IND': pa.string(),
+    'EVER_CONCURRENT_IND': pa.string(),
+    'EVER_PELL_ELIGIBLE_IND': pa.string(),
+    'FIRST_ENROLLED': TIMESTAMP,
+    'TRANSFER_CREDITS': pa.float64(),
+}
+
+# Indicator columns and the codes each extract may use
+ALLOWED_VALUES = {
+    'GRADUATED_IND': {'Y', 'N'},
+    'FULLY_ONLINE_IND': {'Y', 'N', 'U'},
+    'AID_ELIGIBLE_IND': {'Y', 'N', 'U'},
+    'HISPANIC_IND': {'Y', 'N'},
+    'EVER_CONCURRENT_IND': {'Y', 'N'},
+    'EVER_PELL_ELIGIBLE_IND': {'Y', 'N'},
+}
+
+
+class SchemaError(ValueError):
+    """Raised when an extract does not match its declared schema."""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = problems
+        super().__init__(f"{path} does not match its schema:\n" + "\n".join(f"  - {p}" for p in problems))
+
+
+def _check_header(path, schema):
+    with open(path, newline='') as f:
+        header = next(csv.reader(f), [])
+    problems = [f"missing column {column}" for column in schema if column not in header]
+    problems += [f"unexpected column {column}" for column in header if column not in schema]
+    return problems
+
+
+def _type_problems(path, schema):
+    """Re-read every column as text to say which values broke the typed read."""
+    table = pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(
+        column_types={column: pa.string() for column in schema},
+        strings_can_be_null=True,
+    ))
+    problems = []
+    for column, type_ in schema.items():
+        if pa.types.is_string(type_):
+            continue
+        values = table[column].to_pandas()
+        if pa.types.is_timestamp(type_):
+            parsed = pd.to_datetime(values.str.split().str.join(' '), format=TIMESTAMP_FORMAT, errors='coerce')
+        else:
+            parsed = pd.to_numeric(values, errors='coerce')
+            if pa.types.is_integer(type_):
+                parsed = parsed.where(parsed % 1 == 0)
+        bad = values[values.notna() & parsed.isna()]
+        if len(bad) > 0:
+            examples = ", ".join(repr(value) for value in bad.unique()[:3])
+            problems.append(f"{column}: {len(bad)} values are not {type_} (e.g. {examples})")
+    return problems
+
+
+def _value_problems(table):
+    problems = []
+    for column, allowed in ALLOWED_VALUES.items():
+        if column not in table.column_names:
+            continue
+        found = set(pc.unique(table[column].drop_null()).to_pylist())
+        unexpected = sorted(found - allowed)
+        if unexpected:
+            problems.append(f"{column}: unexpected codes {unexpected} (allowed {sorted(allowed)})")
+    return problems
+
+
+def _to_pandas(table):
+    return table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+
+
+def conform(frame, schema, source):
+    """Give a frame from another backend (e.g. SQL rows) the declared types.
+
+    Applies the same column, type and code checks as `read_extract`, and
+    returns the same dtypes, so every source prepares identically.
+    """
+    problems = [f"missing column {column}" for column in schema if column not in frame]
+    problems += [f"unexpected column {column}" for column in frame if column not in schema]
+    if problems:
+        raise SchemaError(source, problems)
+
+    columns = {}
+    for column, type_ in schema.items():
+        values = frame[column]
+        if pa.types.is_timestamp(type_):
+            parsed = pd.to_datetime(values, errors='coerce')
+        elif pa.types.is_string(type_):
+            parsed = values.astype(object).where(values.notna(), None)
+        else:
+            parsed = pd.to_numeric(values, errors='coerce')
+            if pa.types.is_integer(type_):
+                parsed = parsed.where(parsed % 1 == 0)
+        bad = values[values.notna() & pd.isna(parsed)]
+        if len(bad) > 0:
+            examples = ", ".join(repr(value) for value in bad.unique()[:3])
+            problems.append(f"{column}: {len(bad)} values are not {type_} (e.g. {examples})")
+        columns[column] = parsed
+    if problems:
+        raise SchemaError(source, problems)
+
+    table = pa.Table.from_pandas(pd.DataFrame(columns), schema=pa.schema(schema), preserve_index=False)
+    problems = _value_problems(table)
+    if problems:
+        raise SchemaError(source, problems)
+    return _to_pandas(table)
+
+
+def read_extract(path, schema):
+    """Read a CSV extract with declared types, raising SchemaError on drift."""
+    problems = _check_header(path, schema)
+    if problems:
+        raise SchemaError(path, problems)
+
+    try:
+        table = pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(
+            column_types=schema,
+            null_values=[''],
+            strings_can_be_null=True,
+            timestamp_parsers=[TIMESTAMP_FORMAT],
+        ))
+    except pa.ArrowInvalid:
+        raise SchemaError(path, _type_problems(path, schema) or ["values do not parse with the declared types"])
+
+    problems = _value_problems(table)
+    if problems:
+        raise SchemaError(path, problems)
+
+    frame = _to_pandas(table)
+    for column, pivot in CENTURY_PIVOTS.items():
+        if column in frame:
+            late = frame[column].dt.year >= pivot
+            frame.loc[late, column] = frame.loc[late, column] - pd.DateOffset(years=100)
+    return frame
+
+
+def read_graduations(path='Graduations.csv'):
+    return read_extract(path, GRADUATIONS_SCHEMA)
+
+
+def read_students(path='Students.csv'):
+    return read_extract(path, STUDENTS_SCHEMA)
@@ -0,0 +1,16 @@
+"""Sharing one prepared dataset between concurrent dashboard sessions.
+
+The dashboard keeps the prepared frames in ``st.cache_resource``, so every
+session reads the same objects instead of unpickling its own copy, and
+sessions only hold their filter selections and the small aggregates
+derived from them. That is safe only under pandas copy-on-write, where
+filtering returns frames that share memory and any write copies first.
+"""
+import pandas as pd
+
+
+def enable_copy_on_write():
+    """Turn on copy-on-write for pandas < 3.0 (always on from 3.0)."""
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
@@ -0,0 +1,86 @@
+"""Embedded DuckDB query layer over the prepared dataset.
+
+The prepared frames are handed to DuckDB as Arrow tables once and loaded
+into its columnar storage as ``dashboard_data``, ``graduation`` and
+``students``. Queries run vectorized with filters and column projections
+pushed into the table scans (min/max zone maps skip row groups), so
+analysts never need to round-trip through an exported CSV.
+"""
+import argparse
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# Tables every connection over the prepared dataset has
+PREPARED_TABLES = ('dashboard_data', 'graduation', 'students')
+
+
+class QueryError(ValueError):
+    """Raised for SQL that is not a read-only query."""
+
+
+def connect(tables):
+    """Return an in-memory DuckDB connection with a table per named frame.
+
+    A table may also be given as the path of a Parquet file, which is read
+    as Arrow without building a pandas frame. Once the tables are loaded
+    the connection is cut off from the file system and network (read_csv,
+    COPY, ATTACH, extensions) and its settings are locked, so analyst SQL
+    can only see these tables.
+    """
+    con = duckdb.connect()
+    for name, source in tables.items():
+        if isinstance(source, str):
+            source = pq.read_table(source)
+        else:
+            source = pa.Table.from_pandas(source, preserve_index=False)
+        con.register('_source', source)
+        con.execute(f'CREATE TABLE "{name}" AS SELECT * FROM _source')
+        con.unregister('_source')
+    con.execute("SET enable_external_access = false")
+    con.execute("SET lock_configuration = true")
+    return con
+
+
+def connect_prepared(prepared):
+    """Connection over the first three frames of a `prepare` result."""
+    students, graduation, dashboard_data = prepared[:3]
+    return connect(dict(zip(PREPARED_TABLES, (dashboard_data, graduation, students))))
+
+
+def query(con, sql, params=None):
+    """Run a parameterized query on a per-call cursor and return a DataFrame.
+
+    Cursors share the registered tables but are safe to use from different
+    threads, so one connection can serve every dashboard session.
+    """
+    return con.cursor().execute(sql, params).df()
+
+
+def run_readonly(con, sql):
+    """Run analyst-supplied SQL, rejecting anything other than SELECT statements."""
+    statements = con.extract_statements(sql)
+    if not statements:
+        raise QueryError("Enter a SELECT query.")
+    if any(statement.type != duckdb.StatementType.SELECT for statement in statements):
+        raise QueryError("Only SELECT queries are allowed.")
+    if len(statements) > 1:
+        raise QueryError("Run one query at a time.")
+    return query(con, sql)
+
+
+def main(argv=None):
+    from slcc import worker
+
+    parser = argparse.ArgumentParser(description="Run a SQL query against the prepared dashboard data.")
+    parser.add_argument('sql', help="SELECT statement over dashboard_data, graduation and students")
+    args = parser.parse_args(argv)
+
+    con = connect_prepared(worker.load_prepared())
+    print(run_readonly(con, args.sql).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+"""Where the raw extracts are read from.
+
+Every source returns the same (students, graduation) pair with the types
+declared in ``slcc.schema``, so ``pipeline.prepare`` cannot tell them
+apart:
+
+    csv                       Students.csv / Graduations.csv (the default)
+    csv:<directory>           the same pair in another directory
+    parquet:<store>           a term-partitioned store (slcc.partitions)
+    sqlite:<database>         graduations/students tables in a SQL database
+
+The source is chosen with the SLCC_SOURCE environment variable; without
+it a term store in the working directory is used if present, else the
+CSV pair. The SQL source keeps a small pool of open connections, filters
+terms in the database and fetches rows in bulk batches. SQLite stands in
+for the campus warehouse locally; a warehouse is used by constructing
+SqlSource with its DB-API ``connect`` function.
+
+Build a local SQLite copy of the CSV extracts with:
+
+    python -m slcc.storage to-sqlite slcc.db
+"""
+import argparse
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+import pandas as pd
+
+from slcc import partitions
+from slcc.pipeline import TERM_MONTHS, semester_labels, term_counts, term_sort_key
+from slcc.schema import GRADUATIONS_SCHEMA, STUDENTS_SCHEMA, conform, read_graduations, read_students
+
+SOURCE_ENV = 'SLCC_SOURCE'
+
+# Rows fetched per round trip by the SQL source
+FETCH_SIZE = 10_000
+POOL_SIZE = 4
+
+
+class CsvSource:
+    """The Students.csv/Graduations.csv pair, always read in full."""
+
+    filters_terms = False
+
+    def __init__(self, directory='.'):
+        self.graduations_path = os.path.join(directory, 'Graduations.csv')
+        self.students_path = os.path.join(directory, 'Students.csv')
+
+    def source_paths(self):
+        return [self.students_path, self.graduations_path]
+
+    def read(self, terms=None):
+        return read_students(self.students_path), read_graduations(self.graduations_path)
+
+
+class ParquetSource:
+    """Term-partitioned Parquet store; only the selected terms' files are opened."""
+
+    filters_terms = True
+
+    def __init__(self, store=partitions.STORE_DIR):
+        self.store = store
+
+    def source_paths(self):
+        return [self.store]
+
+    def read(self, terms=None):
+        graduation, students = partitions.read_terms(terms, self.store)
+        return students, graduation
+
+    def list_terms(self):
+        return partitions.list_terms(self.store)
+
+    def term_summary(self):
+        return partitions.term_summary(self.store)
+
+
+class ConnectionPool:
+    """Up to `size` open DB-API connections, handed out one caller at a time."""
+
+    def __init__(self, connect, size=POOL_SIZE):
+        self._connect = connect
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def connection(self):
+        self._slots.acquire()
+        try:
+            try:
+                con = self._idle.get_nowait()
+            except queue.Empty:
+                con = self._connect()
+            try:
+                yield con
+            except Exception:
+                con.close()
+                raise
+            self._idle.put(con)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _term_ranges(terms):
+    """[start, end) GRADUATION_DATE range of each 'Season YYYY' term."""
+    month_of = {season: month for month, season in TERM_MONTHS.items()}
+    ranges = []
+    for term in terms:
+        season, _, year = term.partition(' ')
+        month = month_of[season]
+        start = pd.Timestamp(int(year), month, 1)
+        ranges.append((start, start + pd.DateOffset(months=1)))
+    return ranges
+
+
+class SqlSource:
+    """`graduations` and `students` tables in a SQL database.
+
+    `connect` is a zero-argument DB-API connect function and `placeholder`
+    its parameter marker ('?' for sqlite3, '%s' for most warehouse drivers).
+    """
+
+    filters_terms = True
+
+    def __init__(self, connect, placeholder='?', pool_size=POOL_SIZE, paths=()):
+        self.pool = ConnectionPool(connect, pool_size)
+        self.placeholder = placeholder
+        self.paths = list(paths)
+
+    @classmethod
+    def sqlite(cls, path, pool_size=POOL_SIZE):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        uri = f'file:{os.path.abspath(path)}?mode=ro'
+        return cls(lambda: sqlite3.connect(uri, uri=True, check_same_thread=False), '?', pool_size, paths=[path])
+
+    def source_paths(self):
+        return self.paths
+
+    def _fetch(self, sql, params=()):
+        with self.pool.connection() as con:
+            cursor = con.cursor()
+            cursor.arraysize = FETCH_SIZE
+            cursor.execute(sql, params)
+            columns = [description[0] for description in cursor.description]
+            rows = []
+            while batch := cursor.fetchmany():
+                rows.extend(batch)
+            cursor.close()
+        return pd.DataFrame.from_records(rows, columns=columns)
+
+    def _term_filter(self, terms):
+        """WHERE clause selecting `terms` on GRADUATION_DATE, or None to read all."""
+        if terms is None or 'Other' in terms:
+            return None, ()
+        ranges = _term_ranges(terms)
+        clause = " OR ".join(f"(GRADUATION_DATE >= {self.placeholder} AND GRADUATION_DATE < {self.placeholder})" for _ in ranges)
+        params = tuple(value.strftime('%Y-%m-%d %H:%M:%S') for bounds in ranges for value in bounds)
+        return f"WHERE {clause}", params
+
+    def read(self, terms=None):
+        where, params = self._term_filter(terms)
+        graduation_columns = ", ".join(GRADUATIONS_SCHEMA)
+        student_columns = ", ".join(STUDENTS_SCHEMA)
+        if where is None:
+            graduation = self._fetch(f"SELECT {graduation_columns} FROM graduations")
+            students = self._fetch(f"SELECT {student_columns} FROM students")
+        else:
+            graduation = self._fetch(f"SELECT {graduation_columns} FROM graduations {where}", params)
+            students = self._fetch(
+                f"SELECT {student_columns} FROM students "
+                f"WHERE STUDENT_ID IN (SELECT STUDENT_ID FROM graduations {where})",
+                params,
+            )
+        graduation = conform(graduation, GRADUATIONS_SCHEMA, 'graduations table')
+        students = conform(students, STUDENTS_SCHEMA, 'students table')
+        if terms is not None and where is None:
+            graduation = graduation[semester_labels(graduation['GRADUATION_DATE']).isin(terms)].reset_index(drop=True)
+            students = students[students['STUDENT_ID'].isin(graduation['STUDENT_ID'])].reset_index(drop=True)
+        return students, graduation
+
+    def term_summary(self):
+        """Counts per term, fetching only the two columns needed."""
+        frame = self._fetch("SELECT GRADUATION_DATE, GRADUATED_IND FROM graduations")
+        frame['SEMESTER'] = semester_labels(pd.to_datetime(frame['GRADUATION_DATE']))
+        return term_counts(frame)
+
+    def list_terms(self):
+        return sorted(self.term_summary()['SEMESTER'], key=term_sort_key)
+
+
+@lru_cache(maxsize=None)
+def open_source(spec):
+    """The source described by `spec`, e.g. 'sqlite:slcc.db'; one per process."""
+    kind, _, location = spec.partition(':')
+    if kind == 'csv':
+        return CsvSource(location or '.')
+    if kind == 'parquet':
+        return ParquetSource(location or partitions.STORE_DIR)
+    if kind == 'sqlite':
+        return SqlSource.sqlite(location)
+    raise ValueError(f"Unknown source {spec!r}; expected csv, parquet:<store> or sqlite:<database>")
+
+
+def default_source():
+    """The configured source: SLCC_SOURCE, else a term store if present, else the CSVs."""
+    spec = os.environ.get(SOURCE_ENV)
+    if not spec:
+        spec = 'parquet' if partitions.has_store() else 'csv'
+    return open_source(spec)
+
+
+def write_sqlite(path, graduation, students):
+    """Write the extracts to `path` as the tables SqlSource reads."""
+    with sqlite3.connect(path) as con:
+        graduation.to_sql('graduations', con, if_exists='replace', index=False)
+        students.to_sql('students', con, if_exists='replace', index=False)
+        con.execute("CREATE INDEX IF NOT EXISTS graduations_date ON graduations (GRADUATION_DATE)")
+        con.execute("CREATE INDEX IF NOT EXISTS graduations_student ON graduations (STUDENT_ID)")
+        con.execute("CREATE INDEX IF NOT EXISTS students_student ON students (STUDENT_ID)")
+    con.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the extract sources.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    to_sqlite = commands.add_parser('to-sqlite', help="copy the CSV extracts into a SQLite database")
+    to_sqlite.add_argument('database')
+    to_sqlite.add_argument('--graduations', default='Graduations.csv')
+    to_sqlite.add_argument('--students', default='Students.csv')
+    args = parser.parse_args(argv)
+
+    graduation, students = read_graduations(args.graduations), read_students(args.students)
+    write_sqlite(args.database, graduation, students)
+    print(f"Wrote {len(graduation):,} graduations and {len(students):,} students to {args.database}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Top-N selection for ranked charts and tables.
+
+Counts are aggregated first (a bincount over core table codes, or a SQL
+GROUP BY), then the N largest are picked with ``np.argpartition``, which
+is linear in the number of groups; only those N are sorted. Everything
+outside the top N can be summed into a single 'Other' entry, so a chart
+keeps its total however many majors or departments there are.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_N = 10
+OTHER = 'Other'
+
+
+def top_n(counts, n=DEFAULT_N, other=OTHER):
+    """The `n` largest entries of a label -> count Series, largest first.
+
+    Ties are ordered by label. With `other` set, the remaining counts are
+    summed into one final entry under that label (omitted when empty).
+    """
+    counts = counts[counts.fillna(0) > 0]
+    values = counts.to_numpy()
+    if n < len(values):
+        picked = counts.iloc[np.argpartition(-values, n - 1)[:n]]
+    else:
+        picked = counts
+    order = np.lexsort((picked.index.astype(str), -picked.to_numpy()))
+    picked = picked.iloc[order]
+    if other is not None and len(picked) < len(counts):
+        picked = pd.concat([picked, pd.Series({other: values.sum() - picked.sum()})])
+    return picked.rename(counts.name)
+
+
+def top_labels(counts, n=DEFAULT_N):
+    """Labels of the `n` largest counts, largest first."""
+    return list(top_n(counts, n, other=None).index)
@@ -0,0 +1,117 @@
+"""Rebuild cached data in the background when the source extracts change.
+
+A SourceWatcher polls the source files' size and mtime. When they change
+and then stay unchanged for one poll (so a copy in progress is not picked
+up), it hashes the contents. Only if the contents differ from the
+published version does it run the rebuild callback in its background
+thread. The new version is published only after the rebuild succeeds, so
+sessions keep serving the previous version until the swap; a failed
+rebuild (e.g. a half-written or drifted extract) leaves it in place.
+"""
+import hashlib
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = 30
+
+
+def source_files(paths):
+    """Expand directories (e.g. the term store) into the files beneath them."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in names)
+        elif os.path.exists(path):
+            files.append(path)
+    return sorted(files)
+
+
+def stat_signature(paths):
+    """Cheap change check: (path, size, mtime) for every source file."""
+    signature = []
+    for path in source_files(paths):
+        stat = os.stat(path)
+        signature.append((path, stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def content_fingerprint(paths):
+    """Hash of every source file's name and contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in source_files(paths):
+        digest.update(path.encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SourceWatcher:
+    """Publishes a version string that changes only after a successful rebuild.
+
+    `rebuild(version)` is called from the watcher thread with the new
+    content fingerprint and should build (and cache) everything keyed by it.
+    """
+
+    def __init__(self, paths, rebuild, poll_seconds=POLL_SECONDS):
+        self.paths = paths
+        self.rebuild = rebuild
+        self.poll_seconds = poll_seconds
+        self.version = content_fingerprint(paths)
+        self.last_error = None
+        self._failed_version = None
+        self._published_signature = stat_signature(paths)
+        self._seen_signature = self._published_signature
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='slcc-source-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.poll_seconds):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Source watcher check failed")
+
+    def check(self):
+        """Poll once; returns True if a new version was published."""
+        signature = stat_signature(self.paths)
+        settled = signature == self._seen_signature
+        self._seen_signature = signature
+        if signature == self._published_signature or not settled:
+            return False
+
+        version = content_fingerprint(self.paths)
+        if version == self.version:
+            self._published_signature = signature
+            return False
+        if version == self._failed_version:
+            return False
+
+        try:
+            self.rebuild(version)
+        except Exception as e:
+            self.last_error = e
+            self._failed_version = version
+            logger.exception("Rebuild for source version %s failed; keeping %s", version, self.version)
+            return False
+
+        # Swap: sessions starting after this point read the new version
+        self.version = version
+        self._published_signature = signature
+        self.last_error = None
+        self._failed_version = None
+        logger.info("Published source version %s", version)
+        return True
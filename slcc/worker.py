@@ -0,0 +1,239 @@
+"""Background worker that builds everything the dashboard shows.
+
+The worker prepares the dataset and its aggregates outside the Streamlit
+process and publishes them as Parquet files under
+``artifacts/<version>/``, where the version is the content fingerprint of
+the source extracts. ``artifacts/CURRENT`` names the latest complete
+version and is replaced atomically after all of its files are written.
+The dashboard reads whatever CURRENT names and never prepares data itself
+while a published version exists.
+
+The version directories double as the on-disk cache for every other
+consumer: ``load_prepared`` returns the version matching the current
+sources, building and writing it first if nobody has yet, so the
+dashboard, API, reports and notebooks all share one computation.
+
+    python -m slcc.worker            # publish if sources changed, then watch
+    python -m slcc.worker --once     # publish if sources changed and exit
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import time
+
+import pandas as pd
+
+from slcc import coretable, quality_history, storage
+from slcc.pipeline import build_aggregates, load_extracts, prepare
+from slcc.watcher import POLL_SECONDS, SourceWatcher, content_fingerprint
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_DIR = 'artifacts'
+
+# Published versions kept on disk, so sessions mid-read are not cut off
+KEEP_VERSIONS = 3
+
+CORE_DIR = 'core'
+
+# Names of the frames returned by pipeline.prepare, in order
+PREPARED_NAMES = [
+    'students', 'graduation', 'dashboard_data', 'grad_duplicates', 'grad_duplicate_student_ids',
+    'student_duplicates', 'student_duplicate_ids', 'unmatched_students', 'major_mapping',
+]
+
+
+def source_paths():
+    return storage.default_source().source_paths()
+
+
+def _current_path(artifact_dir):
+    return os.path.join(artifact_dir, 'CURRENT')
+
+
+def current_version(artifact_dir=ARTIFACT_DIR):
+    """The latest published version, or None if nothing is published."""
+    try:
+        with open(_current_path(artifact_dir)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def has_version(version, artifact_dir=ARTIFACT_DIR):
+    return version is not None and os.path.exists(os.path.join(artifact_dir, version, 'manifest.json'))
+
+
+def _flatten(artifacts, prefix=''):
+    """{'equity': {'GENDER': {'overall': df}}} -> {'equity.GENDER.overall': df}"""
+    flat = {}
+    for name, value in artifacts.items():
+        key = f'{prefix}{name}'
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f'{key}.'))
+        else:
+            flat[key] = value
+    return flat
+
+
+def _unflatten(flat):
+    nested = {}
+    for key, value in flat.items():
+        *parents, leaf = key.split('.')
+        node = nested
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return nested
+
+
+def publish(version, prepared, aggregates, artifact_dir=ARTIFACT_DIR, make_current=True):
+    """Write one version's frames, then (by default) point CURRENT at it."""
+    version_dir = os.path.join(artifact_dir, version)
+    staging_dir = f'{version_dir}.{os.getpid()}.tmp'
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+
+    frames = {'prepared': dict(zip(PREPARED_NAMES, prepared)), 'aggregates': aggregates}
+    flat = _flatten(frames)
+    for key, frame in flat.items():
+        frame.to_parquet(os.path.join(staging_dir, f'{key}.parquet'))
+    # dashboard_data again as a memory-mappable core table (slcc.coretable)
+    coretable.write(prepared[PREPARED_NAMES.index('dashboard_data')], os.path.join(staging_dir, CORE_DIR))
+    with open(os.path.join(staging_dir, 'manifest.json'), 'w') as f:
+        json.dump({'version': version, 'published_at': pd.Timestamp.now().isoformat(), 'frames': sorted(flat)}, f, indent=2)
+
+    if has_version(version, artifact_dir):
+        # Another process wrote the same content first; leave its files to its readers
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    else:
+        shutil.rmtree(version_dir, ignore_errors=True)
+        os.replace(staging_dir, version_dir)
+    if make_current:
+        _point_current(artifact_dir, version)
+    _prune(artifact_dir, keep=version)
+
+
+def _point_current(artifact_dir, version):
+    pointer = f'{_current_path(artifact_dir)}.tmp'
+    with open(pointer, 'w') as f:
+        f.write(version)
+    os.replace(pointer, _current_path(artifact_dir))
+
+
+def _prune(artifact_dir, keep):
+    versions = [
+        entry for entry in os.scandir(artifact_dir)
+        if entry.is_dir() and not entry.name.endswith('.tmp') and entry.name != keep
+    ]
+    versions.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in versions[KEEP_VERSIONS - 1:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _read_frames(version, prefix, artifact_dir):
+    with open(os.path.join(artifact_dir, version, 'manifest.json')) as f:
+        keys = [key for key in json.load(f)['frames'] if key.startswith(prefix)]
+    return _unflatten({
+        key[len(prefix):]: pd.read_parquet(os.path.join(artifact_dir, version, f'{key}.parquet'))
+        for key in keys
+    })
+
+
+def prepared_path(version, name, artifact_dir=ARTIFACT_DIR):
+    """Parquet file of one published `prepare` frame."""
+    return os.path.join(artifact_dir, version, f'prepared.{name}.parquet')
+
+
+def read_prepared(version, artifact_dir=ARTIFACT_DIR, names=None):
+    """The published `prepare` result, as the same tuple, or only the frames in `names`."""
+    return tuple(pd.read_parquet(prepared_path(version, name, artifact_dir)) for name in names or PREPARED_NAMES)
+
+
+def read_aggregates(version, artifact_dir=ARTIFACT_DIR):
+    return _read_frames(version, 'aggregates.', artifact_dir)
+
+
+def read_core(version, artifact_dir=ARTIFACT_DIR):
+    """The published dashboard_data as a memory-mapped CoreTable, or None."""
+    core_dir = os.path.join(artifact_dir, version, CORE_DIR)
+    if not os.path.exists(os.path.join(core_dir, coretable.MANIFEST)):
+        return None
+    return coretable.CoreTable.open(core_dir)
+
+
+def build_and_publish(version, artifact_dir=ARTIFACT_DIR, make_current=True):
+    started = time.perf_counter()
+    prepared = prepare(*load_extracts())
+    aggregates = build_aggregates(prepared)
+    publish(version, prepared, aggregates, artifact_dir, make_current)
+    logger.info("Published %s in %.1fs", version, time.perf_counter() - started)
+
+
+def record_quality(version, artifact_dir=ARTIFACT_DIR):
+    """Record a published version's quality rule results, once per version.
+
+    Returns the new run id, or None if the version was already recorded.
+    """
+    if quality_history.recorded_run(version) is not None:
+        return None
+    students, dashboard_data = read_prepared(version, artifact_dir, names=['students', 'dashboard_data'])
+    return quality_history.record_run(dashboard_data, students, version)
+
+
+def ensure_version(version=None, artifact_dir=ARTIFACT_DIR):
+    """`version` (default: the current sources'), built and written first on a miss.
+
+    A version built here does not move CURRENT, which stays under the
+    background worker's control.
+    """
+    version = version or content_fingerprint(source_paths())
+    if not has_version(version, artifact_dir):
+        build_and_publish(version, artifact_dir, make_current=False)
+    return version
+
+
+def load_prepared(version=None, artifact_dir=ARTIFACT_DIR, names=None):
+    """The `prepare` result for the current sources, from the on-disk cache."""
+    return read_prepared(ensure_version(version, artifact_dir), artifact_dir, names)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and publish dashboard data in the background.")
+    parser.add_argument('--once', action='store_true', help="publish if needed and exit")
+    parser.add_argument('--poll', type=float, default=POLL_SECONDS, help="seconds between source checks")
+    parser.add_argument('--artifacts', default=ARTIFACT_DIR, help="publish directory (default: %(default)s)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    paths = source_paths()
+    version = content_fingerprint(paths)
+    if not has_version(version, args.artifacts):
+        build_and_publish(version, args.artifacts)
+    elif current_version(args.artifacts) != version:
+        _point_current(args.artifacts, version)
+        logger.info("Published cached version %s", version)
+    else:
+        logger.info("Version %s is already published", version)
+    record_quality(version, args.artifacts)
+    if args.once:
+        return
+
+    def rebuild(new_version):
+        build_and_publish(new_version, args.artifacts)
+        record_quality(new_version, args.artifacts)
+
+    watcher = SourceWatcher(paths, rebuild=rebuild, poll_seconds=args.poll)
+    while True:
+        time.sleep(args.poll)
+        # A source replaced mid-check (e.g. a term-store ingest) is picked up on the next poll
+        try:
+            watcher.check()
+        except Exception:
+            logger.exception("Source check failed")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,28 +7,19 @@ app = marimo.App(width="medium")
 @app.cell
 def _():
     import marimo as mo
-    import pandas as pd
-    import numpy as np
-    import matplotlib.pyplot as plt
-    return mo, pd
+    return (mo,)
 
 
 @app.cell
-def _(pd):
-    students = pd.read_csv('Students.csv')
-    graduation = pd.read_csv('Graduations.csv')
-    return graduation, students
+def _():
+    # Prepared by the shared engine and read from the same on-disk cache as the dashboard
+    from slcc import worker
+    from slcc.pipeline import quality_summary
 
-
-@app.cell
-def _(graduation, students):
-    merged = graduation.merge(
-        students,
-        on='STUDENT_ID',
-        how='left',
-        indicator=True
-    )
-    return (merged,)
+    prepared = worker.load_prepared()
+    students, graduation, dashboard_data = prepared[:3]
+    unmatched = prepared[7]
+    return dashboard_data, graduation, prepared, quality_summary, students, unmatched
 
 
 @app.cell
@@ -38,8 +29,8 @@ def _(mo):
 
 
 @app.cell
-def _(merged):
-    merged.head(20)
+def _(dashboard_data):
+    dashboard_data.head(20)
     return
 
 
@@ -104,8 +95,8 @@ def _(graduation):
 
 
 @app.cell
-def _(graduation):
-    unknown_departments = graduation[graduation['DEPARTMENT'] == 'Unknown']
+def _(dashboard_data):
+    unknown_departments = dashboard_data[dashboard_data['UNKNOWN_DEPARTMENT']]
     return
 
 
@@ -116,10 +107,9 @@ def _(mo):
 
 
 @app.cell
-def _(graduation, students):
-    unmatched = graduation[~graduation['STUDENT_ID'].isin(students['STUDENT_ID'])]
+def _(unmatched):
     unmatched
-    return (unmatched,)
+    return
 
 
 @app.cell
@@ -129,27 +119,19 @@ def _(mo):
 
 
 @app.cell
-def _(graduation, pd):
-    ## datetime logic
-    graduation['GRADUATION_DATE'] = pd.to_datetime(graduation['GRADUATION_DATE'])
-    graduation['GRAD_APPL_DATE'] = pd.to_datetime(graduation['GRAD_APPL_DATE'])
+def _(dashboard_data):
+    grad_date_issues = dashboard_data[dashboard_data['ILLOGICAL_DATES']]
     return
 
 
 @app.cell
-def _(graduation):
-    grad_date_issues = graduation[graduation['GRAD_APPL_DATE'] > graduation['GRADUATION_DATE']]
-    return (grad_date_issues,)
-
-
-@app.cell
-def _(graduation):
+def _(dashboard_data):
     ## credits logic check
 
-    below_credits_but_graduated = graduation[(graduation['TOTAL_CREDITS'] < graduation['REQUIRED_HOURS']) & (graduation['GRADUATED_IND'] == 'Y')]
+    below_credits_but_graduated = dashboard_data[dashboard_data['BELOW_CREDITS']]
 
     below_credits_but_graduated
-    return (below_credits_but_graduated,)
+    return
 
 
 @app.cell
@@ -171,59 +153,21 @@ def _(graduation):
 
 
 @app.cell
-def _(graduation):
-    graduation['SEMESTER'] = graduation['GRADUATION_DATE'].dt.month.apply(
-        lambda x: 'Spring 2021' if x == 5 else 'Summer 2021' if x == 8 else 'Other'
-    )
-    return
-
-
-@app.cell
-def _(graduation):
-    graduation['SEMESTER'].value_counts()
-    return
-
-
-@app.cell
-def _(graduation):
-    graduation[graduation['SEMESTER'] == 'Other']
+def _(dashboard_data):
+    dashboard_data['SEMESTER'].value_counts()
     return
 
 
-@app.cell
-def _(graduation, students):
-    dashboard_data = graduation.merge(students, on="STUDENT_ID", how='left')
-    return (dashboard_data,)
-
-
 @app.cell
 def _(dashboard_data):
-    dashboard_data['ILLOGICAL_DATES'] = dashboard_data['GRAD_APPL_DATE'] > dashboard_data['GRADUATION_DATE']
-    dashboard_data['BELOW_CREDITS'] = dashboard_data['TOTAL_CREDITS'] < dashboard_data['REQUIRED_HOURS']
-    dashboard_data['MISSING'] = dashboard_data['STUDENT_ID'].isnull()
+    dashboard_data[dashboard_data['SEMESTER'] == 'Other']
     return
 
 
 @app.cell
-def _(
-    below_credits_but_graduated,
-    grad_date_issues,
-    graduation,
-    pd,
-    unmatched,
-):
+def _(prepared, quality_summary):
     # create an summary table of the issues
-    quality_summary = pd.DataFrame({
-        'Issue Type': ['Illogical Dates', 'Unmatched Students', 'Below Required Credits', 'Missing Student IDs'],
-        'Record Count': [
-            len(grad_date_issues),
-            len(unmatched),
-            len(below_credits_but_graduated),
-            graduation['STUDENT_ID'].isnull().sum()
-        ]
-    })
-
-    quality_summary.to_csv('quality_issues_summary.csv', index=False)
+    quality_summary(prepared).to_csv('quality_issues_summary.csv', index=False)
     return
 
 
@@ -7,10 +7,7 @@ app = marimo.App(width="medium")
 @app.cell
 def _():
     import marimo as mo
-    import pandas as pd
-    import numpy as np
-    import matplotlib.pyplot as plt
-    return mo, pd
+    return (mo,)
 
 
 @app.cell(hide_code=True)
@@ -37,10 +34,16 @@ def _(mo):
 
 
 @app.cell
-def _(pd):
-    students = pd.read_csv('Students.csv')
-    graduation = pd.read_csv('Graduations.csv')
-    return graduation, students
+def _():
+    # The shared engine reads the extracts through their declared schemas,
+    # converts dates, merges and derives SEMESTER and the quality flags.
+    # Results come from the same on-disk cache the dashboard uses.
+    from slcc import worker
+    from slcc.pipeline import quality_summary
+
+    prepared = worker.load_prepared()
+    students, graduation, dashboard_data = prepared[:3]
+    return dashboard_data, graduation, prepared, quality_summary, students
 
 
 @app.cell
@@ -68,12 +71,10 @@ def _(graduation):
     return
 
 
-app._unparsable_cell(
-    r"""
-     students.head(20)
-    """,
-    name="_"
-)
+@app.cell
+def _(students):
+    students.head(20)
+    return
 
 
 @app.cell
@@ -138,12 +139,12 @@ def _(mo):
 
 
 @app.cell
-def _(graduation, students):
-    # Check for unmatched student IDs between datasets
-    unmatched = graduation[~graduation['STUDENT_ID'].isin(students['STUDENT_ID'])]
+def _(prepared):
+    # Graduation records whose student ID is not in the student extract
+    unmatched = prepared[7]
     print(f"Unmatched students: {len(unmatched)}")
     unmatched
-    return (unmatched,)
+    return
 
 
 @app.cell(hide_code=True)
@@ -157,14 +158,6 @@ def _(mo):
     return
 
 
-@app.cell
-def _(graduation, pd):
-    # Convert date columns to datetime
-    graduation['GRADUATION_DATE'] = pd.to_datetime(graduation['GRADUATION_DATE'])
-    graduation['GRAD_APPL_DATE'] = pd.to_datetime(graduation['GRAD_APPL_DATE'])
-    return
-
-
 @app.cell(hide_code=True)
 def _(mo):
     mo.md(r"""### 4.1 Date Logic Validation""")
@@ -172,12 +165,12 @@ def _(mo):
 
 
 @app.cell
-def _(graduation):
+def _(dashboard_data):
     # Identify records where application date is after graduation date
-    grad_date_issues = graduation[graduation['GRAD_APPL_DATE'] > graduation['GRADUATION_DATE']]
+    grad_date_issues = dashboard_data[dashboard_data['ILLOGICAL_DATES']]
     print(f"Illogical date records: {len(grad_date_issues)}")
     grad_date_issues
-    return (grad_date_issues,)
+    return
 
 
 @app.cell(hide_code=True)
@@ -187,15 +180,12 @@ def _(mo):
 
 
 @app.cell
-def _(graduation):
+def _(dashboard_data):
     # Check for students who graduated despite not meeting credit requirements
-    below_credits_but_graduated = graduation[
-        (graduation['TOTAL_CREDITS'] < graduation['REQUIRED_HOURS']) & 
-        (graduation['GRADUATED_IND'] == 'Y')
-    ]
+    below_credits_but_graduated = dashboard_data[dashboard_data['BELOW_CREDITS']]
     print(f"Below credits but graduated: {len(below_credits_but_graduated)}")
     below_credits_but_graduated
-    return (below_credits_but_graduated,)
+    return
 
 
 @app.cell(hide_code=True)
@@ -232,24 +222,16 @@ def _(mo):
 
 
 @app.cell
-def _(graduation):
-    # Create semester labels based on graduation month
-    graduation['SEMESTER'] = graduation['GRADUATION_DATE'].dt.month.apply(
-        lambda x: 'Spring 2021' if x == 5 else 'Summer 2021' if x == 8 else 'Other'
-    )
-    return
-
-
-@app.cell
-def _(graduation):
-    graduation['SEMESTER'].value_counts()
+def _(dashboard_data):
+    # Semester labels come from the graduation month (see slcc.pipeline.semester_labels)
+    dashboard_data['SEMESTER'].value_counts()
     return
 
 
 @app.cell
-def _(graduation):
+def _(dashboard_data):
     # Check for unexpected graduation dates
-    graduation[graduation['SEMESTER'] == 'Other']
+    dashboard_data[dashboard_data['SEMESTER'] == 'Other']
     return
 
 
@@ -259,19 +241,10 @@ def _(mo):
     return
 
 
-@app.cell
-def _(graduation, students):
-    # Merge graduation and student data for dashboard
-    dashboard_data = graduation.merge(students, on="STUDENT_ID", how='left')
-    return (dashboard_data,)
-
-
 @app.cell
 def _(dashboard_data):
-    # Create quality indicator flags
-    dashboard_data['ILLOGICAL_DATES'] = dashboard_data['GRAD_APPL_DATE'] > dashboard_data['GRADUATION_DATE']
-    dashboard_data['BELOW_CREDITS'] = dashboard_data['TOTAL_CREDITS'] < dashboard_data['REQUIRED_HOURS']
-    dashboard_data['MISSING'] = dashboard_data['STUDENT_ID'].isnull()
+    # Quality indicator flags set by the shared engine
+    dashboard_data[['ILLOGICAL_DATES', 'BELOW_CREDITS', 'MISSING_STUDENT_INFO', 'HAS_UNKNOWN_VALUES']].sum()
     return
 
 
@@ -294,31 +267,11 @@ def _(mo):
 
 
 @app.cell
-def _(
-    below_credits_but_graduated,
-    grad_date_issues,
-    graduation,
-    pd,
-    unmatched,
-):
+def _(prepared, quality_summary):
     # Create summary table of data quality issues
-    quality_summary = pd.DataFrame({
-        'Issue Type': [
-            'Illogical Dates', 
-            'Unmatched Students', 
-            'Below Required Credits', 
-            'Missing Student IDs'
-        ],
-        'Record Count': [
-            len(grad_date_issues),
-            len(unmatched),
-            len(below_credits_but_graduated),
-            graduation['STUDENT_ID'].isnull().sum()
-        ]
-    })
-
-    quality_summary.to_csv('quality_issues_summary.csv', index=False)
-    quality_summary
+    quality_summary_table = quality_summary(prepared)
+    quality_summary_table.to_csv('quality_issues_summary.csv', index=False)
+    quality_summary_table
     return
 
 
@@ -352,20 +305,20 @@ def _():
 
 
 @app.cell
-def _(graduation):
-    graduation[graduation['SEMESTER'] == 'Other']['GRADUATION_DATE'].unique()
+def _(dashboard_data):
+    dashboard_data[dashboard_data['SEMESTER'] == 'Other']['GRADUATION_DATE'].unique()
     return
 
 
 @app.cell
-def _(graduation):
-    graduation[(graduation['GRADUATED_IND'] == 'N') & (graduation['GRAD_APPL_DATE'] > graduation['GRADUATION_DATE'])]
+def _(dashboard_data):
+    dashboard_data[(dashboard_data['GRADUATED_IND'] == 'N') & dashboard_data['ILLOGICAL_DATES']]
     return
 
 
 @app.cell
-def _(graduation):
-    graduation[(graduation['GRADUATED_IND'] == 'Y') & (graduation['GRAD_APPL_DATE'] > graduation['GRADUATION_DATE'])]
+def _(dashboard_data):
+    dashboard_data[(dashboard_data['GRADUATED_IND'] == 'Y') & dashboard_data['ILLOGICAL_DATES']]
     return
 
 
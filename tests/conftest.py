@@ -0,0 +1,65 @@
+"""Synthetic extracts and golden-output checks shared by the tests.
+
+tests/fixtures holds a small Graduations.csv/Students.csv pair written to
+hit every flag, duplicate and recovery case the pipeline handles. Each
+stage's output is compared with a CSV under tests/golden, so a refactor
+or a faster engine has to reproduce the same results row for row. Floats
+are compared to 10 significant digits, which allows for a different
+summation order. After an intended change in results, rewrite the golden
+files and review their diff like any other change:
+
+    python -m pytest --update-golden
+"""
+import os
+
+import pytest
+
+from slcc.pipeline import build_aggregates, prepare
+from slcc.schema import read_graduations, read_students
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), 'golden')
+
+
+def pytest_addoption(parser):
+    parser.addoption('--update-golden', action='store_true', help="rewrite tests/golden from the current results")
+
+
+@pytest.fixture
+def graduation():
+    return read_graduations(os.path.join(FIXTURE_DIR, 'Graduations.csv'))
+
+
+@pytest.fixture
+def students():
+    return read_students(os.path.join(FIXTURE_DIR, 'Students.csv'))
+
+
+@pytest.fixture
+def prepared(students, graduation):
+    return prepare(students, graduation)
+
+
+@pytest.fixture
+def aggregates(prepared):
+    return build_aggregates(prepared)
+
+
+@pytest.fixture
+def golden(request):
+    """check(name, frame): compare `frame` with tests/golden/<name>.csv."""
+    update = request.config.getoption('--update-golden')
+
+    def check(name, frame):
+        path = os.path.join(GOLDEN_DIR, f'{name}.csv')
+        actual = frame.to_csv(index=False, float_format='%.10g', lineterminator='\n')
+        if update:
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(actual)
+            return
+        with open(path) as f:
+            expected = f.read()
+        assert actual == expected, f"{name} no longer matches tests/golden/{name}.csv"
+
+    return check
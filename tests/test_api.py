@@ -0,0 +1,25 @@
+import asyncio
+
+from slcc import api, worker
+
+
+def test_engine_reloads_new_version(monkeypatch, prepared):
+    versions, loads = ['v1'], []
+
+    def load_prepared(version=None):
+        loads.append(version)
+        return prepared
+
+    monkeypatch.setattr(worker, 'current_version', lambda: versions[-1])
+    monkeypatch.setattr(worker, 'load_prepared', load_prepared)
+    monkeypatch.setattr(api, 'engine', api.Engine())
+    api.cache.put(('v0', '/overview'), ('"etag"', b'{}'))
+
+    asyncio.run(api.engine.ready())
+    asyncio.run(api.engine.ready())
+    assert loads == ['v1'] and api.engine.version == 'v1'
+    assert api.cache.get(('v0', '/overview')) is None
+
+    versions.append('v2')
+    asyncio.run(api.engine.ready())
+    assert loads == ['v1', 'v2'] and api.engine.version == 'v2'
@@ -0,0 +1,21 @@
+from slcc import diagnostics
+
+
+def test_script_imports(tmp_path):
+    script = tmp_path / 'app.py'
+    script.write_text(
+        "import os\n"
+        "import plotly.express as px\n"
+        "from slcc import charts, sql\n"
+        "from slcc.memo import SectionMemo\n"
+        "from slcc.memo import MEMO_SIZE\n"
+        "\n"
+        "def later():\n"
+        "    import json\n"
+    )
+    assert diagnostics.script_imports(str(script)) == ['os', 'plotly.express', 'slcc.charts', 'slcc.sql', 'slcc.memo']
+
+
+def test_dashboard_imports_are_read_from_the_script():
+    modules = diagnostics.entry_point_imports('dashboard')
+    assert 'streamlit' in modules and 'slcc.memo' in modules
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from slcc.disclosure import protect
+
+
+def test_protect_covers_every_margin():
+    # Degree B's two small cells would each be the only one withheld from
+    # the graduated and not graduated totals
+    frame = pd.DataFrame({
+        'DEGREE_TYPE': ['A', 'A', 'B', 'B', 'C', 'C'],
+        'GRADUATED_IND': ['Y', 'N'] * 3,
+        'count': [50, 40, 3, 4, 20, 25],
+    })
+    frame['share'] = frame['count'] / frame['count'].sum()
+    protected = protect(frame, ['DEGREE_TYPE', 'GRADUATED_IND'], derived={'share': ['count']}, min_cell=10, scale=0)
+
+    withheld = protected['count'].isna()
+    assert frame.loc[withheld, 'DEGREE_TYPE'].tolist() == ['B', 'B', 'C', 'C']
+    assert protected['share'].isna().equals(withheld)
+    for key in ['DEGREE_TYPE', 'GRADUATED_IND']:
+        assert not withheld.groupby(frame[key]).sum().eq(1).any()
+    assert protected.loc[~withheld, 'count'].tolist() == [50, 40]
@@ -0,0 +1,35 @@
+import json
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from slcc.export import UNASSIGNED, export, partition
+from slcc.worker import PREPARED_NAMES
+
+
+def test_partition_matches_filtering(prepared):
+    data = prepared[PREPARED_NAMES.index('dashboard_data')]
+    groups = partition(data, 'DEPARTMENT')
+    assert sum(len(frame) for frame in groups.values()) == len(data)
+    for department, frame in groups.items():
+        if department != UNASSIGNED:
+            assert_frame_equal(frame, data[data['DEPARTMENT'] == department])
+
+
+def test_partition_merges_missing_into_unassigned():
+    data = pd.DataFrame({'DEPARTMENT': [UNASSIGNED, None, 'Biology', None], 'ROW': range(4)})
+    groups = partition(data, 'DEPARTMENT')
+    assert list(groups) == ['Biology', UNASSIGNED]
+    assert groups[UNASSIGNED]['ROW'].tolist() == [0, 1, 3]
+
+
+def test_export_writes_files_and_manifest(tmp_path, prepared):
+    data = prepared[PREPARED_NAMES.index('dashboard_data')]
+    manifest = export(str(tmp_path), by='COLLEGE', file_format='parquet', workers=1, data=data)
+    with open(tmp_path / 'manifest.json') as f:
+        assert json.load(f) == manifest
+    assert sum(entry['rows'] for entry in manifest['files']) == len(data)
+    for entry in manifest['files']:
+        frame = pd.read_parquet(tmp_path / entry['file'])
+        assert (frame['COLLEGE'] == entry['group']).all()
+        assert len(frame) == entry['rows']
@@ -0,0 +1,22 @@
+from slcc.memo import SectionMemo
+
+
+def test_hits_skip_compute_and_are_counted():
+    memo = SectionMemo()
+    calls = []
+    compute = lambda: calls.append(1) or len(calls)
+    assert memo.get('overview', ('v1', 'All'), compute) == 1
+    assert memo.get('overview', ('v1', 'All'), compute) == 1
+    assert memo.get('overview', ('v1', 'Spring 2021'), compute) == 2
+    stats = memo.stats().set_index('SECTION')
+    assert (stats.loc['overview', 'HITS'], stats.loc['overview', 'MISSES']) == (1, 2)
+
+
+def test_least_recently_used_is_evicted():
+    memo = SectionMemo(size=2)
+    memo.get('a', (), lambda: 'a')
+    memo.get('b', (), lambda: 'b')
+    memo.get('a', (), lambda: 'a again')
+    memo.get('c', (), lambda: 'c')
+    assert list(memo.entries) == [('a',), ('c',)]
+    assert memo.get('b', (), lambda: 'b again') == 'b again'
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from slcc.anomalies import ANOMALY_FLAGS
+from slcc.equity import EQUITY_DIMENSIONS
+from slcc.pipeline import build_aggregates, prepare, quality_summary, semester_labels, term_sort_key
+from slcc.queries import QUALITY_FLAGS
+from slcc.worker import PREPARED_NAMES
+
+FLAG_COLUMNS = [
+    *QUALITY_FLAGS, 'UNKNOWN_DEPARTMENT', 'UNKNOWN_COLLEGE', 'DEPARTMENT_IMPUTED', 'COLLEGE_IMPUTED',
+    *ANOMALY_FLAGS, 'HAS_ANOMALY',
+]
+
+
+def test_semester_labels():
+    dates = pd.Series(pd.to_datetime(['2021-05-06', '2020-08-14', '2020-12-18', '2021-01-15']))
+    assert semester_labels(dates).tolist() == ['Spring 2021', 'Summer 2020', 'Fall 2020', 'Other']
+
+
+def test_term_order():
+    terms = ['Other', 'Fall 2020', 'Spring 2021', 'Spring 2020', 'Summer 2020']
+    assert sorted(terms, key=term_sort_key) == ['Spring 2020', 'Summer 2020', 'Fall 2020', 'Spring 2021', 'Other']
+
+
+def test_merge(prepared, golden):
+    dashboard_data = prepared[PREPARED_NAMES.index('dashboard_data')]
+    golden('dashboard_data', dashboard_data)
+
+
+def test_flags(prepared, golden):
+    dashboard_data = prepared[PREPARED_NAMES.index('dashboard_data')]
+    golden('flags', dashboard_data[['STUDENT_ID', 'MAJOR', 'SEMESTER', *FLAG_COLUMNS]])
+
+
+@pytest.mark.parametrize('name', [
+    'grad_duplicates', 'grad_duplicate_student_ids', 'student_duplicates', 'student_duplicate_ids',
+    'unmatched_students', 'major_mapping',
+])
+def test_duplicates_and_matching(prepared, golden, name):
+    golden(name, prepared[PREPARED_NAMES.index(name)])
+
+
+def test_quality_summary(prepared, golden):
+    golden('quality_issues_summary', quality_summary(prepared))
+
+
+@pytest.mark.parametrize('name', ['term_summary', 'major_norms', 'transitions', 'id_candidates'])
+def test_aggregates(aggregates, golden, name):
+    golden(name, aggregates[name])
+
+
+@pytest.mark.parametrize('dimension', list(EQUITY_DIMENSIONS))
+def test_equity_sums(aggregates, golden, dimension):
+    for level, frame in aggregates['equity'][dimension].items():
+        golden(f'equity_{dimension.lower()}_{level}', frame)
+
+
+@pytest.mark.parametrize('extract', ['graduation', 'students'])
+def test_missing_profiles(aggregates, golden, extract):
+    golden(f'missing_{extract}', aggregates['profiles'][extract])
+
+
+def test_fully_matched_extract(students, graduation):
+    matched = graduation[graduation['STUDENT_ID'].isin(students['STUDENT_ID'])]
+    aggregates = build_aggregates(prepare(students, matched))
+    assert aggregates['id_candidates'].empty
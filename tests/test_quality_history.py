@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from slcc import quality_history
+from slcc.worker import PREPARED_NAMES
+
+
+def test_diff_runs(tmp_path, prepared):
+    history_dir = str(tmp_path)
+    students, dashboard_data = prepared[0], prepared[PREPARED_NAMES.index('dashboard_data')]
+    first = quality_history.record_run(dashboard_data, students, 'v1', history_dir, datetime(2021, 1, 1))
+    second = quality_history.record_run(dashboard_data.iloc[1:], students, 'v2', history_dir, datetime(2021, 1, 2))
+    diff = quality_history.diff_runs(first, second, history_dir).set_index('RULE')
+    assert (diff['NEWLY_FLAGGED'] == 0).all()
+    assert len(quality_history.load_history(history_dir)) == 2
+
+
+def test_version_recorded_once(tmp_path, prepared):
+    history_dir = str(tmp_path)
+    students, dashboard_data = prepared[0], prepared[PREPARED_NAMES.index('dashboard_data')]
+    first = quality_history.record_run(dashboard_data, students, 'v1', history_dir, datetime(2021, 1, 1))
+    again = quality_history.record_run(dashboard_data, students, 'v1', history_dir, datetime(2021, 1, 2))
+    history = quality_history.load_history(history_dir)
+
+    assert again == first == quality_history.recorded_run('v1', history_dir)
+    assert quality_history.recorded_run('v2', history_dir) is None
+    assert history['VERSION'].tolist() == ['v1']
+    assert list(history.columns) == [*quality_history.RUN_COLUMNS, *quality_history.QUALITY_RULES]
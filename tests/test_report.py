@@ -0,0 +1,31 @@
+import pandas as pd
+
+from slcc import charts, queries, report, sql
+from slcc.disclosure import MIN_CELL_ENV, SUPPRESSED_NOTE
+from slcc.worker import PREPARED_NAMES
+
+
+def test_ranked_chart_empty():
+    counts = pd.Series([], dtype='Int64', name='count').rename_axis('DEPARTMENT')
+    assert charts.ranked_chart(counts, 'Top 10 Departments', 'Department') is None
+
+
+def test_report_all_withheld(prepared, monkeypatch):
+    monkeypatch.setenv(MIN_CELL_ENV, '1000')
+    data = report.report_data(sql.connect_prepared(prepared))
+    assert data['departments'].empty and data['colleges'].empty
+    page = report.render(data)
+    assert page.count(SUPPRESSED_NOTE) >= 2
+    assert page.count('<script type="text/javascript">window.PlotlyConfig') <= 1
+
+
+def test_distribution_withheld(prepared, monkeypatch):
+    con = sql.connect_prepared(prepared)
+    monkeypatch.setenv(MIN_CELL_ENV, '0')
+    bins = queries.distribution(con, 'OVERALL_GPA')
+    assert len(bins) <= 30 and bins['count'].sum() == prepared[PREPARED_NAMES.index('dashboard_data')]['OVERALL_GPA'].notna().sum()
+    monkeypatch.setenv(MIN_CELL_ENV, '1000')
+    bins = queries.distribution(con, 'OVERALL_GPA')
+    assert bins['count'].isna().all()
+    assert charts.distribution_chart(bins, 'GPA Distribution', 'Overall GPA') is None
+    assert queries.overview(con)[['applications', 'avg_gpa']].isna().all(axis=None)
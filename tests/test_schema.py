@@ -0,0 +1,51 @@
+import os
+
+import pandas as pd
+import pytest
+
+from slcc.schema import SchemaError, read_graduations
+
+
+def test_graduations_parse(graduation, golden):
+    golden('graduations_parsed', graduation)
+
+
+def test_students_parse(students, golden):
+    golden('students_parsed', students)
+
+
+def test_two_digit_years_pivot_to_past(students):
+    assert students['FIRST_ENROLLED'].min() == pd.Timestamp('1968-08-29')
+    assert (students['FIRST_ENROLLED'] <= pd.Timestamp.now()).all()
+
+
+def test_graduation_dates_keep_their_century(tmp_path):
+    with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'Graduations.csv')) as f:
+        header, first, *rest = f.read().splitlines()
+    fields = first.split(',')
+    fields[header.split(',').index('"GRADUATION_DATE"')] = '"18-DEC-26  12:00 AM"'
+    path = tmp_path / 'Graduations.csv'
+    path.write_text('\n'.join([header, ','.join(fields), *rest]) + '\n')
+    assert read_graduations(str(path))['GRADUATION_DATE'].iloc[0] == pd.Timestamp('2026-12-18')
+
+
+def test_blank_cells_are_missing_and_unknown_is_kept(graduation):
+    assert graduation['STUDENT_ID'].isna().sum() == 1
+    assert graduation['HONORS'].isna().sum() == len(graduation) - 1
+    assert (graduation['DEPARTMENT'] == 'Unknown').sum() == 6
+
+
+def test_header_drift_raises(tmp_path):
+    path = tmp_path / 'Graduations.csv'
+    path.write_text('"STUDENT_ID","GRADUATION_DATE"\n1,06-MAY-21  12:00 AM\n')
+    with pytest.raises(SchemaError, match='GRADUATED_IND'):
+        read_graduations(str(path))
+
+
+def test_indicator_drift_raises(tmp_path):
+    with open(os.path.join(os.path.dirname(__file__), 'fixtures', 'Graduations.csv')) as f:
+        header, first, *rest = f.read().splitlines()
+    path = tmp_path / 'Graduations.csv'
+    path.write_text('\n'.join([header, first.replace('"N"', '"X"', 1), *rest]) + '\n')
+    with pytest.raises(SchemaError, match='GRADUATED_IND'):
+        read_graduations(str(path))
@@ -0,0 +1,77 @@
+"""Every storage engine must hand the pipeline the same extracts as the CSVs."""
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from slcc import coretable, partitions
+from slcc.coretable import CoreTable
+from slcc.pipeline import prepare, semester_labels
+from slcc.storage import SqlSource, write_sqlite
+from slcc.worker import PREPARED_NAMES
+
+
+def test_sqlite_source_matches_csv(tmp_path, students, graduation):
+    path = str(tmp_path / 'slcc.db')
+    write_sqlite(path, graduation, students)
+    source = SqlSource.sqlite(path)
+    sql_students, sql_graduation = source.read()
+    assert_frame_equal(sql_graduation, graduation)
+    assert_frame_equal(sql_students, students)
+
+
+def test_sqlite_source_filters_terms(tmp_path, students, graduation):
+    path = str(tmp_path / 'slcc.db')
+    write_sqlite(path, graduation, students)
+    _, sql_graduation = SqlSource.sqlite(path).read(['Spring 2021'])
+    expected = graduation[semester_labels(graduation['GRADUATION_DATE']) == 'Spring 2021'].reset_index(drop=True)
+    assert_frame_equal(sql_graduation, expected)
+
+
+def test_parquet_store_matches_csv(tmp_path, students, graduation):
+    store = str(tmp_path / 'term_store')
+    partitions.ingest(graduation, students, store)
+    stored_graduation, stored_students = partitions.read_terms(None, store)
+    # Parquet has no second resolution; timestamps come back as milliseconds
+    stored_graduation = stored_graduation.astype(graduation.dtypes.to_dict())
+    stored_students = stored_students.astype(students.dtypes.to_dict())
+    key = ['STUDENT_ID', 'GRADUATION_DATE', 'GRAD_APPL_DATE', 'MAJOR', 'TOTAL_CREDITS']
+    assert_frame_equal(
+        stored_graduation.sort_values(key, ignore_index=True),
+        graduation.sort_values(key, ignore_index=True),
+    )
+    # The store keeps one copy of a student repeated across extracts
+    matched = students[students['STUDENT_ID'].isin(graduation['STUDENT_ID'])].drop_duplicates()
+    assert_frame_equal(
+        stored_students.sort_values(list(students.columns), ignore_index=True),
+        matched.sort_values(list(students.columns), ignore_index=True),
+    )
+
+
+def test_parquet_store_keeps_latest_load(tmp_path, students, graduation):
+    store = str(tmp_path / 'term_store')
+    partitions.ingest(graduation, students, store)
+    partitions.ingest(graduation, students, store)
+    later = students.assign(TRANSFER_CREDITS=students['TRANSFER_CREDITS'].fillna(0) + 1)
+    partitions.ingest(graduation.iloc[:0], later, store)
+    stored_graduation, stored_students = partitions.read_terms(None, store)
+    assert len(stored_graduation) == len(graduation)
+    matched = later[later['STUDENT_ID'].isin(graduation['STUDENT_ID'])].drop_duplicates()
+    assert len(stored_students) == len(matched)
+    assert (stored_students['TRANSFER_CREDITS'] >= 1).all()
+    stored = prepare(stored_students, stored_graduation)[PREPARED_NAMES.index('dashboard_data')]
+    expected = prepare(later.drop_duplicates(), graduation)[PREPARED_NAMES.index('dashboard_data')]
+    assert len(stored) == len(expected)
+
+
+def test_core_table_round_trip(tmp_path, prepared):
+    dashboard_data = prepared[PREPARED_NAMES.index('dashboard_data')]
+    assert_frame_equal(CoreTable.from_frame(dashboard_data).view().to_pandas(), dashboard_data)
+    coretable.write(dashboard_data, str(tmp_path / 'core'))
+    table = CoreTable.open(str(tmp_path / 'core'))
+    assert_frame_equal(table.view().to_pandas(), dashboard_data)
+    spring = dashboard_data[dashboard_data['SEMESTER'] == 'Spring 2021']
+    selected = table.select('SEMESTER', 'Spring 2021')
+    assert_frame_equal(selected.to_pandas(), spring)
+    counts = selected.counts('MAJOR')
+    assert_series_equal(counts[counts > 0].sort_index(), spring['MAJOR'].value_counts().sort_index(), check_names=False)
+    # Nullable booleans with no gaps are stored as bits too, and keep their dtype
+    flags = dashboard_data[['ILLOGICAL_DATES']].astype('boolean')
+    assert_frame_equal(CoreTable.from_frame(flags).view().to_pandas(), flags)
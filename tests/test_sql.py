@@ -0,0 +1,19 @@
+import duckdb
+import pytest
+
+from slcc import sql
+
+
+def test_readonly_rejects_writes(prepared):
+    con = sql.connect_prepared(prepared)
+    assert sql.run_readonly(con, "SELECT count(*) AS n FROM dashboard_data")['n'].iloc[0] == len(prepared[2])
+    with pytest.raises(sql.QueryError):
+        sql.run_readonly(con, "DROP TABLE students")
+
+
+def test_no_file_access(prepared):
+    con = sql.connect_prepared(prepared)
+    with pytest.raises(duckdb.PermissionException):
+        sql.run_readonly(con, "SELECT * FROM read_csv('/etc/passwd', header=false, sep=':')")
+    with pytest.raises(Exception):
+        con.execute("SET enable_external_access = true")